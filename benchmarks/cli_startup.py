@@ -0,0 +1,92 @@
+"""
+Time repeated CLI invocations and fail if they get slower than a budget.
+
+    uv run python benchmarks/cli_startup.py
+    uv run python benchmarks/cli_startup.py --runs 20 --budget 0.5
+
+Each command runs in a fresh interpreter, like in scripts calling the CLI.
+`list-collections` talks to an unreachable Qdrant, so the number covers
+startup and the failed health probe, not the server.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+COMMANDS = {
+    "help": ["--help"],
+    "list-collections": ["list-collections"],
+}
+
+
+def time_command(args: list[str], runs: int, env: dict) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "mnemolet.cli.main", *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(runs: int, qdrant_port: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "QDRANT_HOST": "127.0.0.1",
+            "QDRANT_PORT": str(qdrant_port),
+            "HEALTH_TIMEOUT": "0.2",
+            "HEALTH_CACHE_FILE": str(Path(tmp) / "health.json"),
+        }
+        # the first run warms the filesystem and bytecode caches
+        time_command(["--help"], 1, env)
+        results = {}
+        for name, args in COMMANDS.items():
+            timings = time_command(args, runs, env)
+            r = results[name] = {
+                "median_s": round(statistics.median(timings), 4),
+                "min_s": round(min(timings), 4),
+                "max_s": round(max(timings), 4),
+            }
+            print(
+                f"{name:18} median {r['median_s']:.3f}s "
+                f"(min {r['min_s']:.3f}s, max {r['max_s']:.3f}s)",
+                file=sys.stderr,
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--budget", type=float, default=1.0, help="Max median seconds per command."
+    )
+    parser.add_argument(
+        "--qdrant-port", type=int, default=9, help="Unreachable on purpose."
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON.")
+    args = parser.parse_args()
+
+    results = run(args.runs, args.qdrant_port)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    slow = [n for n, r in results.items() if r["median_s"] > args.budget]
+    if slow:
+        print(f"Over budget ({args.budget}s): {', '.join(slow)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
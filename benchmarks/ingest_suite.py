@@ -0,0 +1,92 @@
+"""
+Run the ingestion benchmark over a matrix of corpus profiles.
+
+    uv run python benchmarks/ingest_suite.py --output results.json
+    uv run python benchmarks/ingest_suite.py --baseline results.json
+
+With --baseline the run fails if throughput of any profile dropped by more
+than --max-regression compared to the baseline report.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from mnemolet.bench.corpus import generate_corpus
+from mnemolet.bench.ingest import run_ingest_benchmark
+
+PROFILES = {
+    "small-text": {"files": 500, "min_kb": 1, "max_kb": 8, "formats": ("txt", "md")},
+    "mixed": {"files": 100, "min_kb": 1, "max_kb": 512},
+    "large-docs": {
+        "files": 20,
+        "min_kb": 512,
+        "max_kb": 4096,
+        "formats": ("docx", "odt", "pdf"),
+    },
+}
+
+METRICS = ("files_per_sec", "chunks_per_sec", "mb_per_sec")
+
+
+def run(profiles: list[str], seed: int, real_embedder: bool) -> dict:
+    results = {}
+    for name in profiles:
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = generate_corpus(Path(tmp), seed=seed, **PROFILES[name])
+            report = run_ingest_benchmark(Path(tmp), real_embedder=real_embedder)
+        report["corpus"] = manifest
+        results[name] = report
+        r = report["results"]
+        print(
+            f"{name:12} {r['files_per_sec']:>9.1f} files/s "
+            f"{r['chunks_per_sec']:>9.1f} chunks/s {r['mb_per_sec']:>7.2f} MB/s "
+            f"peak {r['peak_rss_mb']:.0f} MB",
+            file=sys.stderr,
+        )
+    return results
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    failures = []
+    for name, report in results.items():
+        if name not in baseline:
+            continue
+        for metric in METRICS:
+            old = baseline[name]["results"][metric]
+            new = report["results"][metric]
+            if old and new < old * (1 - max_regression):
+                failures.append(f"{name}.{metric}: {old} -> {new}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", default=",".join(PROFILES))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--real-embedder", action="store_true")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run(args.profiles.split(","), args.seed, args.real_embedder)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline:
+        failures = compare(
+            results, json.loads(args.baseline.read_text()), args.max_regression
+        )
+        for f in failures:
+            print(f"REGRESSION {f}", file=sys.stderr)
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
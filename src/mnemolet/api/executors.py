@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from mnemolet.config import API_ADMIN_WORKERS, API_QUERY_WORKERS, LIMIT_QUEUE
+from mnemolet.core.utils.limits import QueueFull
+
+logger = logging.getLogger(__name__)
+
+# dedicated pools, so slow admin calls never starve search/answer
+EXECUTOR_SIZES = {
+    "query": API_QUERY_WORKERS,
+    "admin": API_ADMIN_WORKERS,
+}
+
+_EXECUTORS: dict[str, ThreadPoolExecutor] = {}
+_PENDING: dict[str, int] = {name: 0 for name in EXECUTOR_SIZES}
+_lock = threading.Lock()
+
+_DONE = object()
+
+
+def get_executor(name: str) -> ThreadPoolExecutor:
+    """
+    Return executor for the given pool, created on first use.
+    """
+    with _lock:
+        if name not in _EXECUTORS:
+            _EXECUTORS[name] = ThreadPoolExecutor(
+                max_workers=EXECUTOR_SIZES[name], thread_name_prefix=f"api-{name}"
+            )
+        return _EXECUTORS[name]
+
+
+def _admit(name: str):
+    """
+    Reject work if the pool already has a full queue.
+    """
+    with _lock:
+        if _PENDING[name] >= EXECUTOR_SIZES[name] + LIMIT_QUEUE:
+            raise QueueFull(name, f"{name} executor queue is full")
+        _PENDING[name] += 1
+
+
+def _release(name: str):
+    with _lock:
+        _PENDING[name] -= 1
+
+
+async def run_blocking(name: str, fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run blocking fn in the given pool without blocking the event loop.
+    """
+    _admit(name)
+    try:
+        loop = asyncio.get_running_loop()
+        # keep contextvars (e.g. request ids) visible inside the worker thread
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            get_executor(name), partial(ctx.run, fn, *args, **kwargs)
+        )
+    finally:
+        _release(name)
+
+
+async def iterate_blocking(name: str, iterator: Iterator) -> AsyncIterator:
+    """
+    Consume blocking iterator in the given pool, item by item.
+    """
+    _admit(name)
+    # one context for every step, so spans/contextvars survive between items
+    ctx = contextvars.copy_context()
+    try:
+        loop = asyncio.get_running_loop()
+        executor = get_executor(name)
+        while True:
+            item = await loop.run_in_executor(
+                executor, partial(ctx.run, next, iterator, _DONE)
+            )
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        _release(name)
+        # client went away early: let the generator release its resources
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            try:
+                ctx.run(close)
+            except (RuntimeError, ValueError):
+                # still running in a worker thread, it finishes on its own
+                pass
+
+
+def executor_stats() -> dict[str, dict]:
+    """
+    Return workers and pending calls of every pool.
+    """
+    with _lock:
+        return {
+            name: {"workers": size, "pending": _PENDING[name]}
+            for name, size in EXECUTOR_SIZES.items()
+        }
@@ -0,0 +1,68 @@
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from mnemolet.core.utils.limits import limiter_stats
+from mnemolet.core.utils.metrics import (
+    HTTP_DURATION,
+    HTTP_IN_FLIGHT,
+    HTTP_REQUESTS,
+    RESOURCE_IN_FLIGHT,
+    RESOURCE_QUEUED,
+    get_registry,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Expose metrics in Prometheus text format.
+    """
+    for name, stats in limiter_stats().items():
+        RESOURCE_IN_FLIGHT.set(stats["in_flight"], resource=name)
+        RESOURCE_QUEUED.set(stats["queued"], resource=name)
+
+    return PlainTextResponse(
+        get_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+
+class MetricsMiddleware:
+    """
+    Count requests and time them until the last byte is sent.
+    - plain ASGI instead of BaseHTTPMiddleware, so streamed responses
+      (/answer, job events) are neither buffered nor cut short.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            # endpoint name instead of raw path keeps label cardinality bounded
+            endpoint = scope.get("endpoint")
+            handler = getattr(endpoint, "__name__", "unmatched")
+            HTTP_REQUESTS.inc(handler=handler, method=scope["method"], status=status)
+            HTTP_DURATION.observe(time.perf_counter() - start, handler=handler)
@@ -1,6 +1,12 @@
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Any
+import os
+import tempfile
+import threading
+from collections.abc import AsyncIterator
+from pathlib import Path
 
 from fastapi import (
     APIRouter,
@@ -8,10 +14,13 @@ from fastapi import (
     File,
     HTTPException,
     Query,
+    Request,
+    Response,
     UploadFile,
 )
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from mnemolet.api.executors import executor_stats, iterate_blocking, run_blocking
 from mnemolet.config import (
     BATCH_SIZE,
     EMBED_MODEL,
@@ -24,62 +33,242 @@ from mnemolet.config import (
     TOP_K,
     UPLOAD_DIR,
 )
+from mnemolet.core.utils.limits import (
+    QueueFull,
+    ResourceBusy,
+    get_limiter,
+    limiter_stats,
+)
 from mnemolet.core.utils.qdrant import QdrantManager
+from mnemolet.core.utils.tracing import current_trace_id
+from mnemolet.core.utils.utils import hash_file
 
 logger = logging.getLogger(__name__)
 
+# size of the blocks read from an upload and written to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# how often ingestion job progress is checked for the events stream (seconds)
+JOB_PROGRESS_INTERVAL = 0.5
+
+# serializes the name check and the move of finished uploads
+_uploads_lock = threading.Lock()
+
 app = FastAPI(title="MnemoLet API", version="0.0.1")
 api_router = APIRouter()
 
 
-@api_router.post("/ingest")
+@api_router.post("/ingest", status_code=202)
 async def ingest_files(
+    response: Response,
     files: list[UploadFile] = File(...),
     force: bool = Query(
-        False, description="Recreate Qdrant collection before ingestion"
+        False,
+        description="Recreate Qdrant collection and re-ingest every upload",
     ),
+    wait: bool = Query(False, description="Wait until ingestion is finished"),
 ):
     """
     Ingest multiple files into Qdrant.
+    Ingestion runs as a background job, use /ingest/jobs/{job_id} to follow it.
     """
-    saved_files, result = await do_ingestion(files, force)
-
+    saved_files, job = await do_ingestion(files, force)
+
+    if not wait:
+        return {
+            "status": "accepted",
+            "job_id": job.id,
+            "uploaded": saved_files,
+            "force": force,
+            "message": "Ingestion started",
+        }
+
+    job = await wait_for_job(job.id)
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=f"Ingestion failed: {job.error}")
+
+    response.status_code = 200
     return {
         "status": "ok",
+        "job_id": job.id,
         "uploaded": saved_files,
         "force": force,
         "message": "Ingestion complete",
         "ingestion": {
-            "files": result["files"],
-            "chunks": result["chunks"],
-            "time": result["time"],
+            "files": job.result["files"],
+            "chunks": job.result["chunks"],
+            "time": job.result["time"],
         },
     }
 
 
+async def save_upload(f: UploadFile, upload_dir: Path) -> tuple[Path, str]:
+    """
+    Stream an uploaded file to disk in chunks, hashing it while writing.
+    - the upload goes to a temporary file in upload_dir and is moved in
+      place only once complete, a failed upload leaves nothing behind.
+    - an existing upload with the same name but other content is kept (a
+      queued job may still read it), the new one gets a hash suffix.
+
+    Returns the path and SHA256 hash of the file content.
+    Opening, hashing and writing run in the admin pool, off the event loop.
+    """
+    name = upload_name(f.filename)
+    hasher = hashlib.sha256()
+    fd, tmp = await run_blocking(
+        "admin", tempfile.mkstemp, dir=upload_dir, prefix=".", suffix=".part"
+    )
+    try:
+        out = os.fdopen(fd, "wb")
+        try:
+            while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+                await run_blocking("admin", _write_block, out, hasher, chunk)
+        finally:
+            await run_blocking("admin", out.close)
+        digest = hasher.hexdigest()
+        dest = await run_blocking(
+            "admin", _place_upload, Path(tmp), upload_dir / name, digest
+        )
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return dest, digest
+
+
+def upload_name(filename: str | None) -> str:
+    """
+    Return the file name of an upload, without any directory part.
+    Raise HTTPException (400) if nothing usable is left.
+    """
+    name = Path(filename or "").name
+    if name in ("", ".", "..") or "\0" in name:
+        raise HTTPException(status_code=400, detail=f"Invalid file name: {filename!r}")
+    return name
+
+
+def _write_block(out, hasher, chunk: bytes):
+    hasher.update(chunk)
+    out.write(chunk)
+
+
+def _place_upload(tmp: Path, dest: Path, digest: str) -> Path:
+    """
+    Helper fn to move a complete upload to dest, or next to it if dest
+    holds other content.
+    """
+    with _uploads_lock:
+        if dest.exists() and hash_file(dest) != digest:
+            dest = dest.with_name(f"{dest.stem}-{digest[:12]}{dest.suffix}")
+        os.replace(tmp, dest)
+    return dest
+
+
 async def do_ingestion(files, force: bool = False):
-    from mnemolet.core.ingestion.ingest import ingest
+    """
+    Save uploaded files and submit a background ingestion job for them.
+    """
+    from mnemolet.core.ingestion.jobs import get_job_manager
+
+    # reject the request before anything is written
+    for f in files:
+        upload_name(f.filename)
 
     saved_files = []
+    hashes = {}
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
     for f in files:
-        dest = UPLOAD_DIR / f.filename
-
-        content = await f.read()
-        dest.write_bytes(content)
+        # keep only the file name, never write outside UPLOAD_DIR
+        dest, file_hash = await save_upload(f, UPLOAD_DIR)
+        hashes[str(dest)] = file_hash
 
         saved_files.append(str(dest))
 
     batch_size = BATCH_SIZE
-    result = ingest(
-        UPLOAD_DIR, batch_size, QDRANT_URL, QDRANT_COLLECTION, SIZE_CHARS, force=force
+    # ingest only the files from this upload, not the whole UPLOAD_DIR;
+    # force recreates the collection, so then every upload is ingested again
+    job = get_job_manager().submit(
+        UPLOAD_DIR,
+        batch_size,
+        QDRANT_URL,
+        QDRANT_COLLECTION,
+        SIZE_CHARS,
+        force=force,
+        files=None if force else [Path(p) for p in saved_files],
+        hashes=hashes,
     )
 
-    return saved_files, result
+    return saved_files, job
+
+
+async def wait_for_job(job_id: str):
+    """
+    Wait for ingestion job without blocking the event loop.
+    """
+    from mnemolet.core.ingestion.jobs import get_job_manager
+
+    manager = get_job_manager()
+    future = manager.future(job_id)
+    if future is not None:
+        await asyncio.wrap_future(future)
+    return manager.get(job_id)
+
+
+@api_router.get("/ingest/jobs")
+def list_ingest_jobs():
+    """
+    List known ingestion jobs.
+    """
+    from mnemolet.core.ingestion.jobs import get_job_manager
+
+    return {"jobs": [job.to_dict() for job in get_job_manager().list_jobs()]}
+
+
+@api_router.get("/ingest/jobs/{job_id}")
+def ingest_job_status(job_id: str):
+    """
+    Return status and progress of ingestion job.
+    """
+    return get_job(job_id).to_dict()
+
+
+@api_router.get("/ingest/jobs/{job_id}/events")
+def ingest_job_events(job_id: str):
+    """
+    Stream ingestion job progress as NDJSON until the job is finished.
+    """
+    return StreamingResponse(
+        stream_job_progress(get_job(job_id)),
+        media_type="application/x-ndjson",
+    )
+
+
+def get_job(job_id: str):
+    from mnemolet.core.ingestion.jobs import get_job_manager
+
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+async def stream_job_progress(job, interval: float = JOB_PROGRESS_INTERVAL):
+    """
+    Yield a job snapshot every time it changes.
+    """
+    version = -1
+    while True:
+        # read before snapshot, so the last snapshot is always the final one
+        finished = job.finished
+        if job.version != version:
+            version = job.version
+            yield (json.dumps(job.to_dict()) + "\n").encode("utf-8")
+        if finished:
+            break
+        await asyncio.sleep(interval)
 
 
 @api_router.get("/search")
-def search(
+async def search(
     query: str,
     qdrant_url: str = QDRANT_URL,
     collection_name: str = QDRANT_COLLECTION,
@@ -89,7 +278,9 @@ def search(
     """
     Search documents in Qdrant.
     """
-    return do_search(query, qdrant_url, collection_name, embed_model, top_k)
+    return await run_blocking(
+        "query", do_search, query, qdrant_url, collection_name, embed_model, top_k
+    )
 
 
 def do_search(
@@ -110,6 +301,9 @@ def do_search(
             top_k=top_k,
         )
         return {"results": results}
+    except ResourceBusy:
+        # handled by resource_busy_handler (429/503)
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {e}")
 
@@ -124,6 +318,9 @@ def answer(
     ollama_model: str = OLLAMA_MODEL,
     top_k: int = TOP_K,
 ):
+    # reject early, before the response is started
+    get_limiter("ollama").check_capacity()
+
     return StreamingResponse(
         get_answer(
             query,
@@ -138,7 +335,7 @@ def answer(
     )
 
 
-def get_answer(
+async def get_answer(
     query: str,
     qdrant_url: str = QDRANT_URL,
     collection_name: str = QDRANT_COLLECTION,
@@ -146,7 +343,7 @@ def get_answer(
     ollama_url: str = OLLAMA_URL,
     ollama_model: str = OLLAMA_MODEL,
     top_k: int = TOP_K,
-) -> dict[str, Any]:
+) -> AsyncIterator[bytes]:
     """
     Generate answer from local LLM.
     """
@@ -164,10 +361,20 @@ def get_answer(
         )
         generator = get_llm_generator(OLLAMA_URL, ollama_model)
 
-        for chunk, sources in generate_answer(
-            retriever=retriever,
-            generator=generator,
-            query=query,
+        # lets clients correlate a slow answer with its exported spans
+        yield (
+            json.dumps({"type": "trace", "data": {"request_id": current_trace_id()}})
+            + "\n"
+        ).encode("utf-8")
+
+        # retrieval and generation block, run them in the query pool
+        async for chunk, sources in iterate_blocking(
+            "query",
+            generate_answer(
+                retriever=retriever,
+                generator=generator,
+                query=query,
+            ),
         ):
             if chunk:
                 # answer_chunks.append(answer)
@@ -181,12 +388,12 @@ def get_answer(
                 )
 
     except Exception as e:
-        yield json.dumps({"type": "error", "data": str(e)}) + "\n"
+        yield (json.dumps({"type": "error", "data": str(e)}) + "\n").encode("utf-8")
 
 
 @api_router.get("/stats")
-def stats(collection_name: str):
-    return get_stats(collection_name)
+async def stats(collection_name: str):
+    return await run_blocking("admin", get_stats, collection_name)
 
 
 def get_stats(collection_name: str):
@@ -201,9 +408,26 @@ def get_stats(collection_name: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch stats: {e}")
 
 
+@api_router.get("/runs")
+async def runs(
+    limit: int = Query(20, ge=1, le=1000),
+    collection: str | None = Query(None, description="Only runs of this collection"),
+):
+    """
+    Return recorded ingestion runs (newest first) with their throughput.
+    """
+    return await run_blocking("admin", get_runs, limit, collection)
+
+
+def get_runs(limit: int, collection: str | None = None):
+    from mnemolet.core.storage.db_tracker import DBTracker
+
+    return {"runs": DBTracker().list_runs(limit, collection)}
+
+
 @api_router.get("/list-collections")
-def list_collections():
-    return get_collections()
+async def list_collections():
+    return await run_blocking("admin", get_collections)
 
 
 def get_collections():
@@ -225,7 +449,42 @@ def get_collections():
 
 
 @api_router.get("/dashboard")
-def dashboard():
-    from mnemolet.core.health.checks import get_status
+async def dashboard():
+    """
+    Return cached health status (refreshed every `[health] refresh_interval`).
+    """
+    from mnemolet.core.health.checks import get_health_monitor
+
+    return await run_blocking("admin", get_health_monitor().get)
+
 
-    return get_status(QDRANT_URL, OLLAMA_URL)
+@api_router.get("/queues")
+def queues():
+    """
+    Return queue depths of API executors, resource limiters and ingest jobs.
+    """
+    from mnemolet.core.ingestion.jobs import get_job_manager
+
+    jobs = get_job_manager().list_jobs()
+    return {
+        "executors": executor_stats(),
+        "limits": limiter_stats(),
+        "ingest_jobs": {
+            "max_jobs": get_job_manager().max_jobs,
+            "queued": sum(1 for j in jobs if j.status == "queued"),
+            "running": sum(1 for j in jobs if j.status == "running"),
+        },
+    }
+
+
+async def resource_busy_handler(request: Request, exc: ResourceBusy) -> JSONResponse:
+    """
+    Map overloaded resources to 429 (queue full) or 503 (timed out waiting).
+    """
+    status_code = 429 if isinstance(exc, QueueFull) else 503
+    logger.warning(f"Rejected {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": str(exc), "resource": exc.resource},
+        headers={"Retry-After": "1"},
+    )
@@ -0,0 +1,43 @@
+import re
+
+from mnemolet.core.utils.tracing import start_trace
+
+REQUEST_ID_HEADER = "x-request-id"
+# accept client ids only if they are short and harmless in logs/headers
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class TracingMiddleware:
+    """
+    Give every request an id, collect its spans and export them when the
+    response (including a streamed body) is finished.
+    - the id comes from the X-Request-ID header or is generated, and is
+      returned in the X-Request-ID response header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope["headers"]:
+            if key.decode("latin-1").lower() == REQUEST_ID_HEADER:
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+
+        with start_trace(request_id, name=f"{scope['method']} {scope['path']}") as t:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((REQUEST_ID_HEADER.encode(), t.trace_id.encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
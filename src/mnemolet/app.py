@@ -1,9 +1,36 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from mnemolet.api.routes import api_router
+from mnemolet.api.metrics import MetricsMiddleware, metrics_router
+from mnemolet.api.routes import api_router, resource_busy_handler
+from mnemolet.api.tracing import TracingMiddleware
+from mnemolet.core.utils.limits import ResourceBusy
 from mnemolet.ui.routes import ui_router
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from mnemolet.core.health.checks import get_health_monitor
+
+    # keep health status warm, so the dashboard never waits on probes
+    monitor = get_health_monitor()
+    monitor.start()
+    yield
+    monitor.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+# overloaded resources -> 429/503
+app.add_exception_handler(ResourceBusy, resource_busy_handler)
+
+# request counts, latency and in-flight requests for /metrics
+app.add_middleware(MetricsMiddleware)
+app.include_router(metrics_router)
+
+# request id in X-Request-ID, spans exported to the trace file
+app.add_middleware(TracingMiddleware)
 
 # API
 app.include_router(api_router, prefix="/api")
@@ -0,0 +1,211 @@
+import json
+import logging
+import math
+import random
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("txt", "md", "json", "csv", "docx", "odt", "pdf")
+
+_SYLLABLES = (
+    "ka", "lo", "mi", "ne", "ra", "to", "su", "vi", "de", "mo",
+    "an", "el", "is", "or", "un", "ba", "ce", "fi", "gu", "ha",
+)  # fmt: skip
+
+
+class TextGenerator:
+    """
+    Reproducible pseudo-text built from a fixed seed.
+    """
+
+    def __init__(self, rng: random.Random, vocab_size: int = 2000):
+        self.rng = rng
+        self.vocab = [
+            "".join(rng.choices(_SYLLABLES, k=rng.randint(1, 4)))
+            for _ in range(vocab_size)
+        ]
+
+    def sentence(self) -> str:
+        words = self.rng.choices(self.vocab, k=self.rng.randint(6, 20))
+        return " ".join(words).capitalize() + "."
+
+    def paragraph(self) -> str:
+        return " ".join(self.sentence() for _ in range(self.rng.randint(3, 8)))
+
+    def paragraphs(self, size: int) -> list[str]:
+        """
+        Return paragraphs with roughly `size` characters in total.
+        """
+        result, total = [], 0
+        while total < size:
+            p = self.paragraph()
+            result.append(p)
+            total += len(p) + 1
+        return result
+
+
+def generate_corpus(
+    dest: Path,
+    files: int = 50,
+    seed: int = 42,
+    formats: tuple[str, ...] = FORMATS,
+    min_kb: int = 1,
+    max_kb: int = 256,
+) -> dict:
+    """
+    Write a synthetic corpus into `dest` and return its manifest.
+    - same arguments always produce the same files.
+    - sizes are log-uniform between `min_kb` and `max_kb`, so the corpus
+      mixes many small files with a few large ones.
+    """
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unsupported formats: {', '.join(sorted(unknown))}")
+
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    text = TextGenerator(rng)
+
+    manifest = {
+        "seed": seed,
+        "files": files,
+        "min_kb": min_kb,
+        "max_kb": max_kb,
+        "bytes": 0,
+        "formats": {},
+    }
+
+    for i in range(files):
+        fmt = formats[i % len(formats)]
+        size = int(1024 * math.exp(rng.uniform(math.log(min_kb), math.log(max_kb))))
+        # spread files over a few subdirectories, like a real tree
+        path = dest / f"dir{i % 5}" / f"doc_{i:05d}.{fmt}"
+        path.parent.mkdir(exist_ok=True)
+        _WRITERS[fmt](path, text.paragraphs(size), rng)
+
+        manifest["bytes"] += path.stat().st_size
+        manifest["formats"][fmt] = manifest["formats"].get(fmt, 0) + 1
+
+    logger.info(
+        f"Generated {files} files ({manifest['bytes'] / 1024**2:.1f} MB) in {dest}"
+    )
+    return manifest
+
+
+def _write_txt(path: Path, paragraphs: list[str], rng: random.Random):
+    path.write_text("\n\n".join(paragraphs), encoding="utf-8")
+
+
+def _write_md(path: Path, paragraphs: list[str], rng: random.Random):
+    lines = []
+    for i, p in enumerate(paragraphs):
+        if i % 5 == 0:
+            lines.append(f"## Section {i // 5 + 1}\n")
+        lines.append(p + "\n")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _write_json(path: Path, paragraphs: list[str], rng: random.Random):
+    records = [
+        {"id": i, "score": round(rng.random(), 4), "text": p}
+        for i, p in enumerate(paragraphs)
+    ]
+    path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+
+
+def _write_csv(path: Path, paragraphs: list[str], rng: random.Random):
+    import csv
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "score", "text"])
+        for i, p in enumerate(paragraphs):
+            writer.writerow([i, round(rng.random(), 4), p])
+
+
+def _write_docx(path: Path, paragraphs: list[str], rng: random.Random):
+    from docx import Document
+
+    doc = Document()
+    for i, p in enumerate(paragraphs):
+        if i % 5 == 0:
+            doc.add_heading(f"Section {i // 5 + 1}", level=2)
+        doc.add_paragraph(p)
+    doc.save(path)
+
+
+def _write_odt(path: Path, paragraphs: list[str], rng: random.Random):
+    from odfdo import Document, Header, Paragraph
+
+    doc = Document("text")
+    for i, p in enumerate(paragraphs):
+        if i % 5 == 0:
+            doc.body.append(Header(2, f"Section {i // 5 + 1}"))
+        doc.body.append(Paragraph(p))
+    doc.save(path)
+
+
+def _write_pdf(path: Path, paragraphs: list[str], rng: random.Random):
+    """
+    Minimal PDF writer: Helvetica text, 60 lines per page.
+    """
+    import textwrap
+
+    lines = []
+    for p in paragraphs:
+        lines.extend(textwrap.wrap(p, 90) + [""])
+    pages = [lines[i : i + 60] for i in range(0, len(lines), 60)] or [[""]]
+
+    def escape(s: str) -> str:
+        return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    # 1 catalog, 2 pages, 3 font, then (page, content) per page
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            f"<< /Type /Pages /Count {len(pages)} /Kids "
+            f"[{' '.join(f'{pid} 0 R' for pid in page_ids)}] >>"
+        ).encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for pid, page in zip(page_ids, pages):
+        stream = "BT /F1 10 Tf 12 TL 40 800 Td\n"
+        stream += "".join(f"({escape(line)}) Tj T*\n" for line in page) + "ET"
+        data = stream.encode("latin-1", errors="replace")
+        objects.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                f"/Resources << /Font << /F1 3 0 R >> >> /Contents {pid + 1} 0 R >>"
+            ).encode()
+        )
+        objects.append(
+            f"<< /Length {len(data)} >>\nstream\n".encode() + data + b"\nendstream"
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for n, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{n} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{o:010d} 00000 n \n".encode() for o in offsets)
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    path.write_bytes(bytes(out))
+
+
+_WRITERS = {
+    "txt": _write_txt,
+    "md": _write_md,
+    "json": _write_json,
+    "csv": _write_csv,
+    "docx": _write_docx,
+    "odt": _write_odt,
+    "pdf": _write_pdf,
+}
@@ -0,0 +1,85 @@
+import logging
+import tempfile
+from pathlib import Path
+
+from mnemolet.bench.utils import PeakRSS, StubEmbedder, environment, timer
+from mnemolet.config import ADAPTIVE_BATCH, BATCH_SIZE, SIZE_CHARS
+
+logger = logging.getLogger(__name__)
+
+BENCH_COLLECTION = "mnemolet_bench"
+
+
+def run_ingest_benchmark(
+    corpus: Path,
+    qdrant_url: str = ":memory:",
+    collection_name: str = BENCH_COLLECTION,
+    batch_size: int = BATCH_SIZE,
+    size_chars: int = SIZE_CHARS,
+    real_embedder: bool = False,
+    dim: int = 384,
+    adaptive: bool = ADAPTIVE_BATCH,
+) -> dict:
+    """
+    Ingest `corpus` from scratch and measure throughput and memory.
+    - uses a throwaway SQLite tracker and (by default) in-memory Qdrant,
+      so the user's data is never touched.
+    - the stub embedder isolates extraction/chunking/indexing cost;
+      `real_embedder` measures the full pipeline with the local model.
+    - near-duplicate filtering is off and bytes are those actually extracted
+      (files skipped by the scanner do not count), so runs stay comparable.
+    """
+    from mnemolet.core.ingestion.ingest import ingest
+    from mnemolet.core.storage.db_tracker import DBTracker
+
+    corpus = Path(corpus)
+    embed_fn = None if real_embedder else StubEmbedder(dim)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = DBTracker(Path(tmp) / "bench_tracker.sqlite")
+        with PeakRSS() as rss:
+            start = timer()
+            result = ingest(
+                corpus,
+                batch_size,
+                qdrant_url,
+                collection_name,
+                size_chars,
+                force=True,
+                tracker=tracker,
+                embed_fn=embed_fn,
+                adaptive=adaptive,
+                dedup_mode="off",
+            )
+            elapsed = timer() - start
+
+    total_bytes = result["stages"].get("extract", {}).get("bytes", 0)
+
+    elapsed = max(elapsed, 1e-9)
+    return {
+        "benchmark": "ingest",
+        "environment": environment(),
+        "config": {
+            "corpus": str(corpus),
+            "qdrant_url": qdrant_url,
+            "batch_size": batch_size,
+            "adaptive_batch": adaptive,
+            "size_chars": size_chars,
+            "dedup": "off",
+            "embedder": "local" if real_embedder else f"stub-{dim}",
+        },
+        "results": {
+            "files": result["files"],
+            "chunks": result["chunks"],
+            "bytes": total_bytes,
+            "seconds": round(elapsed, 4),
+            "files_per_sec": round(result["files"] / elapsed, 2),
+            "chunks_per_sec": round(result["chunks"] / elapsed, 2),
+            "mb_per_sec": round(total_bytes / 1024**2 / elapsed, 3),
+            "start_rss_mb": round(rss.start_mb, 1),
+            "peak_rss_mb": round(rss.peak_mb, 1),
+        },
+        "stages": result["stages"],
+        "extractors": result["extractors"],
+        "batching": result["batching"],
+    }
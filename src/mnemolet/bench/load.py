@@ -0,0 +1,180 @@
+import asyncio
+import itertools
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+
+from mnemolet.bench.utils import environment, percentiles, timer
+
+logger = logging.getLogger(__name__)
+
+ENDPOINTS = ("search", "answer")
+
+DEFAULT_QUERIES = [
+    "How do I configure the ingestion batch size?",
+    "Which file formats can be ingested?",
+    "What does the dashboard show?",
+    "How are answers generated?",
+]
+
+
+def load_query_lines(path: Path) -> list[str]:
+    """
+    Load queries from a text file (one per line) or JSONL with a "query" key.
+    """
+    queries = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        queries.append(json.loads(line)["query"] if line.startswith("{") else line)
+    if not queries:
+        raise ValueError(f"No queries in {path}")
+    return queries
+
+
+class _EndpointStats:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.first_chunk: list[float] = []
+        self.statuses: Counter = Counter()
+        self.errors = 0
+
+    def to_dict(self, seconds: float) -> dict:
+        n = len(self.latencies)
+        result = {
+            "requests": n,
+            "errors": self.errors,
+            "error_rate": round(self.errors / n, 4) if n else 0.0,
+            "requests_per_sec": round(n / seconds, 2) if seconds else 0.0,
+            "statuses": dict(self.statuses),
+            "latency_ms": _ms(percentiles(self.latencies)),
+        }
+        if self.first_chunk:
+            result["first_chunk_ms"] = _ms(percentiles(self.first_chunk))
+        return result
+
+
+def _ms(values: dict) -> dict:
+    return {k: round(v * 1000, 2) for k, v in values.items()}
+
+
+async def _search(client, query: str, stats: _EndpointStats):
+    response = await client.get("/api/search", params={"query": query})
+    stats.statuses[str(response.status_code)] += 1
+    return response.status_code == 200
+
+
+async def _answer(client, query: str, stats: _EndpointStats, start: float):
+    """
+    Read the NDJSON answer stream; an error event counts as a failure.
+    """
+    ok = True
+    async with client.stream("GET", "/api/answer", params={"query": query}) as r:
+        stats.statuses[str(r.status_code)] += 1
+        if r.status_code != 200:
+            await r.aread()
+            return False
+        first = True
+        async for line in r.aiter_lines():
+            if not line:
+                continue
+            event = json.loads(line)
+            if event.get("type") == "chunk" and first:
+                stats.first_chunk.append(timer() - start)
+                first = False
+            elif event.get("type") == "error":
+                ok = False
+    return ok
+
+
+async def _worker(client, jobs, stats: dict, deadline: float | None, timeout: float):
+    for endpoint, query in jobs:
+        if deadline is not None and timer() >= deadline:
+            return
+        s = stats[endpoint]
+        start = timer()
+        try:
+            if endpoint == "search":
+                call = _search(client, query, s)
+            else:
+                call = _answer(client, query, s, start)
+            ok = await asyncio.wait_for(call, timeout)
+        except Exception as e:
+            logger.debug(f"[load] {endpoint} failed: {e!r}")
+            s.statuses[type(e).__name__] += 1
+            ok = False
+        s.latencies.append(timer() - start)
+        if not ok:
+            s.errors += 1
+
+
+async def run_load_test(
+    base_url: str,
+    endpoints: tuple[str, ...] = ENDPOINTS,
+    queries: list[str] | None = None,
+    concurrency: int = 8,
+    duration: float | None = 30.0,
+    requests: int | None = None,
+    timeout: float = 120.0,
+) -> dict:
+    """
+    Drive the API with `concurrency` clients and report per endpoint
+    throughput, error rate and latency percentiles.
+    - clients cycle through endpoints and queries until `duration` seconds
+      passed or `requests` requests were sent (whichever comes first).
+    - for /answer the time to the first chunk is reported as well.
+    """
+    import httpx
+
+    for endpoint in endpoints:
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {endpoint}, use {ENDPOINTS}")
+    if duration is None and requests is None:
+        raise ValueError("Set duration, requests or both")
+
+    queries = queries or DEFAULT_QUERIES
+    jobs = zip(itertools.cycle(endpoints), itertools.cycle(queries))
+    if requests is not None:
+        jobs = itertools.islice(jobs, requests)
+    # one shared iterator: every job is taken by exactly one worker
+    jobs = iter(jobs)
+    stats = {e: _EndpointStats() for e in endpoints}
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=timeout
+    ) as client:
+        start = timer()
+        deadline = start + duration if duration is not None else None
+        await asyncio.gather(
+            *(
+                _worker(client, jobs, stats, deadline, timeout)
+                for _ in range(concurrency)
+            )
+        )
+        elapsed = max(timer() - start, 1e-9)
+
+    total = sum(len(s.latencies) for s in stats.values())
+    errors = sum(s.errors for s in stats.values())
+    return {
+        "benchmark": "load",
+        "environment": environment(),
+        "config": {
+            "base_url": base_url,
+            "endpoints": list(endpoints),
+            "concurrency": concurrency,
+            "duration": duration,
+            "requests": requests,
+            "queries": len(queries),
+        },
+        "results": {
+            "seconds": round(elapsed, 3),
+            "requests": total,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "requests_per_sec": round(total / elapsed, 2),
+            "endpoints": {e: s.to_dict(elapsed) for e, s in stats.items()},
+        },
+    }
@@ -0,0 +1,134 @@
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "the answer depends on the context provided in the retrieved documents "
+    "which describe the system and its configuration in some detail"
+).split()
+
+
+@dataclass
+class StubOllamaConfig:
+    """
+    How the stub behaves: delay before the first token, tokens per second
+    after it and tokens per answer.
+    """
+
+    first_token_ms: float = 200.0
+    tokens_per_sec: float = 30.0
+    tokens: int = 64
+    model: str = "stub"
+    # fraction of generate requests answered with 500
+    error_rate: float = 0.0
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def cfg(self) -> StubOllamaConfig:
+        return self.server.cfg
+
+    def log_message(self, format, *args):
+        logger.debug(f"[ollama-stub] {format % args}")
+
+    def do_GET(self):
+        if self.path == "/api/version":
+            self._send_json({"version": "0.0.0-stub"})
+        elif self.path == "/api/tags":
+            self._send_json({"models": [{"name": self.cfg.model}]})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._send_json({"error": "not found"}, status=404)
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if random.random() < self.cfg.error_rate:
+            self._send_json({"error": "stub failure"}, status=500)
+            return
+
+        model = payload.get("model", self.cfg.model)
+        if not payload.get("stream", True):
+            time.sleep(self._generation_seconds())
+            text = " ".join(self._words())
+            self._send_json({"model": model, "response": text, "done": True})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        time.sleep(self.cfg.first_token_ms / 1000)
+        interval = 1 / self.cfg.tokens_per_sec if self.cfg.tokens_per_sec > 0 else 0
+        try:
+            for i, word in enumerate(self._words()):
+                if i:
+                    time.sleep(interval)
+                self._write_chunk({"model": model, "response": word + " "})
+            self._write_chunk({"model": model, "response": "", "done": True})
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # client went away mid-stream
+            pass
+
+    def _words(self) -> list[str]:
+        return [WORDS[i % len(WORDS)] for i in range(self.cfg.tokens)]
+
+    def _generation_seconds(self) -> float:
+        rate = self.cfg.tokens_per_sec
+        tokens = max(0, self.cfg.tokens - 1) / rate if rate > 0 else 0
+        return self.cfg.first_token_ms / 1000 + tokens
+
+    def _write_chunk(self, data: dict):
+        line = (json.dumps(data) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, data: dict, status: int = 200):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_stub_server(
+    host: str = "127.0.0.1", port: int = 11435, cfg: StubOllamaConfig | None = None
+) -> ThreadingHTTPServer:
+    """
+    Create (not start) an HTTP server emulating Ollama's /api/generate.
+    - port 0 picks a free port, see server.server_address.
+    """
+    server = ThreadingHTTPServer((host, port), _StubHandler)
+    server.daemon_threads = True
+    server.cfg = cfg or StubOllamaConfig()
+    return server
+
+
+@contextmanager
+def running_stub(cfg: StubOllamaConfig | None = None, host: str = "127.0.0.1"):
+    """
+    Run the stub on a free port in a background thread, yields its url.
+    """
+    server = make_stub_server(host, 0, cfg)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
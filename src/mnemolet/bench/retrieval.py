@@ -0,0 +1,169 @@
+import json
+import logging
+from dataclasses import replace
+from pathlib import Path
+
+from mnemolet.bench.utils import environment, percentiles, timer
+
+logger = logging.getLogger(__name__)
+
+
+def load_queries(path: Path) -> list[dict]:
+    """
+    Load labelled queries from JSON (a list) or JSONL (one object per line).
+    - each item: {"query": "...", "relevant": ["path/to/file", ...]}
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        items = json.loads(text)
+
+    if not items:
+        raise ValueError(f"No queries in {path}")
+    for i, item in enumerate(items):
+        if not item.get("query") or not item.get("relevant"):
+            raise ValueError(f"Query #{i} needs 'query' and 'relevant' fields")
+    return items
+
+
+def _is_relevant(path: str, relevant: list[str]) -> bool:
+    """
+    Labels may be absolute or relative to the ingested directory.
+    """
+    return any(path == r or path.endswith("/" + r.lstrip("/")) for r in relevant)
+
+
+def ranked_paths(results: list[dict]) -> list[str]:
+    """
+    Return unique file paths in rank order (several chunks share a file).
+    """
+    seen = []
+    for r in results:
+        if r["path"] not in seen:
+            seen.append(r["path"])
+    return seen
+
+
+def recall_at_k(paths: list[str], relevant: list[str]) -> float:
+    """
+    Share of relevant files present in the retrieved paths.
+    """
+    found = sum(1 for r in relevant if any(_is_relevant(p, [r]) for p in paths))
+    return found / len(relevant)
+
+
+def reciprocal_rank(paths: list[str], relevant: list[str]) -> float:
+    """
+    1 / rank of the first relevant file, 0 if none was retrieved.
+    """
+    for rank, path in enumerate(paths, start=1):
+        if _is_relevant(path, relevant):
+            return 1 / rank
+    return 0.0
+
+
+def _overlap(results: list[dict], truth: list[dict]) -> float:
+    """
+    Share of exact-search chunks that the approximate search returned too.
+    """
+    if not truth:
+        return 1.0
+    ids = {r["id"] for r in results}
+    return sum(1 for t in truth if t["id"] in ids) / len(truth)
+
+
+def run_retrieval_benchmark(
+    queries: list[dict],
+    qdrant_url: str,
+    collection_name: str,
+    embed_model: str,
+    top_k: int,
+    min_score: float,
+    exact: bool = False,
+    hnsw_ef: int | None = None,
+    compare_exact: bool = True,
+    repeat: int = 1,
+) -> dict:
+    """
+    Run labelled queries through Retriever.retrieve and report quality/latency.
+    - latency is measured over `repeat` runs of every query, after one warm-up
+      query (model load and connection setup are not part of the numbers).
+    - with `compare_exact`, results are also checked against brute-force
+      search, which shows how much recall the HNSW index gives up.
+    """
+    from mnemolet.core.query.retrieval.retriever import Retriever, RetrieverConfig
+
+    cfg = RetrieverConfig(
+        qdrant_url=qdrant_url,
+        collection_name=collection_name,
+        embed_model=embed_model,
+        top_k=top_k,
+        min_score=min_score,
+        exact=exact,
+        hnsw_ef=hnsw_ef,
+    )
+    retriever = Retriever(cfg)
+    exact_retriever = None
+    if compare_exact and not exact:
+        exact_retriever = Retriever(replace(cfg, exact=True, hnsw_ef=None))
+
+    retriever.retrieve(queries[0]["query"])  # warm-up
+
+    latencies = []
+    per_query = []
+    for item in queries:
+        for _ in range(max(1, repeat)):
+            start = timer()
+            results = retriever.retrieve(item["query"])
+            latencies.append((timer() - start) * 1000)
+
+        paths = ranked_paths(results)
+        row = {
+            "query": item["query"],
+            "recall": recall_at_k(paths, item["relevant"]),
+            "rr": reciprocal_rank(paths, item["relevant"]),
+            "retrieved": paths,
+        }
+        if exact_retriever is not None:
+            truth = exact_retriever.retrieve(item["query"])
+            truth_paths = ranked_paths(truth)
+            row["exact_recall"] = recall_at_k(truth_paths, item["relevant"])
+            row["exact_overlap"] = _overlap(results, truth)
+        per_query.append(row)
+
+    n = len(per_query)
+    summary = {
+        "queries": n,
+        "latency_ms": {
+            **{k: round(v, 3) for k, v in percentiles(latencies).items()},
+            "mean": round(sum(latencies) / len(latencies), 3),
+        },
+        f"recall@{top_k}": round(sum(r["recall"] for r in per_query) / n, 4),
+        "mrr": round(sum(r["rr"] for r in per_query) / n, 4),
+    }
+    if exact_retriever is not None:
+        summary[f"exact_recall@{top_k}"] = round(
+            sum(r["exact_recall"] for r in per_query) / n, 4
+        )
+        summary["exact_overlap"] = round(
+            sum(r["exact_overlap"] for r in per_query) / n, 4
+        )
+
+    return {
+        "benchmark": "retrieval",
+        "environment": environment(),
+        "config": {
+            "qdrant_url": qdrant_url,
+            "collection_name": collection_name,
+            "embed_model": embed_model,
+            "top_k": top_k,
+            "min_score": min_score,
+            "exact": exact,
+            "hnsw_ef": hnsw_ef,
+            "repeat": repeat,
+        },
+        "results": summary,
+        "queries": per_query,
+    }
@@ -0,0 +1,90 @@
+import platform
+import threading
+import time
+import zlib
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+
+import numpy as np
+import psutil
+
+
+class StubEmbedder:
+    """
+    Deterministic fake embedder: pseudo-random unit vectors seeded by text.
+    Costs next to nothing, so benchmarks measure the pipeline, not the model.
+    """
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        vectors = np.empty((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+            v = rng.standard_normal(self.dim)
+            vectors[i] = v / np.linalg.norm(v)
+        return vectors
+
+
+class PeakRSS:
+    """
+    Sample process RSS in a background thread while inside the block.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.start_mb = 0.0
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self):
+        self.start_mb = self.peak_mb = self._rss_mb()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, self._rss_mb())
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, self._rss_mb())
+
+    def _rss_mb(self) -> float:
+        return self.process.memory_info().rss / 1024**2
+
+
+def percentiles(values: list[float], points=(50, 95, 99)) -> dict[str, float]:
+    """
+    Return {"p50": .., "p95": .., ...} for the given values.
+    """
+    if not values:
+        return {f"p{p}": 0.0 for p in points}
+    return {f"p{p}": float(v) for p, v in zip(points, np.percentile(values, points))}
+
+
+def environment() -> dict:
+    """
+    Describe where the benchmark ran, so results can be compared.
+    """
+    try:
+        mnemolet_version = version("mnemolet")
+    except PackageNotFoundError:
+        mnemolet_version = "unknown"
+
+    return {
+        "mnemolet": mnemolet_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": psutil.cpu_count(),
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
+def timer() -> float:
+    return time.perf_counter()
@@ -49,6 +49,8 @@ def answer(
     from mnemolet.core.query.generation.generate_answer import generate_answer
     from mnemolet.core.query.generation.local_generator import get_llm_generator
     from mnemolet.core.query.retrieval.retriever import get_retriever
+    from mnemolet.core.utils.tracing import start_trace
+    from mnemolet.core.utils.utils import format_source
 
     retriever = get_retriever(
         url=QDRANT_URL,
@@ -62,13 +64,15 @@ def answer(
 
     click.echo("Generating answer..")
 
-    for chunk, sources in generate_answer(
-        retriever=retriever,
-        generator=generator,
-        query=query,
-    ):
-        if sources is None:
-            click.echo(chunk, nl=False)
+    with start_trace(name="cli answer") as trace:
+        logger.info(f"Request id: {trace.trace_id}")
+        for chunk, sources in generate_answer(
+            retriever=retriever,
+            generator=generator,
+            query=query,
+        ):
+            if sources is None:
+                click.echo(chunk, nl=False)
 
     click.echo("\n")
 
@@ -76,4 +80,4 @@ def answer(
     if sources:
         click.echo("\nSources:\n")
         for i, r in enumerate(sources, start=1):
-            click.echo(f"{i}. {r['path']} (score={r['score']:.4f})")
+            click.echo(f"{i}. {format_source(r)} (score={r['score']:.4f})")
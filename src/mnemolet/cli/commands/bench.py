@@ -0,0 +1,280 @@
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+import click
+
+from mnemolet.config import (
+    ADAPTIVE_BATCH,
+    BATCH_SIZE,
+    EMBED_MODEL,
+    MIN_SCORE,
+    QDRANT_COLLECTION,
+    QDRANT_URL,
+    SIZE_CHARS,
+    TOP_K,
+)
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("txt", "md", "json", "csv", "docx", "odt", "pdf")
+
+
+def _write_report(report: dict, output: str | None):
+    text = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+        click.echo(f"Report written to {output}", err=True)
+    else:
+        click.echo(text)
+
+
+@click.group()
+def bench():
+    """
+    Run reproducible performance benchmarks.
+    """
+
+
+@bench.command()
+@click.argument("destination", type=click.Path(file_okay=False))
+@click.option("--files", default=50, show_default=True, help="Number of files.")
+@click.option("--seed", default=42, show_default=True, help="Random seed.")
+@click.option("--min-kb", default=1, show_default=True, help="Smallest file size.")
+@click.option("--max-kb", default=256, show_default=True, help="Largest file size.")
+@click.option(
+    "--formats",
+    default=",".join(FORMATS),
+    show_default=True,
+    help="Comma separated file formats.",
+)
+def corpus(destination, files, seed, min_kb, max_kb, formats):
+    """
+    Generate a synthetic corpus into DESTINATION.
+    """
+    from mnemolet.bench.corpus import generate_corpus
+
+    manifest = generate_corpus(
+        Path(destination), files, seed, tuple(formats.split(",")), min_kb, max_kb
+    )
+    click.echo(json.dumps(manifest, indent=2))
+
+
+@bench.command(name="ingest")
+@click.option(
+    "--corpus",
+    "corpus_dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Existing corpus, otherwise a synthetic one is generated.",
+)
+@click.option("--files", default=50, show_default=True, help="Synthetic files.")
+@click.option("--seed", default=42, show_default=True, help="Random seed.")
+@click.option("--min-kb", default=1, show_default=True, help="Smallest file size.")
+@click.option("--max-kb", default=256, show_default=True, help="Largest file size.")
+@click.option(
+    "--formats",
+    default=",".join(FORMATS),
+    show_default=True,
+    help="Comma separated file formats.",
+)
+@click.option(
+    "--qdrant",
+    "qdrant_url",
+    default=":memory:",
+    show_default=True,
+    help="Qdrant url, :memory:, an absolute path or file:<path>.",
+)
+@click.option("--batch-size", default=BATCH_SIZE, show_default=True)
+@click.option(
+    "--adaptive-batch/--fixed-batch",
+    default=ADAPTIVE_BATCH,
+    show_default=True,
+    help="Adapt the batch size to throughput and memory.",
+)
+@click.option("--size-chars", default=SIZE_CHARS, show_default=True)
+@click.option(
+    "--real-embedder",
+    is_flag=True,
+    help="Use the local embedding model instead of the stub.",
+)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON here.")
+def ingest_bench(
+    corpus_dir,
+    files,
+    seed,
+    min_kb,
+    max_kb,
+    formats,
+    qdrant_url,
+    batch_size,
+    adaptive_batch,
+    size_chars,
+    real_embedder,
+    output,
+):
+    """
+    Measure ingestion throughput and peak memory.
+    - results are printed as JSON (or written to --output).
+    """
+    from mnemolet.bench.corpus import generate_corpus
+    from mnemolet.bench.ingest import run_ingest_benchmark
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = None
+        if corpus_dir is None:
+            corpus_dir = Path(tmp) / "corpus"
+            manifest = generate_corpus(
+                corpus_dir, files, seed, tuple(formats.split(",")), min_kb, max_kb
+            )
+
+        report = run_ingest_benchmark(
+            Path(corpus_dir),
+            qdrant_url=qdrant_url,
+            batch_size=batch_size,
+            size_chars=size_chars,
+            real_embedder=real_embedder,
+            adaptive=adaptive_batch,
+        )
+        report["corpus"] = manifest
+
+    _write_report(report, output)
+
+
+@bench.command()
+@click.argument("queries", type=click.Path(exists=True, dir_okay=False))
+@click.option("--qdrant", "qdrant_url", default=QDRANT_URL, show_default=True)
+@click.option("--collection", default=QDRANT_COLLECTION, show_default=True)
+@click.option("--top-k", default=TOP_K, show_default=True)
+@click.option("--min-score", default=MIN_SCORE, show_default=True)
+@click.option("--exact", is_flag=True, help="Use brute-force search only.")
+@click.option("--hnsw-ef", type=int, help="Override HNSW search beam size.")
+@click.option(
+    "--compare-exact/--no-compare-exact",
+    default=True,
+    show_default=True,
+    help="Also check results against brute-force search.",
+)
+@click.option("--repeat", default=1, show_default=True, help="Runs per query.")
+@click.option("--details", is_flag=True, help="Include per-query results.")
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON here.")
+def retrieval(
+    queries,
+    qdrant_url,
+    collection,
+    top_k,
+    min_score,
+    exact,
+    hnsw_ef,
+    compare_exact,
+    repeat,
+    details,
+    output,
+):
+    """
+    Measure retrieval latency, recall@k and MRR on labelled QUERIES.
+    - QUERIES is a JSON/JSONL file of {"query": .., "relevant": [paths]}.
+    """
+    from mnemolet.bench.retrieval import load_queries, run_retrieval_benchmark
+
+    report = run_retrieval_benchmark(
+        load_queries(Path(queries)),
+        qdrant_url,
+        collection,
+        EMBED_MODEL,
+        top_k,
+        min_score,
+        exact=exact,
+        hnsw_ef=hnsw_ef,
+        compare_exact=compare_exact,
+        repeat=repeat,
+    )
+    if not details:
+        report.pop("queries")
+
+    _write_report(report, output)
+
+
+@bench.command(name="ollama-stub")
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=11435, show_default=True)
+@click.option("--first-token-ms", default=200.0, show_default=True)
+@click.option("--tokens-per-sec", default=30.0, show_default=True)
+@click.option("--tokens", default=64, show_default=True, help="Tokens per answer.")
+@click.option(
+    "--error-rate",
+    default=0.0,
+    show_default=True,
+    help="Share of generate requests failing with 500.",
+)
+def ollama_stub(host, port, first_token_ms, tokens_per_sec, tokens, error_rate):
+    """
+    Run a stand-in for Ollama that streams fake tokens at a fixed rate.
+    - start the API with OLLAMA_PORT pointing here to load-test /answer
+      without a GPU.
+    """
+    from mnemolet.bench.ollama_stub import StubOllamaConfig, make_stub_server
+
+    cfg = StubOllamaConfig(
+        first_token_ms, tokens_per_sec, tokens, error_rate=error_rate
+    )
+    server = make_stub_server(host, port, cfg)
+    click.echo(
+        f"Ollama stub on http://{host}:{port} (first token {first_token_ms}ms, "
+        f"{tokens_per_sec} tokens/s, {tokens} tokens)",
+        err=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@bench.command()
+@click.option("--url", default="http://127.0.0.1:8000", show_default=True)
+@click.option(
+    "--endpoints",
+    default="search,answer",
+    show_default=True,
+    help="Comma separated endpoints to call in turn.",
+)
+@click.option(
+    "--queries",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Queries, one per line (or JSONL with a query key).",
+)
+@click.option("--concurrency", default=8, show_default=True, help="Parallel clients.")
+@click.option("--duration", default=30.0, show_default=True, help="Seconds to run.")
+@click.option("--requests", type=int, help="Stop after this many requests.")
+@click.option("--timeout", default=120.0, show_default=True, help="Per request.")
+@click.option("--output", type=click.Path(dir_okay=False), help="Write JSON here.")
+def load(url, endpoints, queries, concurrency, duration, requests, timeout, output):
+    """
+    Load-test a running API and report throughput, errors and latency.
+    """
+    import asyncio
+
+    from mnemolet.bench.load import load_query_lines, run_load_test
+
+    report = asyncio.run(
+        run_load_test(
+            url,
+            tuple(endpoints.split(",")),
+            load_query_lines(Path(queries)) if queries else None,
+            concurrency,
+            duration,
+            requests,
+            timeout,
+        )
+    )
+    for name, r in report["results"]["endpoints"].items():
+        ms = r["latency_ms"]
+        click.echo(
+            f"{name:8} {r['requests']:>6} req {r['requests_per_sec']:>8.1f} req/s "
+            f"errors {r['error_rate']:>6.1%} p50 {ms['p50']:>8.1f}ms "
+            f"p95 {ms['p95']:>8.1f}ms p99 {ms['p99']:>8.1f}ms",
+            err=True,
+        )
+    _write_report(report, output)
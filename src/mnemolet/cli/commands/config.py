@@ -8,6 +8,8 @@ DEFAULT_CONFIG = {
     "qdrant": {
         "host": "localhost",
         "port": 6333,
+        "grpc_port": 6334,
+        "prefer_grpc": False,
         "collection": "documents",
         "top_k": 5,
         "min_score": 0.35,
@@ -16,12 +18,89 @@ DEFAULT_CONFIG = {
         "batch_size": 100,
         "chunk_size": 1048576,
         "size_chars": 3000,
+        "max_jobs": 1,
+        "adaptive_batch": True,
+        "min_batch_size": 8,
+        "max_batch_size": 1024,
+        "batch_target_seconds": 5,
+        "memory_limit_mb": 0,
+        "archives": True,
+        "archive_spool_mb": 32,
+        "archive_max_member_mb": 512,
     },
     "embedding": {
         "model": "all-MiniLM-L6-v2",
         "batch_size": 100,
+        "query_batch_size": 32,
+        "query_batch_wait_ms": 3,
     },
     "ollama": {"host": "localhost", "port": 11434, "model": "llama3"},
+    "api": {"query_workers": 16, "admin_workers": 4},
+    "limits": {
+        "embedding": 32,
+        "qdrant": 8,
+        "ollama": 2,
+        "max_queue": 32,
+        "timeout": 30,
+    },
+    "health": {
+        "timeout": 1,
+        "refresh_interval": 5,
+        "cache_file": "./data/health.json",
+        "cache_ttl": 30,
+    },
+    "tracing": {
+        "enabled": False,
+        "file": "./data/traces.jsonl",
+        "min_ms": 500,
+        "max_mb": 50,
+        "backups": 3,
+        "queue_size": 1000,
+    },
+    "scan": {
+        "exclude": [
+            ".git/",
+            "node_modules/",
+            "__pycache__/",
+            ".venv/",
+            ".tox/",
+            ".*_cache/",
+        ],
+        "include": [],
+        "gitignore": True,
+        "max_file_mb": 0,
+        "max_age_days": 0,
+        "workers": 8,
+    },
+    "text": {
+        "max_file_mb": 0,
+        "oversize": "head_tail",
+        "sample_mb": 8,
+        "mmap_min_mb": 4,
+        "fallback_encoding": "cp1252",
+    },
+    "audio": {
+        "model": "small",
+        "device": "auto",
+        "compute_type": "auto",
+        "batch_size": 16,
+        "workers": 2,
+        "cpu_threads": 0,
+        "cache_dir": "./data/transcripts",
+    },
+    "pdf": {
+        "workers": 0,
+        "pages_per_task": 8,
+        "parallel_min_pages": 16,
+    },
+    "dedup": {
+        "mode": "link",
+        "threshold": 0.9,
+        "shingle_words": 5,
+        "num_perm": 128,
+        "bands": 16,
+        "min_words": 10,
+    },
     "storage": {
         "db_path": "./data/tracker.sqlite",
         "upload_dir": "./data/uploads",
@@ -3,6 +3,7 @@ import logging
 import click
 
 from mnemolet.config import (
+    ADAPTIVE_BATCH,
     BATCH_SIZE,
     QDRANT_COLLECTION,
     QDRANT_URL,
@@ -23,22 +24,83 @@ logger = logging.getLogger(__name__)
     "--batch-size",
     default=BATCH_SIZE,
     show_default=True,
-    help="Number of chunks per batch.",
+    help="Number of chunks per batch (initial size with --adaptive-batch).",
+)
+@click.option(
+    "--adaptive-batch/--fixed-batch",
+    default=ADAPTIVE_BATCH,
+    show_default=True,
+    help="Adapt the batch size to throughput and memory.",
+)
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False),
+    help="Write a cProfile profile of the run to this file (.prof).",
 )
 @click.pass_context
 @requires_qdrant
-def ingest(ctx, directory: str, force: bool, batch_size: int):
+def ingest(
+    ctx,
+    directory: str,
+    force: bool,
+    batch_size: int,
+    adaptive_batch: bool,
+    profile: str | None,
+):
     """
     Ingest files from a directory into Qdrant.
     - streams files, chunks them, embeds text and stores data in Qdrant.
     """
     from mnemolet.core.ingestion.ingest import ingest
 
-    result = ingest(
-        directory, batch_size, QDRANT_URL, QDRANT_COLLECTION, SIZE_CHARS, force=force
-    )
+    args = (directory, batch_size, QDRANT_URL, QDRANT_COLLECTION, SIZE_CHARS)
+
+    if profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        result = profiler.runcall(ingest, *args, force=force, adaptive=adaptive_batch)
+        profiler.dump_stats(profile)
+    else:
+        result = ingest(*args, force=force, adaptive=adaptive_batch)
 
     click.echo(
         f"Ingestion complete: {result['files']} files, {result['chunks']} stored in "
         f"Qdrant in {result['time']:.1f}s.\n"
     )
+    _print_breakdown(result)
+    b = result.get("batching")
+    if b and b["batches"]:
+        click.echo(
+            f"Batches: {b['batches']}, final size {b['final_size']} chunks, "
+            f"peak RSS {b['peak_rss_mb']:.0f} MB (limit {b['memory_limit_mb']:.0f} MB)."
+        )
+    d = result.get("dedup")
+    if d and (d["suppressed"] or d["linked"]):
+        click.echo(
+            f"Near-duplicates: {d['suppressed']} chunks suppressed, "
+            f"{d['linked']} linked (of {d['checked']} checked)."
+        )
+
+    if profile:
+        click.echo(
+            f"Profile written to {profile} "
+            f"(view with `snakeviz {profile}` or `flameprof {profile}`)."
+        )
+
+
+def _print_breakdown(result: dict):
+    """
+    Helper fn to print time spent per stage and per extractor.
+    """
+    total = max(result["time"], 1e-9)
+    for title, rows in (("Stage", "stages"), ("Extractor", "extractors")):
+        if not result.get(rows):
+            continue
+        click.echo(f"{title:20} {'time':>9} {'share':>6} {'items':>8} {'MB':>9}")
+        for name, s in result[rows].items():
+            click.echo(
+                f"{name:20} {s['seconds']:>8.2f}s {s['seconds'] / total:>6.0%} "
+                f"{s['items']:>8} {s['bytes'] / 1024**2:>9.2f}"
+            )
+        click.echo()
@@ -3,7 +3,6 @@ import click
 from mnemolet.config import (
     QDRANT_URL,
 )
-from mnemolet.core.utils.qdrant import QdrantManager
 
 from .utils import requires_qdrant
 
@@ -14,6 +13,8 @@ def list_collections():
     """
     List all Qdrant collections.
     """
+    from mnemolet.core.utils.qdrant import QdrantManager
+
     qm = QdrantManager(QDRANT_URL)
     xz = qm.list_collections()
     if not xz:
@@ -4,7 +4,6 @@ from mnemolet.config import (
     QDRANT_COLLECTION,
     QDRANT_URL,
 )
-from mnemolet.core.utils.qdrant import QdrantManager
 
 from .utils import requires_qdrant
 
@@ -20,6 +19,9 @@ def remove(collection_name: str):
     """
     Remove Qdrant collection.
     """
+    from mnemolet.core.storage.db_tracker import DBTracker
+    from mnemolet.core.utils.qdrant import QdrantManager
+
     click.confirm(
         f"Are you sure you want to delete the collection '{collection_name}'?",
         abort=True,
@@ -27,6 +29,8 @@ def remove(collection_name: str):
     try:
         qm = QdrantManager(QDRANT_URL)
         qm.remove_collection(collection_name)
+        # near-duplicate detection must not match chunks that are gone
+        DBTracker().clear_chunk_signatures(collection_name)
         click.echo(f"Collection '{collection_name}' removed successfully.")
     except Exception as e:
         click.echo(f"Failed to remove collection '{collection_name}': {e}")
@@ -25,7 +25,7 @@ def search(query: str, top_k: int, min_score: float):
     Search Qdrant for relevant documents.
     """
     from mnemolet.core.query.retrieval.search_documents import search_documents
-    from mnemolet.core.utils.utils import filter_by_min_score
+    from mnemolet.core.utils.utils import filter_by_min_score, format_source
 
     results = search_documents(
         qdrant_url=QDRANT_URL,
@@ -43,6 +43,7 @@ def search(query: str, top_k: int, min_score: float):
 
     click.echo("\nTop results:\n")
     for i, r in enumerate(filtered_results, start=1):
+        source = format_source(r)
         click.echo(
-            f"{i}. (score={r['score']:.4f}) (path={r['path']}) {r['text'][:200]}...\n"
+            f"{i}. (score={r['score']:.4f}) (path={source}) {r['text'][:200]}...\n"
         )
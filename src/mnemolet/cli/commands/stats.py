@@ -14,11 +14,34 @@ from .utils import requires_qdrant
     default=QDRANT_COLLECTION,
     help="Define collection name.",
 )
-@requires_qdrant
-def stats(collection_name: str):
+@click.option(
+    "--runs",
+    is_flag=True,
+    help="Show recorded ingestion runs and their throughput instead.",
+)
+@click.option(
+    "--duplicates",
+    is_flag=True,
+    help="Show the latest near-duplicate chunks of the collection instead.",
+)
+@click.option(
+    "--limit", default=20, show_default=True, help="Runs or duplicates to show."
+)
+def stats(collection_name: str, runs: bool, duplicates: bool, limit: int):
     """
     Output statistics about Qdrant database.
     """
+    if runs:
+        _print_runs(limit)
+        return
+    if duplicates:
+        _print_duplicates(collection_name, limit)
+        return
+    _print_collection_stats(collection_name)
+
+
+@requires_qdrant
+def _print_collection_stats(collection_name: str):
     from mnemolet.core.utils.qdrant import QdrantManager
 
     try:
@@ -34,3 +57,57 @@ def stats(collection_name: str):
         if k != "collection_name":
             click.echo(f"{k.replace('_', ' ').title():22}: {v}")
     click.echo("-" * 60)
+
+
+def _print_runs(limit: int):
+    """
+    Helper fn to print the latest ingestion runs, oldest first, with the
+    change of chunks/sec against the previous finished run.
+    """
+    from mnemolet.core.storage.db_tracker import DBTracker
+
+    runs = list(reversed(DBTracker().list_runs(limit)))
+    if not runs:
+        click.echo("No ingestion runs recorded yet.")
+        return
+
+    click.echo(
+        f"{'id':>4} {'started':19} {'status':7} {'version':8} {'files':>6} "
+        f"{'chunks':>7} {'MB':>8} {'time':>8} {'files/s':>8} {'chunks/s':>9} "
+        f"{'MB/s':>7} {'change':>7} {'errors':>6}"
+    )
+    previous = None
+    for r in runs:
+        change = ""
+        if r["status"] == "done" and r["chunks"]:
+            if previous:
+                change = f"{r['chunks_per_sec'] / previous - 1:+.0%}"
+            previous = r["chunks_per_sec"]
+        click.echo(
+            f"{r['id']:>4} {r['started_at'][:19]:19} {r['status']:7} "
+            f"{r['version'] or '':8} {r['files']:>6} {r['chunks']:>7} "
+            f"{r['bytes'] / 1024**2:>8.2f} {r['seconds']:>7.1f}s "
+            f"{r['files_per_sec']:>8.1f} {r['chunks_per_sec']:>9.1f} "
+            f"{r['mb_per_sec']:>7.2f} {change:>7} {r['errors']:>6}"
+        )
+        if r["error"]:
+            click.echo(f"     error: {r['error']}")
+
+
+def _print_duplicates(collection_name: str, limit: int):
+    """
+    Helper fn to print the latest near-duplicate chunks and what they
+    duplicate, as "path #chunk".
+    """
+    from mnemolet.core.storage.db_tracker import DBTracker
+
+    rows = DBTracker().list_near_duplicates(collection_name, limit)
+    if not rows:
+        click.echo(f"No near-duplicate chunks recorded for {collection_name}.")
+        return
+
+    for r in rows:
+        click.echo(
+            f"{r['similarity']:.2f} {r['action']:8} {r['path']} #{r['position']}"
+            f" -> {r['original_path']} #{r['original_position']}"
+        )
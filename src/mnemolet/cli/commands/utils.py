@@ -4,18 +4,19 @@ from functools import wraps
 from mnemolet.config import (
     QDRANT_URL,
 )
-from mnemolet.core.utils.qdrant import QdrantManager
 
 
 def requires_qdrant(f):
     """
     Decorator to check Qdrant before running a command.
+    A success within the last `[health] cache_ttl` seconds is trusted.
     """
 
     @wraps(f)
     def wrapper(*args, **kwargs):
-        qm = QdrantManager(QDRANT_URL)
-        if not qm.check_qdrant_status():
+        from mnemolet.core.health.checks import check_qdrant
+
+        if not check_qdrant(QDRANT_URL):
             sys.exit(1)
         return f(*args, **kwargs)
 
@@ -1,45 +1,135 @@
+import importlib
 import logging
-import sys
-from functools import wraps
-from importlib.metadata import PackageNotFoundError, version
 
 import click
 
-from mnemolet.config import (
-    QDRANT_URL,
-)
-from mnemolet.core.utils.qdrant import QdrantManager
-
 logger = logging.getLogger(__name__)
 
-try:
-    __version__ = version("mnemolet")
-except PackageNotFoundError:
-    __version__ = "0.1.0"
-
+# name -> (module, attribute, short help)
+# modules are imported only when their command runs; help texts live here
+# so that `mnemolet --help` does not import any of them
+LAZY_COMMANDS = {
+    "answer": (
+        "mnemolet.cli.commands.answer",
+        "answer",
+        "Search Qdrant and generate an answer using local LLM.",
+    ),
+    "bench": (
+        "mnemolet.cli.commands.bench",
+        "bench",
+        "Run reproducible performance benchmarks.",
+    ),
+    "chat": (
+        "mnemolet.cli.commands.chat",
+        "chat",
+        "Start interactive chat session with the local LLM.",
+    ),
+    "dashboard": (
+        "mnemolet.cli.commands.dashboard",
+        "dashboard",
+        "Show system and service health status.",
+    ),
+    "ingest": (
+        "mnemolet.cli.commands.ingest",
+        "ingest",
+        "Ingest files from a directory into Qdrant.",
+    ),
+    "init-config": (
+        "mnemolet.cli.commands.config",
+        "init_config",
+        "Generate a default config.toml file.",
+    ),
+    "list-collections": (
+        "mnemolet.cli.commands.list",
+        "list_collections",
+        "List all Qdrant collections.",
+    ),
+    "remove": (
+        "mnemolet.cli.commands.remove",
+        "remove",
+        "Remove Qdrant collection.",
+    ),
+    "search": (
+        "mnemolet.cli.commands.search",
+        "search",
+        "Search Qdrant for relevant documents.",
+    ),
+    "serve": (
+        "mnemolet.cli.commands.serve",
+        "serve",
+        "Start MnemoLet API server.",
+    ),
+    "stats": (
+        "mnemolet.cli.commands.stats",
+        "stats",
+        "Output statistics about Qdrant database.",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports a command module only when the command is used.
+    """
 
-def requires_qdrant(f):
+    def __init__(self, *args, lazy_commands: dict | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, name: str) -> click.Command | None:
+        if name not in self.commands and name in self.lazy_commands:
+            module, attr, _ = self.lazy_commands[name]
+            logger.debug(f"[lazy] importing {module}:{attr}")
+            self.add_command(getattr(importlib.import_module(module), attr), name)
+        return super().get_command(ctx, name)
+
+    def format_commands(self, ctx, formatter):
+        """
+        List commands with their registered help, without importing them.
+        """
+        limit = formatter.width - 6 - max(map(len, self.list_commands(ctx)), default=0)
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                cmd = self.commands[name]
+                if cmd.hidden:
+                    continue
+                rows.append((name, cmd.get_short_help_str(limit)))
+            else:
+                rows.append((name, self.lazy_commands[name][2]))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+def _print_version(ctx, param, value):
     """
-    Decorator to check Qdrant before running a command.
+    Resolve the version only when asked, importlib.metadata is not free.
     """
+    if not value or ctx.resilient_parsing:
+        return
 
-    @wraps(f)
-    def wrapper(*args, **kwargs):
-        qm = QdrantManager(QDRANT_URL)
-        if not qm.check_qdrant_status():
-            sys.exit(1)
-        return f(*args, **kwargs)
+    from mnemolet.core.utils.utils import package_version
 
-    return wrapper
+    click.echo(f"MnemoLet, version {package_version()}")
+    ctx.exit()
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option(
     "-v", "--verbose", count=True, help="Increase output verbosity (use -v or -vv)"
 )
-@click.version_option(
-    version=__version__,
-    prog_name="MnemoLet",
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
 )
 @click.pass_context
 def cli(ctx, verbose):
@@ -70,39 +160,5 @@ def cli(ctx, verbose):
     logger.debug(f"Logger init with level={level}")
 
 
-def lazy_import(module: str, name: str):
-    """
-    Return a click command that imports its implementation only on execution.
-    """
-
-    logger.debug(f"[lazy_import] preparing to load {module}:{name}")
-
-    def _wrapper(*args, **kwargs):
-        logger.debug(f"[lazy_import] importing module {module}")
-        mod = __import__(module, fromlist=[name])
-
-        logger.debug(f"[lazy_import] accessing attribute {name}")
-        return getattr(mod, name)
-
-    cmd = _wrapper()
-
-    return cmd
-
-
-def register_commands():
-    cli.add_command(lazy_import("mnemolet.cli.commands.config", "init_config"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.ingest", "ingest"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.search", "search"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.answer", "answer"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.stats", "stats"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.list", "list_collections"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.remove", "remove"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.serve", "serve"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.dashboard", "dashboard"))
-    cli.add_command(lazy_import("mnemolet.cli.commands.chat", "chat"))
-
-
-register_commands()
-
 if __name__ == "__main__":
     cli()
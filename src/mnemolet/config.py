@@ -21,6 +21,13 @@ QDRANT_HOST = os.getenv("QDRANT_HOST", config["qdrant"]["host"])
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", config["qdrant"].get("port", 6333)))
 QDRANT_COLLECTION = config["qdrant"]["collection"]
 QDRANT_URL = f"http://{QDRANT_HOST}:{QDRANT_PORT}"
+QDRANT_GRPC_PORT = int(
+    os.getenv("QDRANT_GRPC_PORT", config["qdrant"].get("grpc_port", 6334))
+)
+# use gRPC instead of REST for upserts and searches
+QDRANT_PREFER_GRPC = os.getenv(
+    "QDRANT_PREFER_GRPC", str(config["qdrant"].get("prefer_grpc", False))
+).lower() in ("1", "true", "yes")
 TOP_K = int(os.getenv("TOP_K", config["qdrant"].get("top_k", 5)))
 MIN_SCORE = float(os.getenv("MIN_SCORE", config["qdrant"].get("min_score", 0.35)))
 
@@ -30,16 +37,205 @@ CHUNK_SIZE = int(
     os.getenv("CHUNK_SIZE", config["ingestion"].get("chunk_size", 1048576))
 )
 SIZE_CHARS = int(os.getenv("SIZE_CHARS", config["ingestion"].get("size_chars", 3000)))
+# chunks per embed + store batch adapt within [min, max] to throughput and
+# memory; the process RSS is kept under memory_limit_mb (0 = half of the RAM)
+ADAPTIVE_BATCH = os.getenv(
+    "ADAPTIVE_BATCH", str(config["ingestion"].get("adaptive_batch", True))
+).lower() in ("1", "true", "yes")
+BATCH_SIZE_MIN = int(
+    os.getenv("BATCH_SIZE_MIN", config["ingestion"].get("min_batch_size", 8))
+)
+BATCH_SIZE_MAX = int(
+    os.getenv("BATCH_SIZE_MAX", config["ingestion"].get("max_batch_size", 1024))
+)
+BATCH_TARGET_SECONDS = float(
+    os.getenv(
+        "BATCH_TARGET_SECONDS", config["ingestion"].get("batch_target_seconds", 5)
+    )
+)
+INGEST_MEMORY_LIMIT_MB = float(
+    os.getenv("INGEST_MEMORY_LIMIT_MB", config["ingestion"].get("memory_limit_mb", 0))
+)
+# members of zip/tar archives are ingested as "archive!member"; each member
+# is read once, buffered in memory up to archive_spool_mb (on disk past it)
+INGEST_ARCHIVES = os.getenv(
+    "INGEST_ARCHIVES", str(config["ingestion"].get("archives", True))
+).lower() in ("1", "true", "yes")
+ARCHIVE_SPOOL_MB = float(
+    os.getenv("ARCHIVE_SPOOL_MB", config["ingestion"].get("archive_spool_mb", 32))
+)
+# members that unpack to more than this are skipped (zip bombs), 0 = no limit
+ARCHIVE_MAX_MEMBER_MB = float(
+    os.getenv(
+        "ARCHIVE_MAX_MEMBER_MB", config["ingestion"].get("archive_max_member_mb", 512)
+    )
+)
+# max number of background ingestion jobs running at the same time
+INGEST_MAX_JOBS = int(
+    os.getenv("INGEST_MAX_JOBS", config["ingestion"].get("max_jobs", 1))
+)
 
 EMBED_MODEL = os.getenv("EMBED_MODEL", config["embedding"]["model"])
 EMBED_BATCH = int(os.getenv("EMBED_BATCH", config["embedding"].get("batch_size", 100)))
+# concurrent queries are coalesced into one encode: up to N queries or X ms
+QUERY_BATCH_SIZE = int(
+    os.getenv("QUERY_BATCH_SIZE", config["embedding"].get("query_batch_size", 32))
+)
+QUERY_BATCH_WAIT_MS = float(
+    os.getenv("QUERY_BATCH_WAIT_MS", config["embedding"].get("query_batch_wait_ms", 3))
+)
 
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", config["ollama"]["host"])
 OLLAMA_PORT = int(os.getenv("OLLAMA_PORT", config["ollama"].get("port", 11434)))
 OLLAMA_URL = f"http://{OLLAMA_HOST}:{OLLAMA_PORT}"
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", config["ollama"]["model"])
 
+# API executors (threads) and per-resource concurrency limits
+api_config = config.get("api", {})
+API_QUERY_WORKERS = int(
+    os.getenv("API_QUERY_WORKERS", api_config.get("query_workers", 16))
+)
+API_ADMIN_WORKERS = int(
+    os.getenv("API_ADMIN_WORKERS", api_config.get("admin_workers", 4))
+)
+
+limits_config = config.get("limits", {})
+LIMIT_EMBEDDING = int(os.getenv("LIMIT_EMBEDDING", limits_config.get("embedding", 32)))
+LIMIT_QDRANT = int(os.getenv("LIMIT_QDRANT", limits_config.get("qdrant", 8)))
+LIMIT_OLLAMA = int(os.getenv("LIMIT_OLLAMA", limits_config.get("ollama", 2)))
+# callers allowed to wait per resource, the rest get 429
+LIMIT_QUEUE = int(os.getenv("LIMIT_QUEUE", limits_config.get("max_queue", 32)))
+# seconds to wait for a free slot before giving up with 503
+LIMIT_TIMEOUT = float(os.getenv("LIMIT_TIMEOUT", limits_config.get("timeout", 30)))
+
+# health probes: per probe timeout, background refresh interval (seconds)
+health_config = config.get("health", {})
+HEALTH_TIMEOUT = float(os.getenv("HEALTH_TIMEOUT", health_config.get("timeout", 1)))
+HEALTH_REFRESH_INTERVAL = float(
+    os.getenv("HEALTH_REFRESH_INTERVAL", health_config.get("refresh_interval", 5))
+)
+# last successful Qdrant check, shared with CLI commands for `cache_ttl` seconds
+HEALTH_CACHE_FILE = Path(
+    os.getenv(
+        "HEALTH_CACHE_FILE", health_config.get("cache_file", "./data/health.json")
+    )
+)
+HEALTH_CACHE_TTL = float(
+    os.getenv("HEALTH_CACHE_TTL", health_config.get("cache_ttl", 30))
+)
+
+# request tracing, finished traces are appended to a JSONL file
+tracing_config = config.get("tracing", {})
+TRACE_ENABLED = os.getenv(
+    "TRACE_ENABLED", str(tracing_config.get("enabled", False))
+).lower() in ("1", "true", "yes")
+TRACE_FILE = Path(
+    os.getenv("TRACE_FILE", tracing_config.get("file", "./data/traces.jsonl"))
+)
+# only export traces at least this slow (ms), 0 exports all
+TRACE_MIN_MS = float(os.getenv("TRACE_MIN_MS", tracing_config.get("min_ms", 500)))
+# the trace file is rotated at max_mb, keeping `backups` old files
+TRACE_MAX_MB = float(os.getenv("TRACE_MAX_MB", tracing_config.get("max_mb", 50)))
+TRACE_BACKUPS = int(os.getenv("TRACE_BACKUPS", tracing_config.get("backups", 3)))
+# traces waiting for the writer thread, newer ones are dropped when full
+TRACE_QUEUE_SIZE = int(
+    os.getenv("TRACE_QUEUE_SIZE", tracing_config.get("queue_size", 1000))
+)
+
+# text extraction: an optional guard, files over max_file_mb (0 = no limit,
+# the default) are skipped or sampled (oversize = "skip" | "head" |
+# "head_tail", sample_mb in total)
+text_config = config.get("text", {})
+TEXT_MAX_FILE_MB = float(
+    os.getenv("TEXT_MAX_FILE_MB", text_config.get("max_file_mb", 0))
+)
+TEXT_OVERSIZE = os.getenv("TEXT_OVERSIZE", text_config.get("oversize", "head_tail"))
+TEXT_SAMPLE_MB = float(os.getenv("TEXT_SAMPLE_MB", text_config.get("sample_mb", 8)))
+# files from this size on are read through mmap instead of read() calls
+TEXT_MMAP_MIN_MB = float(
+    os.getenv("TEXT_MMAP_MIN_MB", text_config.get("mmap_min_mb", 4))
+)
+# used when a file is neither UTF-8 nor has a BOM
+TEXT_FALLBACK_ENCODING = os.getenv(
+    "TEXT_FALLBACK_ENCODING", text_config.get("fallback_encoding", "cp1252")
+)
+
+# audio transcription (faster-whisper): up to `workers` files are transcribed
+# at once sharing `cpu_threads` (0 = all cores); transcripts are cached by hash
+audio_config = config.get("audio", {})
+AUDIO_MODEL = os.getenv("AUDIO_MODEL", audio_config.get("model", "small"))
+AUDIO_DEVICE = os.getenv("AUDIO_DEVICE", audio_config.get("device", "auto"))
+# "auto" = float16 on GPU, int8 on CPU
+AUDIO_COMPUTE_TYPE = os.getenv(
+    "AUDIO_COMPUTE_TYPE", audio_config.get("compute_type", "auto")
+)
+AUDIO_BATCH_SIZE = int(
+    os.getenv("AUDIO_BATCH_SIZE", audio_config.get("batch_size", 16))
+)
+AUDIO_WORKERS = int(os.getenv("AUDIO_WORKERS", audio_config.get("workers", 2)))
+AUDIO_CPU_THREADS = int(
+    os.getenv("AUDIO_CPU_THREADS", audio_config.get("cpu_threads", 0))
+)
+AUDIO_CACHE_DIR = Path(
+    os.getenv("AUDIO_CACHE_DIR", audio_config.get("cache_dir", "./data/transcripts"))
+)
+
+# directory walk: .gitignore-style exclude/include patterns (comma separated
+# in env vars), size and age filters, directories listed in parallel
+scan_config = config.get("scan", {})
+
+
+def _patterns(env: str, default: list[str]) -> list[str]:
+    value = os.getenv(env)
+    return [p for p in value.split(",") if p] if value is not None else list(default)
+
+
+SCAN_EXCLUDE = _patterns(
+    "SCAN_EXCLUDE",
+    scan_config.get(
+        "exclude",
+        [".git/", "node_modules/", "__pycache__/", ".venv/", ".tox/", ".*_cache/"],
+    ),
+)
+SCAN_INCLUDE = _patterns("SCAN_INCLUDE", scan_config.get("include", []))
+SCAN_GITIGNORE = os.getenv(
+    "SCAN_GITIGNORE", str(scan_config.get("gitignore", True))
+).lower() in ("1", "true", "yes")
+SCAN_MAX_FILE_MB = float(
+    os.getenv("SCAN_MAX_FILE_MB", scan_config.get("max_file_mb", 0))
+)
+SCAN_MAX_AGE_DAYS = float(
+    os.getenv("SCAN_MAX_AGE_DAYS", scan_config.get("max_age_days", 0))
+)
+SCAN_WORKERS = int(os.getenv("SCAN_WORKERS", scan_config.get("workers", 8)))
+
+# PDF pages are extracted in a process pool, in ranges of pages_per_task
+pdf_config = config.get("pdf", {})
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", pdf_config.get("workers", 0)))
+PDF_PAGES_PER_TASK = int(
+    os.getenv("PDF_PAGES_PER_TASK", pdf_config.get("pages_per_task", 8))
+)
+PDF_PARALLEL_MIN_PAGES = int(
+    os.getenv("PDF_PARALLEL_MIN_PAGES", pdf_config.get("parallel_min_pages", 16))
+)
+
+# near-duplicate chunks (MinHash over word shingles, LSH bands): chunks at
+# least `threshold` similar to a stored one are dropped ("suppress"), stored
+# with a link to it ("link") or kept as is ("off")
+dedup_config = config.get("dedup", {})
+DEDUP_MODE = os.getenv("DEDUP_MODE", dedup_config.get("mode", "link"))
+DEDUP_THRESHOLD = float(
+    os.getenv("DEDUP_THRESHOLD", dedup_config.get("threshold", 0.9))
+)
+DEDUP_SHINGLE_WORDS = int(
+    os.getenv("DEDUP_SHINGLE_WORDS", dedup_config.get("shingle_words", 5))
+)
+DEDUP_NUM_PERM = int(os.getenv("DEDUP_NUM_PERM", dedup_config.get("num_perm", 128)))
+DEDUP_BANDS = int(os.getenv("DEDUP_BANDS", dedup_config.get("bands", 16)))
+# shorter chunks (titles, signatures) are never treated as duplicates
+DEDUP_MIN_WORDS = int(os.getenv("DEDUP_MIN_WORDS", dedup_config.get("min_words", 10)))
+
 DB_PATH = Path(os.path.expanduser(config["storage"]["db_path"]))
 
+# created on first upload, importing the config has no side effects
 UPLOAD_DIR = Path(config["storage"]["upload_dir"])
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -2,15 +2,26 @@ import logging
 from typing import Iterable, Iterator
 
 import numpy as np
-import torch
-from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
-# detect GPU automatically, small embedding model
-device = "cuda" if torch.cuda.is_available() else "cpu"
-model = SentenceTransformer("all-MiniLM-L6-v2", device=device)
+_MODEL = None
+
+
+def get_model():
+    """
+    Load embedding model on first use (detect GPU automatically).
+    """
+    global _MODEL
+    if _MODEL is None:
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        # small embedding model
+        _MODEL = SentenceTransformer("all-MiniLM-L6-v2", device=device)
+    return _MODEL
 
 
 def embed_texts_batch(
@@ -36,18 +47,20 @@ def embed_texts_batch(
     for text in iterator:
         batch.append(text)
         if len(batch) >= batch_size:
-            embeddings = model.encode(
-                batch, convert_to_numpy=True, show_progress_bar=False, device=device
-            ).astype(np.float32)
-            yield embeddings
+            yield _encode(batch)
             batch = []
 
     # flush
     if batch:
-        embeddings = model.encode(
-            batch, convert_to_numpy=True, show_progress_bar=False, device=device
-        ).astype(np.float32)
-        yield embeddings
+        yield _encode(batch)
+
+
+def _encode(batch: list[str]) -> np.ndarray:
+    return (
+        get_model()
+        .encode(batch, convert_to_numpy=True, show_progress_bar=False)
+        .astype(np.float32)
+    )
 
 
 def get_dimension() -> int:
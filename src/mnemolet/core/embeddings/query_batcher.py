@@ -0,0 +1,111 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from mnemolet.config import QUERY_BATCH_SIZE, QUERY_BATCH_WAIT_MS
+from mnemolet.core.utils.metrics import CACHE_REQUESTS, QUERY_BATCH_QUERIES
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBatcher:
+    """
+    Coalesce concurrent query encodes into one batched model.encode call.
+    - the first waiting query opens a window of `max_wait_ms`; every query
+      arriving within the window (up to `max_batch`) is encoded together.
+    """
+
+    def __init__(
+        self,
+        model,
+        max_batch: int = QUERY_BATCH_SIZE,
+        max_wait_ms: float = QUERY_BATCH_WAIT_MS,
+    ):
+        self.model = model
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: queue.Queue[tuple[str, Future]] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.queries = 0
+
+    def encode(self, query: str) -> np.ndarray:
+        """
+        Return embedding for a single query, blocking until it's ready.
+        """
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((query, future))
+        return future.result()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="query-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        # window is over, take only what is already waiting
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._encode_batch(batch)
+
+    def _encode_batch(self, batch: list[tuple[str, Future]]):
+        texts = [query for query, _ in batch]
+        logger.debug(f"[batcher] encoding batch of {len(texts)} queries")
+        QUERY_BATCH_QUERIES.observe(len(texts))
+
+        try:
+            vectors = self.model.encode(
+                texts, convert_to_numpy=True, show_progress_bar=False
+            )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.queries += len(texts)
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
+
+_BATCHERS: dict[str, QueryBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_query_batcher(model_name: str) -> QueryBatcher:
+    """
+    Return process-wide batcher (and loaded model) for the given model name.
+    """
+    with _batchers_lock:
+        cached = model_name in _BATCHERS
+        CACHE_REQUESTS.inc(cache="query_model", result="hit" if cached else "miss")
+        if not cached:
+            from sentence_transformers import SentenceTransformer
+
+            logger.info(f"Loading query embedding model {model_name}..")
+            _BATCHERS[model_name] = QueryBatcher(SentenceTransformer(model_name))
+        return _BATCHERS[model_name]
@@ -1,16 +1,213 @@
-from mnemolet.core.utils.qdrant import QdrantManager
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from urllib.request import urlopen
+
+from mnemolet.config import (
+    HEALTH_CACHE_FILE,
+    HEALTH_CACHE_TTL,
+    HEALTH_REFRESH_INTERVAL,
+    HEALTH_TIMEOUT,
+    OLLAMA_URL,
+    QDRANT_URL,
+)
 
 from .ollama import get_ollama_status
 from .system import get_cpu_stats, get_memory_stats, get_python_version
 
+logger = logging.getLogger(__name__)
+
+
+def _probe(fn, *args) -> Future:
+    """
+    Run fn in a daemon thread: a probe hanging on a dead host never blocks
+    the caller past its timeout, nor the interpreter exit.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="health-probe", daemon=True).start()
+    return future
+
+
+def _check_qdrant(qdrant_url: str) -> bool:
+    """
+    Probe Qdrant's /healthz over plain HTTP, importing qdrant_client costs
+    more than the check itself (matters for every CLI command).
+    """
+    if not qdrant_url.startswith(("http://", "https://")):
+        # local mode (":memory:" or a path) runs in-process
+        from mnemolet.core.utils.qdrant import QdrantManager
+
+        return QdrantManager(qdrant_url).check_qdrant_status()
+
+    try:
+        with urlopen(f"{qdrant_url.rstrip('/')}/healthz", timeout=HEALTH_TIMEOUT):
+            return True
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not connect to Qdrant at {qdrant_url}: {e}")
+        return False
 
-def get_status(qdrant_url: str, ollama_url: str) -> dict:
-    qm = QdrantManager(qdrant_url)
 
-    return {
-        "qdrant": qm.check_qdrant_status(),
-        "ollama": get_ollama_status(ollama_url),
+def get_status(
+    qdrant_url: str, ollama_url: str, timeout: float = HEALTH_TIMEOUT
+) -> dict:
+    """
+    Check Qdrant, Ollama and system stats concurrently.
+    - a probe that does not answer within `timeout` seconds counts as down.
+    """
+    qdrant = _probe(_check_qdrant, qdrant_url)
+    ollama = _probe(get_ollama_status, ollama_url, timeout)
+
+    # cheap local stats run here while the network probes are in flight
+    status = {
         "python_version": get_python_version(),
         "memory": get_memory_stats(),
         "cpu": get_cpu_stats(),
     }
+
+    deadline = time.monotonic() + timeout
+    status["qdrant"] = _result(qdrant, deadline, False, "Qdrant")
+    status["ollama"] = _result(
+        ollama, deadline, {"running": False, "version": None}, "Ollama"
+    )
+    status["checked_at"] = time.time()
+
+    if status["qdrant"]:
+        _write_qdrant_cache(qdrant_url, status["checked_at"])
+
+    return status
+
+
+def _result(future, deadline: float, default, name: str):
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeout:
+        logger.warning(f"{name} health check timed out")
+    except Exception as e:
+        logger.warning(f"{name} health check failed: {e}")
+    return default
+
+
+class HealthMonitor:
+    """
+    Refresh health status in a background thread, so readers never wait
+    on a slow or dead dependency.
+    """
+
+    def __init__(
+        self,
+        qdrant_url: str,
+        ollama_url: str,
+        interval: float = HEALTH_REFRESH_INTERVAL,
+        timeout: float = HEALTH_TIMEOUT,
+    ):
+        self.qdrant_url = qdrant_url
+        self.ollama_url = ollama_url
+        self.interval = interval
+        self.timeout = timeout
+        self._status: dict | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="health-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self) -> dict:
+        status = get_status(self.qdrant_url, self.ollama_url, self.timeout)
+        with self._lock:
+            self._status = status
+        return status
+
+    def get(self) -> dict:
+        """
+        Return the last status; checks once (bounded by timeout) if there is none.
+        """
+        with self._lock:
+            status = self._status
+        if status is None:
+            status = self.refresh()
+        return {**status, "age_seconds": round(time.time() - status["checked_at"], 3)}
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Health refresh failed: {e}")
+            self._stop.wait(self.interval)
+
+
+_MONITOR: HealthMonitor | None = None
+_monitor_lock = threading.Lock()
+
+
+def get_health_monitor() -> HealthMonitor:
+    """
+    Return process-wide health monitor for the configured services.
+    """
+    global _MONITOR
+    with _monitor_lock:
+        if _MONITOR is None:
+            _MONITOR = HealthMonitor(QDRANT_URL, OLLAMA_URL)
+        return _MONITOR
+
+
+def _write_qdrant_cache(qdrant_url: str, checked_at: float):
+    """
+    Remember the last successful Qdrant check for other processes (CLI).
+    """
+    try:
+        HEALTH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = HEALTH_CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"qdrant_url": qdrant_url, "ok_at": checked_at}))
+        tmp.replace(HEALTH_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write health cache: {e}")
+
+
+def qdrant_recently_ok(qdrant_url: str, ttl: float = HEALTH_CACHE_TTL) -> bool:
+    """
+    True if Qdrant at qdrant_url passed a check in the last `ttl` seconds.
+    """
+    try:
+        data = json.loads(HEALTH_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    return (
+        data.get("qdrant_url") == qdrant_url
+        and time.time() - data.get("ok_at", 0) < ttl
+    )
+
+
+def check_qdrant(qdrant_url: str, timeout: float = HEALTH_TIMEOUT) -> bool:
+    """
+    Cached Qdrant check for CLI commands: trust a recent success, otherwise
+    probe with a timeout (and cache the result if it passed).
+    """
+    if qdrant_recently_ok(qdrant_url):
+        return True
+    deadline = time.monotonic() + timeout
+    ok = _result(_probe(_check_qdrant, qdrant_url), deadline, False, "Qdrant")
+    if ok:
+        _write_qdrant_cache(qdrant_url, time.time())
+    return ok
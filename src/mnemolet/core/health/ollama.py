@@ -1,11 +1,9 @@
 import logging
 
-import requests
-
 logger = logging.getLogger(__name__)
 
 
-def get_ollama_status(ollama_url: str) -> dict:
+def get_ollama_status(ollama_url: str, timeout: float = 1) -> dict:
     """
     Returns:
         {
@@ -13,9 +11,11 @@ def get_ollama_status(ollama_url: str) -> dict:
             "version": str | None
         }
     """
+    import requests
+
     try:
         url = f"{ollama_url}/api/version"
-        x = requests.get(url, timeout=1)
+        x = requests.get(url, timeout=timeout)
         if x.status_code == 200:
             data = x.json()
             return {
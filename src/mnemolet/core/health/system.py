@@ -21,8 +21,15 @@ def get_memory_stats() -> dict:
 
 
 def get_cpu_stats() -> dict:
+    """
+    CPU usage since the previous call (non-blocking) and load average.
+    """
     load = [round(x, 2) for x in psutil.getloadavg()]
     return {
-        "usage_percent": psutil.cpu_percent(interval=0.2),
+        "usage_percent": psutil.cpu_percent(interval=None),
         "load_avg": load,
     }
+
+
+# the first non-blocking cpu_percent call has no baseline and returns 0.0
+psutil.cpu_percent(interval=None)
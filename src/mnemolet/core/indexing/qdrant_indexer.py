@@ -2,18 +2,19 @@ import logging
 import uuid
 
 import numpy as np
-from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, PointStruct, VectorParams
 
+from mnemolet.core.utils.qdrant import OPTIONAL_FIELDS, get_qdrant_client
+
 logger = logging.getLogger(__name__)
 
 
 class QdrantIndexer:
     def __init__(self, qdrant_url: str, collection_name: str):
         """
-        Init Qdrant client using config.toml.
+        Init Qdrant indexer on top of the shared client (see config.toml).
         """
-        self.client = QdrantClient(url=qdrant_url)
+        self.client = get_qdrant_client(qdrant_url)
         self.collection_name = collection_name
 
     def init_collection(self, vector_size: int = 384):
@@ -44,9 +45,16 @@ class QdrantIndexer:
     ):
         """
         Store text embeddings in Qdrant.
+        - page_start/page_end of chunks from paged documents and the duplicate_of
+          link of near-duplicate chunks are stored too.
         """
         payloads = [
-            {"path": m["path"], "hash": m["hash"], "text": chunk}
+            {
+                "path": m["path"],
+                "hash": m["hash"],
+                "text": chunk,
+                **{k: m[k] for k in OPTIONAL_FIELDS if k in m},
+            }
             for m, chunk in zip(metadata, chunks)
         ]
 
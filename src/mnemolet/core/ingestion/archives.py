@@ -0,0 +1,101 @@
+import hashlib
+import logging
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIXES = (
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tbz2",
+    ".tar.xz",
+    ".txz",
+)
+# tracked path of a member: <archive path>!<member name>
+MEMBER_SEPARATOR = "!"
+COPY_BLOCK = 1024 * 1024
+
+
+def is_archive(path: Path) -> bool:
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def member_path(archive: Path | str, member: str) -> str:
+    return f"{archive}{MEMBER_SEPARATOR}{member}"
+
+
+class MemberFile(tempfile.SpooledTemporaryFile):
+    """
+    Copy of an archive member, in memory up to max_size bytes (on disk past
+    it); `name` is the member path, "archive!member".
+    """
+
+    def __init__(self, name: str, max_size: int):
+        super().__init__(max_size=max_size)
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+def iter_members(archive: Path) -> Iterator[tuple[str, int, BinaryIO]]:
+    """
+    Yield (name, size, stream) of the regular files in an archive, in archive
+    order, without extracting it. A stream is only valid until the next one.
+    - tar archives (compressed or not) are read in one pass, as a stream.
+    """
+    if archive.name.lower().endswith(".zip"):
+        with zipfile.ZipFile(archive) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                with zf.open(info) as stream:
+                    yield info.filename, info.file_size, stream
+        return
+
+    with tarfile.open(archive, mode="r|*") as tf:
+        for member in tf:
+            if not member.isfile():
+                continue
+            stream = tf.extractfile(member)
+            yield member.name, member.size, stream
+
+
+class MemberTooLarge(ValueError):
+    pass
+
+
+def spool_member(
+    name: str, stream: BinaryIO, max_size: int, max_bytes: int = 0
+) -> tuple[MemberFile, str]:
+    """
+    Copy a member stream into a MemberFile while hashing it.
+    Return the file (rewound) and the SHA256 of its content.
+    - past `max_bytes` (0 = no limit) of unpacked content the copy stops with
+      MemberTooLarge: the bytes read are counted, sizes in headers can lie.
+    """
+    hasher = hashlib.sha256()
+    spool = MemberFile(name, max_size)
+    copied = 0
+    try:
+        while block := stream.read(COPY_BLOCK):
+            copied += len(block)
+            if max_bytes and copied > max_bytes:
+                raise MemberTooLarge(
+                    f"unpacks to more than {max_bytes / 1024**2:.0f} MB"
+                )
+            hasher.update(block)
+            spool.write(block)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool, hasher.hexdigest()
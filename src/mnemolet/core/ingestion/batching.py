@@ -0,0 +1,137 @@
+import logging
+
+import psutil
+
+from mnemolet.config import (
+    BATCH_SIZE_MAX,
+    BATCH_SIZE_MIN,
+    BATCH_TARGET_SECONDS,
+    INGEST_MEMORY_LIMIT_MB,
+)
+
+logger = logging.getLogger(__name__)
+
+# grow while RSS stays below this share of the limit
+SOFT_LIMIT = 0.8
+GROW_FACTOR = 1.5
+# a bigger batch that is this much slower per chunk is not worth it
+REGRESSION = 0.9
+# check memory while a batch fills up every N chunks
+CHECK_EVERY = 16
+
+
+def _memory_limit(limit_mb: float) -> int:
+    """
+    Limit in bytes; 0 means half of the physical memory.
+    """
+    if limit_mb > 0:
+        return int(limit_mb * 1024**2)
+    return psutil.virtual_memory().total // 2
+
+
+class AdaptiveBatchController:
+    """
+    Pick the number of chunks per embed + store batch from observed
+    throughput and process memory.
+    - grows the batch while batches are fast, throughput improves and RSS
+      stays below the soft limit.
+    - halves it when RSS crosses the memory limit, shrinks it when a batch
+      takes longer than `target_seconds`.
+    - a growth step that lowers throughput is undone and not retried.
+    - with `adaptive=False` the size stays fixed, only memory is tracked.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_size: int = BATCH_SIZE_MIN,
+        max_size: int = BATCH_SIZE_MAX,
+        memory_limit_mb: float = INGEST_MEMORY_LIMIT_MB,
+        target_seconds: float = BATCH_TARGET_SECONDS,
+        adaptive: bool = True,
+    ):
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.size = min(max(initial, self.min_size), self.max_size)
+        self.memory_limit = _memory_limit(memory_limit_mb)
+        self.target_seconds = target_seconds
+        self.adaptive = adaptive
+        self.peak_rss = 0
+        self.batches = 0
+        self.adjustments = 0
+        self._process = psutil.Process()
+        # (size, chunks/sec) before the last growth step
+        self._before_growth: tuple[int, float] | None = None
+        self._cap = self.max_size
+
+    def rss(self) -> int:
+        rss = self._process.memory_info().rss
+        self.peak_rss = max(self.peak_rss, rss)
+        return rss
+
+    def should_flush(self, pending: int) -> bool:
+        """
+        True if the pending chunks should be embedded and stored now.
+        """
+        if pending >= self.size:
+            return True
+        if pending % CHECK_EVERY == 0 and self.rss() > self.memory_limit:
+            logger.info(f"[batch] memory limit reached with {pending} pending chunks")
+            return True
+        return False
+
+    def record(self, items: int, seconds: float):
+        """
+        Adjust the batch size after a batch of `items` took `seconds`.
+        """
+        self.batches += 1
+        rss = self.rss()
+        if not self.adaptive or items == 0:
+            return
+
+        throughput = items / max(seconds, 1e-9)
+        full = items >= self.size
+        old = self.size
+
+        if rss > self.memory_limit:
+            self._cap = max(self.min_size, self.size // 2)
+            self._resize(self.size // 2, f"rss {rss / 1024**2:.0f} MB over limit")
+        elif seconds > self.target_seconds:
+            self._resize(int(self.size * 0.75), f"batch took {seconds:.2f}s")
+        elif (
+            full
+            and self._before_growth is not None
+            and throughput < self._before_growth[1] * REGRESSION
+        ):
+            size, _ = self._before_growth
+            self._cap = size
+            self._resize(size, f"throughput dropped to {throughput:.0f} chunks/s")
+        elif full and rss < self.memory_limit * SOFT_LIMIT and self.size < self._cap:
+            self._before_growth = (self.size, throughput)
+            self._resize(
+                min(max(int(self.size * GROW_FACTOR), self.size + 1), self._cap),
+                f"{throughput:.0f} chunks/s",
+            )
+            return
+
+        # the last growth step was either undone or confirmed by a full batch
+        if self.size != old or full:
+            self._before_growth = None
+
+    def _resize(self, size: int, reason: str):
+        size = min(max(size, self.min_size), self.max_size)
+        if size == self.size:
+            return
+        logger.info(f"[batch] {self.size} -> {size} chunks ({reason})")
+        self.size = size
+        self.adjustments += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "adaptive": self.adaptive,
+            "final_size": self.size,
+            "batches": self.batches,
+            "adjustments": self.adjustments,
+            "peak_rss_mb": round(self.peak_rss / 1024**2, 1),
+            "memory_limit_mb": round(self.memory_limit / 1024**2, 1),
+        }
@@ -0,0 +1,238 @@
+import logging
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+
+import numpy as np
+
+from mnemolet.config import (
+    DEDUP_BANDS,
+    DEDUP_MIN_WORDS,
+    DEDUP_MODE,
+    DEDUP_NUM_PERM,
+    DEDUP_SHINGLE_WORDS,
+    DEDUP_THRESHOLD,
+)
+from mnemolet.core.storage.db_tracker import DBTracker
+
+logger = logging.getLogger(__name__)
+
+DEDUP_MODES = ("suppress", "link", "off")
+# MinHash permutations are (a * x + b) mod PRIME over 31-bit shingle hashes,
+# so every product fits in uint64
+PRIME = np.uint64(2**31 - 1)
+SEED = 1
+
+_WORDS = re.compile(r"\w+")
+
+
+def shingle_hashes(text: str, size: int) -> np.ndarray:
+    """
+    Return the distinct hashes of the `size`-word shingles of a text
+    (lowercased, punctuation and spacing ignored).
+    """
+    words = _WORDS.findall(text.lower())
+    shingles = {
+        " ".join(words[i : i + size]) for i in range(max(1, len(words) - size + 1))
+    }
+    return np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+class MinHasher:
+    """
+    MinHash signatures of word shingles: the share of equal positions in
+    two signatures estimates the Jaccard similarity of the shingle sets.
+    Seeded, so signatures stay comparable across runs.
+    """
+
+    def __init__(
+        self, num_perm: int = DEDUP_NUM_PERM, shingle_words: int = DEDUP_SHINGLE_WORDS
+    ):
+        rng = np.random.default_rng(SEED)
+        self.a = rng.integers(1, PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, PRIME, size=num_perm, dtype=np.uint64)
+        self.shingle_words = shingle_words
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = shingle_hashes(text, self.shingle_words) % PRIME
+        perms = (np.outer(self.a, hashes) + self.b[:, None]) % PRIME
+        return perms.min(axis=1).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.mean(a == b))
+
+
+@dataclass(frozen=True)
+class ChunkRef:
+    path: str
+    hash: str
+    position: int
+
+
+@dataclass(frozen=True)
+class Duplicate:
+    original: ChunkRef
+    similarity: float
+
+
+class NearDuplicateFilter:
+    """
+    Find chunks that are near-duplicates of chunks already stored in a
+    collection (license headers, email footers, templated reports).
+    - signatures are split in `bands`; chunks sharing a band are candidates,
+      kept if their estimated similarity reaches `threshold`.
+    - candidates are looked up per chunk in the tracker's band index, so a
+      run costs the same whatever the size of the collection; the new
+      signatures and the duplicates found are written back by `flush()`,
+      after their batch is stored (until then they are matched in memory).
+    - a chunk is never a duplicate of an older version of its own file.
+    """
+
+    def __init__(
+        self,
+        tracker: DBTracker,
+        collection: str,
+        mode: str = DEDUP_MODE,
+        threshold: float = DEDUP_THRESHOLD,
+        shingle_words: int = DEDUP_SHINGLE_WORDS,
+        num_perm: int = DEDUP_NUM_PERM,
+        bands: int = DEDUP_BANDS,
+        min_words: int = DEDUP_MIN_WORDS,
+    ):
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"Unknown dedup mode {mode!r}, expected {DEDUP_MODES}")
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands")
+        self.tracker = tracker
+        self.collection = collection
+        self.mode = mode
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.min_words = min_words
+        self.hasher = MinHasher(num_perm, shingle_words)
+        self.checked = 0
+        self.suppressed = 0
+        self.linked = 0
+
+        self._positions: dict[tuple[str, str], int] = {}
+        # signatures not flushed yet, with their band buckets
+        self._pending: list[tuple[ChunkRef, np.ndarray]] = []
+        self._buckets: dict[tuple[int, bytes], list[int]] = defaultdict(list)
+        self._new_signatures: list[tuple] = []
+        self._new_duplicates: list[tuple[str, str, int, str, str, int, float, str]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def check(self, path: str, file_hash: str, chunk: str) -> Duplicate | None:
+        """
+        Return the stored chunk this one nearly duplicates, if any; unique
+        chunks are added to the index.
+        """
+        key = (path, file_hash)
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        ref = ChunkRef(path, file_hash, position)
+        if not self.enabled:
+            return None
+        if len(_WORDS.findall(chunk)) < self.min_words:
+            return None
+
+        self.checked += 1
+        signature = self.hasher.signature(chunk)
+        keys = self._bands(signature)
+        if duplicate := self._match(ref, signature, keys):
+            self._new_duplicates.append(
+                (
+                    path,
+                    file_hash,
+                    position,
+                    duplicate.original.path,
+                    duplicate.original.hash,
+                    duplicate.original.position,
+                    duplicate.similarity,
+                    self.mode,
+                )
+            )
+            if self.mode == "suppress":
+                self.suppressed += 1
+                return duplicate
+            self.linked += 1
+        for key in keys:
+            self._buckets[key].append(len(self._pending))
+        self._pending.append((ref, signature))
+        self._new_signatures.append(
+            (path, file_hash, position, signature.tobytes(), keys)
+        )
+        return duplicate
+
+    def flush(self):
+        """
+        Record the new signatures and duplicates in the tracker.
+        """
+        if self._new_signatures:
+            self.tracker.add_chunk_signatures(self.collection, self._new_signatures)
+            self._new_signatures = []
+            self._pending = []
+            self._buckets.clear()
+        if self._new_duplicates:
+            self.tracker.add_near_duplicates(self.collection, self._new_duplicates)
+            self._new_duplicates = []
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "threshold": self.threshold,
+            "checked": self.checked,
+            "suppressed": self.suppressed,
+            "linked": self.linked,
+        }
+
+    def _bands(self, signature: np.ndarray) -> list[tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows : (band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _candidates(self, keys: list[tuple[int, bytes]]):
+        """
+        Yield stored and pending chunks sharing a band with keys.
+        """
+        for path, file_hash, position, blob in self.tracker.find_chunk_signatures(
+            self.collection, keys
+        ):
+            yield (
+                ChunkRef(path, file_hash, position),
+                np.frombuffer(blob, dtype=np.uint32),
+            )
+        seen = set()
+        for key in keys:
+            for index in self._buckets.get(key, ()):
+                if index not in seen:
+                    seen.add(index)
+                    yield self._pending[index]
+
+    def _match(
+        self, ref: ChunkRef, signature: np.ndarray, keys: list[tuple[int, bytes]]
+    ) -> Duplicate | None:
+        """
+        Helper fn to find the most similar candidate at or over threshold.
+        """
+        best = None
+        for original, candidate in self._candidates(keys):
+            if len(candidate) != len(signature):
+                continue
+            if original.path == ref.path and original.hash != ref.hash:
+                continue
+            score = similarity(signature, candidate)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (original, score)
+        return Duplicate(*best) if best else None
@@ -1,65 +1,171 @@
+import json
 import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator
 
-import torch
-from faster_whisper import BatchedInferencePipeline, WhisperModel
-
-from mnemolet.core.ingestion.extractors.base import Extractor
+from mnemolet.config import (
+    AUDIO_BATCH_SIZE,
+    AUDIO_CACHE_DIR,
+    AUDIO_COMPUTE_TYPE,
+    AUDIO_CPU_THREADS,
+    AUDIO_DEVICE,
+    AUDIO_MODEL,
+    AUDIO_WORKERS,
+)
+from mnemolet.core.ingestion.extractors.base import Extractor, Source, source_name
+from mnemolet.core.utils.metrics import CACHE_REQUESTS
+from mnemolet.core.utils.utils import hash_file
 
 logger = logging.getLogger(__name__)
 
 
 class AudioExtractor(Extractor):
-    extensions = {".wav", ".mp3"}
+    """
+    Transcribe audio with faster-whisper.
+    - files handed to prefetch() are transcribed in a pool of `workers`
+      threads while other files are processed.
+    - transcripts are cached by file hash and model, unchanged audio is
+      never transcribed twice.
+    """
 
-    def __init__(self, model_size="small", buffer_limit=15000):
+    extensions = {".wav", ".mp3"}
+    requires = ("torch", "faster_whisper")
+
+    def __init__(
+        self,
+        model_size: str = AUDIO_MODEL,
+        buffer_limit: int = 15000,
+        device: str = AUDIO_DEVICE,
+        compute_type: str = AUDIO_COMPUTE_TYPE,
+        batch_size: int = AUDIO_BATCH_SIZE,
+        workers: int = AUDIO_WORKERS,
+        cpu_threads: int = AUDIO_CPU_THREADS,
+        cache_dir: Path | None = AUDIO_CACHE_DIR,
+    ):
         super().__init__()  # init from base
 
+        import torch
+        from faster_whisper import BatchedInferencePipeline, WhisperModel
+
         logger.info(f"[audio] Init Whisper model size='{model_size}'")
 
-        if torch.cuda.is_available():
-            device = "cuda"
-            compute_type = "float16"
-        else:
-            device = "cpu"
-            compute_type = "int8"
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        if compute_type == "auto":
+            compute_type = "float16" if device == "cuda" else "int8"
 
-        logger.info(f"[audio] Using device='{device}'")
+        self.workers = max(1, workers)
+        # split the CPU budget between concurrent transcriptions
+        cpu_threads = cpu_threads or os.cpu_count() or 1
+        threads_per_worker = max(1, cpu_threads // self.workers)
+
+        logger.info(
+            f"[audio] Using device='{device}' compute_type='{compute_type}' "
+            f"workers={self.workers} cpu_threads={threads_per_worker}/worker"
+        )
 
-        self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        self.model_size = model_size
+        self.model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=threads_per_worker,
+            num_workers=self.workers,
+        )
         self.pipeline = BatchedInferencePipeline(model=self.model)
+        self.batch_size = batch_size
         # number of chars to accumulate before yeilding
         self.buffer_limit = buffer_limit
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
-    def extract(self, file: Path) -> Iterator[str]:
-        logger.info(f"[audio] Starting transcription: {file}'")
-
-        segments, info = self.pipeline.transcribe(str(file), batch_size=16)
-
-        logger.info(
-            f"[audio] Language: {info.language}'[audio] Duration: {info.duration:.2f}s'"
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="audio"
         )
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, file: Source, file_hash: str | None = None):
+        """
+        Start transcribing file in the background.
+        """
+        with self._lock:
+            if str(file) not in self._pending:
+                self._pending[str(file)] = self._executor.submit(
+                    self._transcript, file, file_hash
+                )
+
+    def cancel_prefetch(self, file: Source):
+        with self._lock:
+            future = self._pending.pop(str(file), None)
+        if future is not None:
+            future.cancel()
+
+    def extract(self, file: Source) -> Iterator[str]:
+        with self._lock:
+            future = self._pending.pop(str(file), None)
+        segments = future.result() if future else self._transcript(file)
 
         buffer = ""
 
-        for i, segment in enumerate(segments):
-            buffer += segment.text.strip() + " "
+        for text in segments:
+            buffer += text.strip() + " "
 
             if len(buffer) >= self.buffer_limit:
-                logger.warning(f"[audio] yielding buffer block: len={len(buffer)}")
-                logger.debug(buffer[:300])  # preview first 300 chars
+                logger.debug(f"[audio] yielding buffer block: len={len(buffer)}")
                 yield buffer
                 buffer = ""
         if buffer:
-            logger.warning(f"[audio] yielding FINALbuffer block: len={len(buffer)}")
-            logger.debug(buffer[:300])  # preview first 300 chars
+            logger.debug(f"[audio] yielding final buffer block: len={len(buffer)}")
             yield buffer
 
-            """
-            for i in range(0, len(text), self.chunk_size):
-                print(f"TEXT with chunk: {text}")
-                yield text[i : i + self.chunk_size]
-            """
+    def _transcript(self, file: Source, file_hash: str | None = None) -> list[str]:
+        """
+        Return segment texts of file, from the cache if possible
+        (streams are only cached when their hash is given).
+        """
+        if self.cache_dir is not None and file_hash is None and isinstance(file, Path):
+            file_hash = hash_file(file)
+        cache_file = None
+        if self.cache_dir is not None and file_hash is not None:
+            cache_file = self.cache_dir / f"{file_hash}.{self.model_size}.json"
+            try:
+                data = json.loads(cache_file.read_text(encoding="utf-8"))
+                CACHE_REQUESTS.inc(cache="transcript", result="hit")
+                logger.info(f"[audio] Cached transcript: {source_name(file)}")
+                return data["segments"]
+            except (OSError, ValueError, KeyError):
+                CACHE_REQUESTS.inc(cache="transcript", result="miss")
+
+        name = source_name(file)
+        logger.info(f"[audio] Starting transcription: {name}")
+        audio = str(file) if isinstance(file, Path) else file
+        segments, info = self.pipeline.transcribe(audio, batch_size=self.batch_size)
+        texts = [segment.text for segment in segments]
+        logger.info(
+            f"[audio] Finished transcription: {name} "
+            f"(language={info.language}, duration={info.duration:.2f}s)"
+        )
 
-        logger.info(f"[audio] Finished transcription: {file}")
+        if cache_file is not None:
+            self._write_cache(cache_file, texts, info.language, info.duration)
+        return texts
+
+    def _write_cache(
+        self, cache_file: Path, texts: list[str], language: str, duration: float
+    ):
+        data = {
+            "model": self.model_size,
+            "language": language,
+            "duration": duration,
+            "segments": texts,
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".tmp{threading.get_ident()}")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(cache_file)
+        except OSError as e:
+            logger.warning(f"[audio] Could not cache transcript: {e}")
@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Iterator
+from typing import BinaryIO, Iterator
 
 from mnemolet.config import CHUNK_SIZE
 
@@ -8,14 +8,74 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CHUNK_SIZE = 1024 * 1024
 
+# what extractors read: a file, or an open binary stream with a `name`
+# (e.g. an archive member "archive.zip!docs/a.txt")
+Source = Path | BinaryIO
+
+
+def source_name(source: Source) -> str:
+    return str(source) if isinstance(source, Path) else source.name
+
+
+def source_suffix(source: Source) -> str:
+    return Path(source_name(source)).suffix.lower()
+
+
+class PageText(str):
+    """
+    A part of a paged document; `page` is its 1-based page number and ends
+    up in the payload of the chunks made from it.
+    """
+
+    page: int
+
+    def __new__(cls, text: str, page: int):
+        part = super().__new__(cls, text)
+        part.page = page
+        return part
+
+
+class HeadingText(str):
+    """
+    A heading of a structured document, `level` 1 is the top level.
+    Chunks start at headings where they can.
+    """
+
+    level: int
+
+    def __new__(cls, text: str, level: int):
+        part = super().__new__(cls, text)
+        part.level = level
+        return part
+
+
+class RowGroup(str):
+    """
+    Rows of a table, one per line, after their `header` line. Groups bigger
+    than a run's chunk size are split again under the same header.
+    """
+
+    header: str
+
+    def __new__(cls, text: str, header: str):
+        part = super().__new__(cls, text)
+        part.header = header
+        return part
+
 
 class Extractor:
     """
     Base extractor class.
     All extractors must define supported extensions and implement extract().
+    - `requires` lists optional modules the extractor needs; they are
+      imported inside the extractor, so registering it costs nothing.
+    - `records` extractors yield whole records (rows, JSON objects); chunks
+      pack them without cutting one in two.
     """
 
     extensions: set[str] = set()
+    requires: tuple[str, ...] = ()
+    records: bool = False
 
     def __init__(self, chunk_size: int | None = None):
         if chunk_size is not None:
@@ -31,8 +91,25 @@ class Extractor:
                 f"Using default chunk size: {self.chunk_size}"
             )
 
-    def extract(self, file: Path) -> Iterator[str]:
+    @property
+    def prefetches(self) -> bool:
+        """
+        True if the extractor does background work in prefetch().
+        """
+        return type(self).prefetch is not Extractor.prefetch
+
+    def prefetch(self, file: Source, file_hash: str | None = None):
+        """
+        Hint that file will be extracted soon; slow extractors may start now.
+        """
+
+    def cancel_prefetch(self, file: Source):
+        """
+        Drop a prefetched file that will not be extracted after all.
+        """
+
+    def extract(self, file: Source) -> Iterator[str]:
         """
-        Yield text chunks from file.
+        Yield text chunks from a file or a binary stream.
         """
         raise NotImplementedError("Subclasses must implement extract()")
@@ -0,0 +1,105 @@
+import csv
+import logging
+import sys
+import threading
+from typing import Iterator
+
+from mnemolet.config import SIZE_CHARS
+from mnemolet.core.ingestion.extractors.base import (
+    Extractor,
+    RowGroup,
+    Source,
+    source_name,
+    source_suffix,
+)
+from mnemolet.core.ingestion.extractors.text_extractor import open_text
+
+logger = logging.getLogger(__name__)
+
+CELL_SEPARATOR = " | "
+# bytes handed to csv.Sniffer to guess the delimiter of .csv files
+SNIFF_CHARS = 16 * 1024
+
+# cells of a few MB (embedded documents) should not stop the file
+FIELD_SIZE_LIMIT = min(sys.maxsize, 2**31 - 1)
+
+# csv.field_size_limit is process-wide: it is raised only while a row is
+# parsed, one reader at a time, and restored right after
+_field_limit_lock = threading.Lock()
+
+
+class CsvExtractor(Extractor):
+    """
+    Extract CSV/TSV files as row groups, read row by row.
+    - every group starts with the header row and holds as many rows as fit
+      in `group_chars` (one chunk), so each chunk says what its columns are;
+      runs with smaller chunks split the groups again (RecordChunker).
+    - the delimiter of .csv files is sniffed, .tsv files use tabs.
+    """
+
+    extensions = {".csv", ".tsv"}
+    records = True
+
+    def __init__(self, chunk_size: int | None = None, group_chars: int = SIZE_CHARS):
+        super().__init__(chunk_size)
+        self.group_chars = group_chars
+
+    def extract(self, file: Source) -> Iterator[str]:
+        f = open_text(file)
+        if f is None:
+            return
+        with f:
+            reader = _rows(csv.reader(f, dialect=self._dialect(file, f)))
+            header = next(reader, None)
+            if header is None:
+                return
+            header_line = CELL_SEPARATOR.join(cell.strip() for cell in header)
+
+            group = [header_line]
+            size = len(header_line)
+            for row in reader:
+                if not any(cell.strip() for cell in row):
+                    continue
+                line = CELL_SEPARATOR.join(cell.strip() for cell in row)
+                if len(group) > 1 and size + 1 + len(line) > self.group_chars:
+                    yield RowGroup("\n".join(group), header_line)
+                    group = [header_line]
+                    size = len(header_line)
+                group.append(line)
+                size += 1 + len(line)
+            if len(group) > 1:
+                yield RowGroup("\n".join(group), header_line)
+            elif header_line:
+                # header only: still worth indexing
+                yield header_line
+
+    def _dialect(self, file: Source, f) -> type[csv.Dialect] | csv.Dialect:
+        """
+        Helper fn to pick the dialect: tabs for .tsv, sniffed for .csv.
+        """
+        if source_suffix(file) == ".tsv":
+            return csv.excel_tab
+        sample = f.read(SNIFF_CHARS)
+        f.seek(0)
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=",;\t|")
+        except csv.Error:
+            logger.debug(f"[csv] Could not sniff dialect of {source_name(file)}")
+            return csv.excel
+
+
+def _rows(reader) -> Iterator[list[str]]:
+    """
+    Helper fn to read rows with FIELD_SIZE_LIMIT, leaving the process-wide
+    limit as it was for any other csv user.
+    """
+    while True:
+        with _field_limit_lock:
+            previous = csv.field_size_limit(FIELD_SIZE_LIMIT)
+            try:
+                row = next(reader, None)
+            finally:
+                csv.field_size_limit(previous)
+        if row is None:
+            return
+        yield row
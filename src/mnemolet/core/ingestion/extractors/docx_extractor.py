@@ -1,12 +1,11 @@
-from pathlib import Path
 from typing import Iterator
 
-from mnemolet.core.ingestion.extractors.base import Extractor
+from mnemolet.core.ingestion.extractors.base import Extractor, Source
 from mnemolet.core.ingestion.loaders.docx_loader import extract_docx
 
 
 class DocxExtractor(Extractor):
     extensions = {".docx"}
 
-    def extract(self, file: Path) -> Iterator[str]:
+    def extract(self, file: Source) -> Iterator[str]:
         yield from extract_docx(file, self.chunk_size)
@@ -0,0 +1,111 @@
+import re
+from html.parser import HTMLParser
+from typing import Iterator
+
+from mnemolet.core.ingestion.extractors.base import Extractor, Source
+from mnemolet.core.ingestion.extractors.text_extractor import open_text
+
+# content of these tags is never shown; in <head> only <title> is
+HIDDEN_TAGS = {"script", "style", "noscript", "template", "svg"}
+# tags that start a new line of text
+BLOCK_TAGS = {
+    "p", "div", "br", "hr", "li", "ul", "ol", "dl", "dt", "dd", "tr", "table",
+    "section", "article", "aside", "header", "footer", "nav", "main", "blockquote",
+    "pre", "h1", "h2", "h3", "h4", "h5", "h6", "title", "figcaption", "form",
+}  # fmt: skip
+VOID_TAGS = {"br", "hr", "img", "input", "meta", "link", "source", "wbr"}
+# tags allowed in <head>; any other one (e.g. <body>) closes it, </head> is
+# optional
+HEAD_TAGS = {
+    "title", "meta", "link", "style", "script", "base", "noscript", "template",
+}  # fmt: skip
+# often left open: the next one closes the previous
+IMPLICIT_END = {"p", "li", "dt", "dd", "tr", "td", "th", "option"}
+
+_SPACES = re.compile(r"[ \t\r\f\v]+")
+_LINES = re.compile(r"\s*\n\s*")
+
+
+class _VisibleText(HTMLParser):
+    """
+    Collect the visible text of an HTML document fed piece by piece.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self.size = 0
+        self._stack: list[str] = []
+        self._started = False
+
+    def handle_starttag(self, tag, attrs):
+        if "head" in self._stack and tag not in HEAD_TAGS:
+            del self._stack[self._stack.index("head") :]
+        if tag in IMPLICIT_END and self._stack and self._stack[-1] == tag:
+            self._stack.pop()
+        if tag not in VOID_TAGS:
+            self._stack.append(tag)
+        if tag in BLOCK_TAGS:
+            self._add("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self._stack:
+            # also closes tags left open inside this one
+            while self._stack.pop() != tag:
+                pass
+        if tag in BLOCK_TAGS:
+            self._add("\n")
+
+    def handle_data(self, data):
+        if self._visible():
+            self._add(data)
+
+    def _visible(self) -> bool:
+        if "head" in self._stack and "title" not in self._stack:
+            return False
+        return not any(tag in HIDDEN_TAGS for tag in self._stack)
+
+    def _add(self, text: str):
+        self.parts.append(text)
+        self.size += len(text)
+
+    def take(self, final: bool = False) -> str:
+        """
+        Return the text collected so far with whitespace collapsed; trailing
+        whitespace waits for the next call, it may continue there.
+        """
+        text = "".join(self.parts)
+        body = text if final else text.rstrip()
+        rest = text[len(body) :]
+        self.parts = [rest] if rest else []
+        self.size = len(rest)
+        text = _LINES.sub("\n", _SPACES.sub(" ", body))
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
+
+
+class HtmlExtractor(Extractor):
+    """
+    Extract the visible text of HTML pages: markup, scripts and styles are
+    dropped, block elements become line breaks. The page is parsed in
+    blocks of chunk_size chars.
+    """
+
+    extensions = {".html", ".htm", ".xhtml"}
+
+    def extract(self, file: Source) -> Iterator[str]:
+        f = open_text(file)
+        if f is None:
+            return
+        parser = _VisibleText()
+        with f:
+            while block := f.read(self.chunk_size):
+                parser.feed(block)
+                if parser.size >= self.chunk_size:
+                    if (text := parser.take()).strip():
+                        yield text
+        parser.close()
+        if text := parser.take(final=True).rstrip():
+            yield text
@@ -0,0 +1,176 @@
+import json
+import logging
+from typing import Any, Iterator, TextIO
+
+from mnemolet.core.ingestion.extractors.base import (
+    Extractor,
+    Source,
+    source_name,
+    source_suffix,
+)
+from mnemolet.core.ingestion.extractors.text_extractor import open_text
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = " \t\n\r"
+
+
+def flatten(value: Any, prefix: str = "") -> Iterator[str]:
+    """
+    Yield "path: value" lines for the leaves of a JSON value,
+    e.g. {"a": {"b": [1]}} -> "a.b[0]: 1".
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from flatten(item, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            yield from flatten(item, f"{prefix}[{i}]")
+    elif value is not None and value != "":
+        text = value if isinstance(value, str) else json.dumps(value)
+        yield f"{prefix}: {text}" if prefix else text
+
+
+class _JsonReader:
+    """
+    Decode a JSON document value by value, holding one value in memory.
+    """
+
+    def __init__(self, f: TextIO, block_size: int):
+        self.f = f
+        self.block_size = block_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _read(self, size: int) -> bool:
+        if self.eof:
+            return False
+        block = self.f.read(size)
+        if not block:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + block
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Next non-whitespace char, "" at the end of the file.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._read(self.block_size):
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at {self.pos}, got {self.peek()!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """
+        Decode the next value, reading until it is complete.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                value, end = None, None
+            # a number at the end of the buffer may go on in the next block
+            if end is not None and (end < len(self.buffer) or self.eof):
+                self.pos = end
+                return value
+            # read as much again, so a huge value is decoded O(log n) times
+            if not self._read(max(self.block_size, len(self.buffer))):
+                if end is None:
+                    # raises the decode error
+                    self.decoder.raw_decode(self.buffer, self.pos)
+                self.pos = end
+                return value
+
+    def items(self) -> Iterator[Any]:
+        """
+        Yield the values of an array whose "[" was just read.
+        """
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+class JsonExtractor(Extractor):
+    """
+    Extract JSON and NDJSON as flattened records ("path: value" lines).
+    - NDJSON: one record per line.
+    - JSON: the items of a top level array, or the members of a top level
+      object, where members holding an array yield one record per item.
+    Values are decoded one at a time, never the whole file.
+    """
+
+    extensions = {".json", ".jsonl", ".ndjson"}
+    records = True
+
+    def extract(self, file: Source) -> Iterator[str]:
+        f = open_text(file)
+        if f is None:
+            return
+        with f:
+            if source_suffix(file) == ".json":
+                records = self._json_records(_JsonReader(f, self.chunk_size))
+            else:
+                records = self._ndjson_records(f, source_name(file))
+            for record in records:
+                if text := "\n".join(flatten(record)):
+                    yield text
+
+    def _ndjson_records(self, f: TextIO, name: str) -> Iterator[Any]:
+        for n, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"[json] {name}:{n} invalid record skipped: {e}")
+
+    def _json_records(self, reader: _JsonReader) -> Iterator[Any]:
+        while char := reader.peek():
+            if char == "[":
+                reader.pos += 1
+                yield from reader.items()
+            elif char == "{":
+                reader.pos += 1
+                yield from self._members(reader)
+            else:
+                yield reader.value()
+
+    def _members(self, reader: _JsonReader) -> Iterator[Any]:
+        """
+        Members of the top level object; big arrays are streamed item by item.
+        """
+        if reader.peek() == "}":
+            reader.pos += 1
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if reader.peek() == "[":
+                reader.pos += 1
+                for item in reader.items():
+                    yield {key: item}
+            else:
+                yield {key: reader.value()}
+            if reader.peek() == ",":
+                reader.pos += 1
+                continue
+            reader.expect("}")
+            return
@@ -1,12 +1,11 @@
-from pathlib import Path
 from typing import Iterator
 
-from mnemolet.core.ingestion.extractors.base import Extractor
+from mnemolet.core.ingestion.extractors.base import Extractor, Source
 from mnemolet.core.ingestion.loaders.odt_loader import extract_odt
 
 
 class OdtExtractor(Extractor):
     extensions = {".odt"}
 
-    def extract(self, file: Path) -> Iterator[str]:
+    def extract(self, file: Source) -> Iterator[str]:
         yield from extract_odt(file, self.chunk_size)
@@ -1,12 +1,12 @@
-from pathlib import Path
 from typing import Iterator
 
-from mnemolet.core.ingestion.extractors.base import Extractor
+from mnemolet.core.ingestion.extractors.base import Extractor, Source
 from mnemolet.core.ingestion.loaders.pdf_loader import extract_pdf
 
 
 class PDFExtractor(Extractor):
     extensions = {".pdf"}
+    requires = ("pypdf",)
 
-    def extract(self, file: Path) -> Iterator[str]:
+    def extract(self, file: Source) -> Iterator[str]:
         yield from extract_pdf(file, self.chunk_size)
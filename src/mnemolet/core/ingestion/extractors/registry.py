@@ -1,6 +1,8 @@
 import importlib
+import importlib.util
 import logging
 import pkgutil
+import threading
 from pathlib import Path
 
 from mnemolet.core.ingestion.extractors.base import Extractor
@@ -10,12 +12,19 @@ from . import __path__
 
 logger = logging.getLogger(__name__)
 
-_EXTRACTOR_REGISTRY: dict[str, Extractor] | None = None
+_EXTRACTOR_REGISTRY: dict[str, type[Extractor]] | None = None
+# extractor class -> instance, None if it can not run here
+_INSTANCES: dict[type[Extractor], Extractor | None] = {}
+# one lock per class: loading a slow extractor (the Whisper model) does not
+# hold up lookups of the others; _lock only guards the dict of locks
+_CLASS_LOCKS: dict[type[Extractor], threading.Lock] = {}
+_lock = threading.Lock()
 
 
-def get_registry() -> dict[str, Extractor]:
+def get_registry() -> dict[str, type[Extractor]]:
     """
-    Load and return extractor registry lazily (after logging is configured).
+    Load and return extension -> extractor class registry lazily.
+    Extractor modules are imported, but no extractor is created here.
     """
     global _EXTRACTOR_REGISTRY
     if _EXTRACTOR_REGISTRY is None:
@@ -25,7 +34,7 @@ def get_registry() -> dict[str, Extractor]:
                 importlib.import_module(f"{pkg_name}.{modname}")
 
         _EXTRACTOR_REGISTRY = {
-            ext: cls() for cls in Extractor.__subclasses__() for ext in cls.extensions
+            ext: cls for cls in Extractor.__subclasses__() for ext in cls.extensions
         }
 
         logger.debug(f"EXTRACTOR_REGISTRY: {sorted(_EXTRACTOR_REGISTRY.keys())}")
@@ -35,6 +44,43 @@ def get_registry() -> dict[str, Extractor]:
 
 def get_extractor(file: Path) -> Extractor | None:
     """
-    Return registered extractor for the given file extension.
+    Return extractor for the given file extension, created on first use.
+    None if the extension is unknown or its extractor is unavailable.
     """
-    return get_registry().get(file.suffix.lower())
+    cls = get_registry().get(file.suffix.lower())
+    if cls is None:
+        return None
+
+    if cls in _INSTANCES:
+        return _INSTANCES[cls]
+
+    with _lock:
+        class_lock = _CLASS_LOCKS.setdefault(cls, threading.Lock())
+    with class_lock:
+        if cls not in _INSTANCES:
+            _INSTANCES[cls] = _create(cls)
+        return _INSTANCES[cls]
+
+
+def _create(cls: type[Extractor]) -> Extractor | None:
+    """
+    Helper fn to create an extractor, or disable it (once, with a warning)
+    if an optional dependency is missing or it fails to start.
+    """
+    missing = [m for m in cls.requires if importlib.util.find_spec(m) is None]
+    if missing:
+        logger.warning(
+            f"{cls.__name__} disabled, missing module(s): {', '.join(missing)}; "
+            f"skipping {', '.join(sorted(cls.extensions))} files"
+        )
+        return None
+
+    logger.info(f"Loading {cls.__name__}")
+    try:
+        return cls()
+    except Exception as e:
+        logger.warning(
+            f"{cls.__name__} disabled, failed to start: {e}; "
+            f"skipping {', '.join(sorted(cls.extensions))} files"
+        )
+        return None
@@ -1,17 +1,121 @@
+import codecs
+import io
+import logging
+import mmap
+import os
 from pathlib import Path
-from typing import Iterator
+from typing import BinaryIO, Iterator, TextIO
 
-from mnemolet.core.ingestion.extractors.base import Extractor
+from mnemolet.config import (
+    TEXT_FALLBACK_ENCODING,
+    TEXT_MAX_FILE_MB,
+    TEXT_MMAP_MIN_MB,
+    TEXT_OVERSIZE,
+    TEXT_SAMPLE_MB,
+)
+from mnemolet.core.ingestion.extractors.base import Extractor, Source, source_name
+
+logger = logging.getLogger(__name__)
+
+# bytes looked at to tell the encoding and binary files apart
+SNIFF_BYTES = 64 * 1024
+# share of control bytes above which a file counts as binary
+BINARY_RATIO = 0.1
+OVERSIZE_POLICIES = ("skip", "head", "head_tail")
+# written between the head and the tail of a sampled file
+SAMPLE_GAP = "\n...\n"
+
+# longest first: the UTF-32 LE BOM starts with the UTF-16 LE one
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+# bytes usual in text: tab, newlines, form feed, escape and everything >= 32
+_TEXT_BYTES = bytes([8, 9, 10, 12, 13, 27, *range(32, 256)])
+
+
+def detect_bom(sample: bytes) -> tuple[str | None, int]:
+    """
+    Return (encoding, BOM length) if sample starts with a BOM.
+    """
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding, len(bom)
+    return None, 0
+
+
+def is_binary(sample: bytes) -> bool:
+    """
+    Guess from the first bytes whether a file (without BOM) is binary.
+    """
+    if not sample:
+        return False
+    if b"\x00" in sample:
+        return True
+    control = len(sample.translate(None, _TEXT_BYTES))
+    return control / len(sample) > BINARY_RATIO
+
+
+def detect_encoding(sample: bytes, fallback: str = TEXT_FALLBACK_ENCODING) -> str:
+    """
+    UTF-8 if the sample decodes as UTF-8 (a character cut at the end of the
+    sample is fine), otherwise the fallback encoding.
+    """
+    try:
+        sample.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.reason != "unexpected end of data":
+            return fallback
+    return "utf-8"
+
+
+def open_text(file: Source, fallback: str = TEXT_FALLBACK_ENCODING) -> TextIO | None:
+    """
+    Open a text file (or wrap a binary stream) for streaming with its
+    detected encoding, undecodable bytes become U+FFFD.
+    None if the content looks binary.
+    """
+    if isinstance(file, Path):
+        with open(file, "rb") as f:
+            sample = f.read(SNIFF_BYTES)
+    else:
+        sample = file.read(SNIFF_BYTES)
+        file.seek(0)
+    encoding, _ = detect_bom(sample)
+    if encoding is None:
+        if is_binary(sample):
+            logger.info(f"Skipping binary file: {source_name(file)}")
+            return None
+        encoding = detect_encoding(sample, fallback)
+    elif encoding == "utf-8":
+        encoding = "utf-8-sig"
+    else:
+        # the endianness-neutral codecs consume the BOM
+        encoding = encoding[:6]
+    if isinstance(file, Path):
+        return open(file, encoding=encoding, errors="replace", newline="")
+    return io.TextIOWrapper(file, encoding=encoding, errors="replace", newline="")
 
 
 class TextExtractor(Extractor):
+    """
+    Extract text files of any encoding and size.
+    - binary files are skipped, the encoding comes from a BOM or is UTF-8
+      or the fallback encoding; undecodable bytes become U+FFFD.
+    - optional guard: files over `max_file_mb` (0 = no limit) are skipped or
+      sampled (head, head + tail).
+    - large files are read through mmap, in blocks of chunk_size bytes.
+    """
+
     extensions = {
         # plain text
         ".txt",
         ".log",
         ".conf",
         ".ini",
-        ".json",
         ".yml",
         ".toml",
         # code
@@ -30,14 +134,10 @@ class TextExtractor(Extractor):
         ".ps1",
         ".rb",
         ".php",
-        "pl",
-        # markdown
-        # TODO: need additional work for csv and html
+        ".pl",
+        # markup
         ".md",
-        ".html",
         ".xml",
-        ".csv",
-        ".tsv",
         ".css",
         # documentation
         ".rst",
@@ -47,10 +147,132 @@ class TextExtractor(Extractor):
         ".tpl",
     }
 
-    def extract(self, file: Path) -> Iterator[str]:
+    def __init__(
+        self,
+        chunk_size: int | None = None,
+        max_file_mb: float = TEXT_MAX_FILE_MB,
+        oversize: str = TEXT_OVERSIZE,
+        sample_mb: float = TEXT_SAMPLE_MB,
+        mmap_min_mb: float = TEXT_MMAP_MIN_MB,
+        fallback_encoding: str = TEXT_FALLBACK_ENCODING,
+    ):
+        super().__init__(chunk_size)
+        if oversize not in OVERSIZE_POLICIES:
+            raise ValueError(
+                f"Unknown oversize policy {oversize!r}, use {OVERSIZE_POLICIES}"
+            )
+        codecs.lookup(fallback_encoding)  # fail early on a typo
+
+        self.max_bytes = int(max_file_mb * 1024**2)
+        self.oversize = oversize
+        self.sample_bytes = max(1, int(sample_mb * 1024**2))
+        self.mmap_min_bytes = int(mmap_min_mb * 1024**2)
+        self.fallback_encoding = fallback_encoding
+
+    def extract(self, file: Source) -> Iterator[str]:
+        """
+        Yield text chunks from a file or a seekable binary stream.
+        """
+        if not isinstance(file, Path):
+            size = file.seek(0, os.SEEK_END)
+            file.seek(0)
+            yield from self._extract(file, size, source_name(file))
+            return
+
+        size = file.stat().st_size
+        if size == 0:
+            return
+        with open(file, "rb") as f:
+            if size < self.mmap_min_bytes:
+                yield from self._extract(f, size, str(file))
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from self._extract(f, size, str(file), mm)
+
+    def _extract(
+        self, f: BinaryIO, size: int, name: str, mm: mmap.mmap | None = None
+    ) -> Iterator[str]:
+        sample = f.read(SNIFF_BYTES)
+        encoding, bom = detect_bom(sample)
+        if encoding is None:
+            if is_binary(sample):
+                logger.info(f"Skipping binary file: {name}")
+                return
+            encoding = detect_encoding(sample, self.fallback_encoding)
+
+        ranges = self._ranges(name, size, bom)
+        if not ranges:
+            return
+        logger.debug(f"[text] {name}: encoding={encoding} ranges={ranges}")
+        yield from self._decode(mm or f, ranges, encoding, bom, size)
+
+    def _ranges(self, file: str, size: int, bom: int) -> list[tuple[int, int]]:
         """
-        Yield text chunks from a file.
+        Byte ranges to extract, according to the size limit and policy.
         """
-        with open(file, "r", encoding="utf-8") as f:
-            while chunk := f.read(self.chunk_size):
-                yield chunk
+        if not self.max_bytes or size <= self.max_bytes:
+            return [(bom, size)]
+
+        mb = size / 1024**2
+        if self.oversize == "skip":
+            logger.warning(f"Skipping {file}: {mb:.0f} MB is over the size limit")
+            return []
+
+        logger.warning(f"Sampling {file} ({self.oversize}): {mb:.0f} MB is too big")
+        if self.oversize == "head":
+            return [(bom, min(size, bom + self.sample_bytes))]
+        half = self.sample_bytes // 2
+        return [(bom, bom + half), (size - half, size)]
+
+    def _decode(
+        self, source, ranges, encoding: str, bom: int, size: int
+    ) -> Iterator[str]:
+        """
+        Decode byte ranges incrementally, a character split between two
+        blocks is decoded once both are read; one cut at the end of a
+        sample is dropped.
+        """
+        for i, (start, end) in enumerate(ranges):
+            if i:
+                yield SAMPLE_GAP
+                start = _align(source, start, encoding, bom)
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            for block in _blocks(source, start, end, self.chunk_size):
+                if text := decoder.decode(block):
+                    yield text
+            if end == size and (text := decoder.decode(b"", final=True)):
+                yield text
+
+
+def _blocks(source, start: int, end: int, block_size: int) -> Iterator[bytes]:
+    """
+    Read [start, end) in blocks from an open file or an mmap.
+    """
+    if isinstance(source, mmap.mmap):
+        for pos in range(start, end, block_size):
+            yield source[pos : min(pos + block_size, end)]
+        return
+
+    source.seek(start)
+    pos = start
+    while pos < end and (block := source.read(min(block_size, end - pos))):
+        pos += len(block)
+        yield block
+
+
+def _align(source, start: int, encoding: str, bom: int) -> int:
+    """
+    Move a range start that lands inside a character to the next character.
+    """
+    if encoding.startswith("utf-16"):
+        return start + (-(start - bom) % 2)
+    if encoding.startswith("utf-32"):
+        return start + (-(start - bom) % 4)
+    if encoding == "utf-8":
+        # skip UTF-8 continuation bytes (10xxxxxx)
+        lead = next(_blocks(source, start, start + 4, 4), b"")
+        for byte in lead[:3]:
+            if byte & 0xC0 != 0x80:
+                break
+            start += 1
+    return start
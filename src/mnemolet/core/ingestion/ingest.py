@@ -1,15 +1,27 @@
 import logging
 import time
+from collections.abc import Callable
+from itertools import chain
 from pathlib import Path
 
+import numpy as np
 from tqdm import tqdm
 
-from mnemolet.core.embeddings.local_llm_embed import (
-    get_dimension,
-)
+from mnemolet.config import ADAPTIVE_BATCH, DEDUP_MODE, EMBED_MODEL
 from mnemolet.core.indexing.qdrant_indexer import QdrantIndexer
+from mnemolet.core.ingestion.batching import AdaptiveBatchController
+from mnemolet.core.ingestion.dedup import NearDuplicateFilter
 from mnemolet.core.ingestion.preprocessor import process_directory
+from mnemolet.core.ingestion.scanner import Scanner
+from mnemolet.core.ingestion.stats import IngestStats
 from mnemolet.core.storage.db_tracker import DBTracker
+from mnemolet.core.utils.metrics import (
+    INGEST_BATCH_SIZE,
+    INGEST_CHUNKS,
+    INGEST_FILES,
+    INGEST_STAGE_SECONDS,
+)
+from mnemolet.core.utils.utils import package_version
 
 logger = logging.getLogger(__name__)
 
@@ -21,84 +33,279 @@ def ingest(
     collection_name: str,
     size_chars: int,
     force: bool,
+    files: list[Path] | None = None,
+    hashes: dict[str, str] | None = None,
+    progress: Callable[[dict], None] | None = None,
+    tracker: DBTracker | None = None,
+    embed_fn: Callable[[list[str]], np.ndarray] | None = None,
+    adaptive: bool = ADAPTIVE_BATCH,
+    dedup_mode: str = DEDUP_MODE,
 ) -> dict:
     """
     Ingest files from a directory into Qdrant.
     - streams files, chunks them, embeds text and stores data in Qdrant.
+    - if `files` is given, only those files are ingested instead of the
+      whole directory; `hashes` can carry their precomputed SHA256.
+    - `progress` is called with a dict (stage, files_total, files, chunks)
+      every time the ingestion moves forward.
+    - `tracker` and `embed_fn` replace the default SQLite tracker and the
+      local embedding model (used by benchmarks).
+    - the result carries time, items and bytes per stage (setup, hash, track,
+      extract, chunk, dedup, embed, store) and per extractor.
+    - `batch_size` is the initial number of chunks per embed + store batch;
+      with `adaptive` it follows throughput and memory (see batching.py).
+    - near-duplicate chunks of chunks already in the collection are linked
+      or dropped as `dedup_mode` says (see dedup.py and `[dedup]`),
+      `mnemolet stats --duplicates`.
+    - every run (config, result, error or interruption) is recorded in the
+      tracker's runs table, see `mnemolet stats --runs`.
     """
+    # SQLite db
+    tracker = tracker or DBTracker()
+    config = {
+        "qdrant_url": qdrant_url,
+        "batch_size": batch_size,
+        "adaptive_batch": adaptive,
+        "size_chars": size_chars,
+        "force": force,
+        "dedup": dedup_mode,
+        "embed_model": EMBED_MODEL if embed_fn is None else "custom",
+    }
+    run_id = tracker.start_run(
+        str(directory), collection_name, config, package_version()
+    )
+
+    try:
+        result = _ingest(
+            directory,
+            batch_size,
+            qdrant_url,
+            collection_name,
+            size_chars,
+            force,
+            files,
+            hashes,
+            progress,
+            tracker,
+            embed_fn,
+            adaptive,
+            dedup_mode,
+        )
+    except BaseException as e:
+        # Ctrl-C or a cancelled job must not leave the run "running" forever
+        error = str(e) if isinstance(e, Exception) else f"interrupted: {e!r}"
+        tracker.finish_run(run_id, error=error or repr(e))
+        raise
 
+    tracker.finish_run(run_id, result)
+    return result
+
+
+def _ingest(
+    directory,
+    batch_size,
+    qdrant_url,
+    collection_name,
+    size_chars,
+    force,
+    files,
+    hashes,
+    progress,
+    tracker,
+    embed_fn,
+    adaptive,
+    dedup_mode,
+) -> dict:
+    """
+    Run the ingestion itself, see ingest().
+    """
     start_total = time.time()
     directory = Path(directory)
+    stats = IngestStats()
+    batcher = AdaptiveBatchController(batch_size, adaptive=adaptive)
+    dedup = NearDuplicateFilter(tracker, collection_name, mode=dedup_mode)
+
+    # the directory is walked once, while files are ingested
+    if files is None:
+        scanner = Scanner(directory)
+        candidates = iter(scanner)
+    else:
+        files = [Path(f) for f in files]
+        files = [f for f in files if f.is_file()]
+        candidates = iter(files)
+
+    def files_total() -> int:
+        return scanner.found if files is None else len(files)
 
-    files = list(directory.rglob("*"))
-    files = [f for f in files if f.is_file()]
-    if not files:
+    first = next(candidates, None)
+    if first is None:
         logger.warning("No files found to ingest.")
-        return
-    logger.info(f"Found {len(files)} files to ingest from {directory}.")
+        _report(progress, "done", files_total=0, files=0, chunks=0)
+        return {
+            "files": 0,
+            "chunks": 0,
+            "time": time.time() - start_total,
+            **stats.to_dict(),
+            "batching": batcher.to_dict(),
+            "dedup": dedup.to_dict(),
+        }
+    candidates = chain([first], candidates)
+    _report(progress, "preparing", files_total=files_total(), files=0, chunks=0)
 
     logger.info(f"Starting ingestion from {directory}")
 
-    # SQLite db
-    tracker = DBTracker()
-    indexer = QdrantIndexer(qdrant_url, collection_name)
-    embedding_dim = get_dimension()
-    # runs only if there is no collection
-    indexer.ensure_collection(vector_size=embedding_dim)
+    embed_fn = embed_fn or _embed_local
+    with stats.time("setup"):
+        indexer = QdrantIndexer(qdrant_url, collection_name)
+        # loads the embedding model on first use
+        embedding_dim = _get_dimension(embed_fn)
+        # runs only if there is no collection
+        indexer.ensure_collection(vector_size=embedding_dim)
+
+        if force:
+            logger.info(f"Recreating Qdrant collection (dim={embedding_dim})..")
+            indexer.init_collection(vector_size=embedding_dim)
+            tracker.clear_chunk_signatures(collection_name)
+
     total_chunks = 0
     total_files = 0  # can be actually different with files count
 
     chunk_batch = []
     metadata_batch = []
 
-    pbar = tqdm(total=len(files), desc="Ingesting files", unit="file")
+    pbar = tqdm(total=files_total(), desc="Ingesting files", unit="file")
 
     seen_files = set()
 
-    if force:
-        embedding_dim = get_dimension()
-        logger.info(f"Recreating Qdrant collection (dim={embedding_dim})..")
-        indexer.init_collection(vector_size=embedding_dim)
+    # time spent inside the extraction generator since the last stored batch
+    extract_time = 0.0
+    mark = time.perf_counter()
 
-    for data in process_directory(directory, tracker, force, size_chars):
+    for data in process_directory(
+        directory,
+        tracker,
+        force,
+        size_chars,
+        files=candidates,
+        hashes=hashes,
+        stats=stats,
+    ):
+        extract_time += time.perf_counter() - mark
         file_path = data["path"]
-        file_hash = data["hash"]
         chunk = data["chunk"]
 
         if file_path not in seen_files:
             logger.info(f"Processing file #{total_files}: {file_path}")
             total_files += 1
             seen_files.add(file_path)
+            INGEST_FILES.inc()
+            pbar.total = max(files_total(), total_files)
             pbar.update(1)  # increment progress bar
+            _report(
+                progress,
+                "extracting",
+                files_total=files_total(),
+                files=total_files,
+                chunks=total_chunks,
+            )
+
+        metadata = {k: v for k, v in data.items() if k != "chunk"}
+        with stats.time("dedup", items=1):
+            duplicate = dedup.check(file_path, data["hash"], chunk)
+        if duplicate and dedup.mode == "suppress":
+            mark = time.perf_counter()
+            continue
+        if duplicate:
+            metadata["duplicate_of"] = duplicate.original.path
+            metadata["duplicate_similarity"] = duplicate.similarity
 
         # add to current batch
         chunk_batch.append(chunk)
-        metadata_batch.append({"path": file_path, "hash": file_hash})
+        metadata_batch.append(metadata)
         total_chunks += 1
 
-        # if batch full —> embed & store
-        if len(chunk_batch) >= batch_size:
-            _store_batch(indexer, chunk_batch, metadata_batch, embedding_dim, force)
+        # if batch full (or memory is tight) —> embed & store
+        if batcher.should_flush(len(chunk_batch)):
+            INGEST_STAGE_SECONDS.observe(extract_time, stage="extract")
+            extract_time = 0.0
+            _report(progress, "embedding", files=total_files, chunks=total_chunks)
+            _store_batch(indexer, chunk_batch, metadata_batch, embed_fn, stats, batcher)
+            dedup.flush()
             chunk_batch.clear()
             metadata_batch.clear()
+            _report(progress, "extracting", files=total_files, chunks=total_chunks)
+
+        mark = time.perf_counter()
+
+    extract_time += time.perf_counter() - mark
+    INGEST_STAGE_SECONDS.observe(extract_time, stage="extract")
 
     # handle the rest
     if chunk_batch:
-        _store_batch(indexer, chunk_batch, metadata_batch, embedding_dim, force)
+        _report(progress, "embedding", files=total_files, chunks=total_chunks)
+        _store_batch(indexer, chunk_batch, metadata_batch, embed_fn, stats, batcher)
+    dedup.flush()
 
     pbar.close()
 
     total_time = time.time() - start_total
+    _report(
+        progress,
+        "done",
+        files_total=files_total(),
+        files=total_files,
+        chunks=total_chunks,
+    )
+    stats.log_summary()
 
-    return {"files": total_files, "chunks": total_chunks, "time": total_time}
+    return {
+        "files": total_files,
+        "chunks": total_chunks,
+        "time": total_time,
+        **stats.to_dict(),
+        "batching": batcher.to_dict(),
+        "dedup": dedup.to_dict(),
+    }
 
 
-def _store_batch(indexer, chunk_batch, metadata_batch, embedding_dim, force):
-    from mnemolet.core.embeddings.local_llm_embed import (
-        embed_texts_batch,
-    )
-
+def _store_batch(indexer, chunk_batch, metadata_batch, embed_fn, stats, batcher):
     logger.info(f"Embedding batch of {len(chunk_batch)} chunks..")
-    for embeddings in embed_texts_batch(chunk_batch, batch_size=len(chunk_batch)):
+    n = len(chunk_batch)
+    start = time.perf_counter()
+    with INGEST_STAGE_SECONDS.time(stage="embed"), stats.time("embed", items=n):
+        embeddings = embed_fn(chunk_batch)
+    with INGEST_STAGE_SECONDS.time(stage="store"), stats.time("store", items=n):
         indexer.store_embeddings(chunk_batch, embeddings, metadata_batch)
-        logger.info(f"Stored {len(chunk_batch)} chunks in Qdrant.")
+    INGEST_CHUNKS.inc(len(chunk_batch))
+    batcher.record(n, time.perf_counter() - start)
+    INGEST_BATCH_SIZE.set(batcher.size)
+    logger.info(f"Stored {len(chunk_batch)} chunks in Qdrant.")
+
+
+def _embed_local(texts: list[str]) -> np.ndarray:
+    """
+    Embed texts in one batch with the local embedding model.
+    """
+    from mnemolet.core.embeddings.local_llm_embed import embed_texts_batch
+
+    return np.concatenate(list(embed_texts_batch(texts, batch_size=len(texts))))
+
+
+def _get_dimension(embed_fn: Callable[[list[str]], np.ndarray]) -> int:
+    """
+    Returns embedding dimension using dummy data.
+    """
+    return embed_fn(["dummy"]).shape[1]
+
+
+def _report(progress: Callable[[dict], None] | None, stage: str, **counters):
+    """
+    Helper fn to send a progress update, if anyone listens.
+    """
+    if progress is None:
+        return
+    try:
+        progress({"stage": stage, **counters})
+    except Exception as e:
+        # never let a broken listener stop the ingestion
+        logger.warning(f"Progress callback failed: {e}")
@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mnemolet.config import INGEST_MAX_JOBS
+
+logger = logging.getLogger(__name__)
+
+# how many finished jobs are kept for status lookups
+MAX_FINISHED_JOBS = 100
+
+
+@dataclass
+class IngestJob:
+    """
+    State of a background ingestion job.
+    """
+
+    id: str
+    files_total: int = 0
+    status: str = "queued"  # queued | running | done | failed
+    stage: str = "queued"
+    files: int = 0
+    chunks: int = 0
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: dict | None = None
+    error: str | None = None
+    # bumped on every update, lets listeners skip unchanged snapshots
+    version: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def to_dict(self) -> dict:
+        """
+        Return job snapshot including throughput.
+        """
+        elapsed = 0.0
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "files_total": self.files_total,
+            "files": self.files,
+            "chunks": self.chunks,
+            "elapsed": round(elapsed, 3),
+            "files_per_sec": round(self.files / elapsed, 2) if elapsed else 0.0,
+            "chunks_per_sec": round(self.chunks / elapsed, 2) if elapsed else 0.0,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class IngestJobManager:
+    """
+    Run ingestion in background threads, at most `max_jobs` at a time.
+    Jobs above the limit wait in the executor queue.
+    """
+
+    def __init__(self, max_jobs: int = INGEST_MAX_JOBS):
+        self.max_jobs = max(1, max_jobs)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_jobs, thread_name_prefix="ingest-job"
+        )
+        self.jobs: dict[str, IngestJob] = {}
+        self.futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        directory: Path,
+        batch_size: int,
+        qdrant_url: str,
+        collection_name: str,
+        size_chars: int,
+        force: bool = False,
+        files: list[Path] | None = None,
+        hashes: dict[str, str] | None = None,
+    ) -> IngestJob:
+        """
+        Queue ingestion and return the job immediately.
+        """
+        job = IngestJob(id=uuid.uuid4().hex, files_total=len(files or []))
+
+        with self._lock:
+            self._prune()
+            self.jobs[job.id] = job
+            self.futures[job.id] = self.executor.submit(
+                self._run,
+                job,
+                directory,
+                batch_size,
+                qdrant_url,
+                collection_name,
+                size_chars,
+                force,
+                files,
+                hashes,
+            )
+        logger.info(f"Queued ingestion job {job.id}")
+        return job
+
+    def get(self, job_id: str) -> IngestJob | None:
+        return self.jobs.get(job_id)
+
+    def future(self, job_id: str) -> Future | None:
+        return self.futures.get(job_id)
+
+    def list_jobs(self) -> list[IngestJob]:
+        with self._lock:
+            return list(self.jobs.values())
+
+    def _run(self, job: IngestJob, directory, *args) -> dict | None:
+        from mnemolet.core.ingestion.ingest import ingest
+
+        self._update(job, status="running", stage="starting", started_at=time.time())
+        logger.info(f"Started ingestion job {job.id}")
+
+        try:
+            result = ingest(
+                directory, *args, progress=lambda p: self._on_progress(job, p)
+            )
+        except Exception as e:
+            logger.error(f"Ingestion job {job.id} failed: {e}")
+            self._update(
+                job,
+                status="failed",
+                stage="failed",
+                error=str(e),
+                finished_at=time.time(),
+            )
+            return None
+
+        self._update(
+            job,
+            status="done",
+            stage="done",
+            result=result,
+            finished_at=time.time(),
+        )
+        logger.info(f"Finished ingestion job {job.id}")
+        return result
+
+    def _on_progress(self, job: IngestJob, progress: dict):
+        self._update(
+            job,
+            **{
+                k: v
+                for k, v in progress.items()
+                if k in ("stage", "files_total", "files", "chunks")
+            },
+        )
+
+    def _update(self, job: IngestJob, **fields):
+        with self._lock:
+            for k, v in fields.items():
+                setattr(job, k, v)
+            job.version += 1
+
+    def _prune(self):
+        """
+        Drop the oldest finished jobs above MAX_FINISHED_JOBS.
+        """
+        finished = [j for j in self.jobs.values() if j.finished]
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            self.jobs.pop(job.id, None)
+            self.futures.pop(job.id, None)
+
+
+_JOB_MANAGER: IngestJobManager | None = None
+
+
+def get_job_manager() -> IngestJobManager:
+    """
+    Return process-wide job manager, created on first use.
+    """
+    global _JOB_MANAGER
+    if _JOB_MANAGER is None:
+        _JOB_MANAGER = IngestJobManager()
+    return _JOB_MANAGER
@@ -1,58 +1,205 @@
 import logging
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+from mnemolet.config import ARCHIVE_MAX_MEMBER_MB, ARCHIVE_SPOOL_MB, INGEST_ARCHIVES
+from mnemolet.core.ingestion.archives import (
+    MemberFile,
+    MemberTooLarge,
+    is_archive,
+    iter_members,
+    member_path,
+    spool_member,
+)
+from mnemolet.core.ingestion.extractors.base import Extractor, Source
 from mnemolet.core.ingestion.extractors.registry import get_extractor
+from mnemolet.core.ingestion.scanner import Scanner
+from mnemolet.core.ingestion.stats import IngestStats
 from mnemolet.core.storage.db_tracker import DBTracker
 from mnemolet.core.utils.utils import hash_file
 
 logger = logging.getLogger(__name__)
 
 
+# accepted files are looked up this far ahead, so slow extractors (audio)
+# can start on them while earlier files are extracted and embedded; the
+# look-ahead stops at the first file of an extractor that does not prefetch,
+# so spooled archive members are not held in memory for nothing
+PREFETCH_WINDOW = 8
+
+
 def stream_files(
-    dir: Path, tracker: DBTracker, force: bool = False
+    dir: Path,
+    tracker: DBTracker,
+    force: bool = False,
+    files: Iterable[Path] | None = None,
+    hashes: dict[str, str] | None = None,
+    stats: IngestStats | None = None,
 ) -> Iterator[dict[str, str, str]]:
     """
     Yield files from a dir in chunks, skipping files already ingested.
     Duplicates by hash are skipped automatically.
+    Every non-empty part of a file is yielded as soon as the extractor
+    produces it, parts of one file are yielded one after another.
+    Members of zip/tar archives are streamed to their extractors without
+    unpacking the archive, their path is "archive!member".
+
+    Args:
+        files: optional files to stream instead of walking dir (with the
+            [scan] rules), e.g. a Scanner already counting them.
+        hashes: optional precomputed SHA256 hashes keyed by file path,
+            e.g. computed while the files were uploaded.
+        stats: optional accumulator for hash/track/extract time and bytes.
+    """
+    stats = stats or IngestStats()
+    candidates = Scanner(dir) if files is None else files
+    accepted = _accepted_files(candidates, tracker, force, hashes or {}, stats)
+    window = deque()
+
+    try:
+        while True:
+            while not window or (
+                len(window) < PREFETCH_WINDOW and window[-1][2].prefetches
+            ):
+                item = next(accepted, None)
+                if item is None:
+                    break
+                _, source, extractor, file_hash, _ = item
+                extractor.prefetch(source, file_hash)
+                window.append(item)
+            if not window:
+                return
+
+            path, source, extractor, file_hash, file_size = window.popleft()
+            try:
+                file_added = False
+
+                parts = stats.timed(
+                    extractor.extract(source),
+                    "extract",
+                    extractor=type(extractor).__name__,
+                    bytes=file_size,
+                )
+                for content_part in parts:
+                    logger.debug(f"[LOADER] Received part: len={len(content_part)}")
+
+                    if not content_part:
+                        continue
+
+                    if not file_added:
+                        with stats.time("track"):
+                            tracker.add_file(path, file_hash)
+                        file_added = True
+
+                    # every part goes downstream as soon as it is extracted
+                    yield {
+                        "path": path,
+                        "content": content_part,
+                        "hash": file_hash,
+                        "records": extractor.records,
+                        "page": getattr(content_part, "page", None),
+                        "heading": getattr(content_part, "level", None),
+                    }
+            except Exception as e:
+                logger.warning(f"Skipping {path}: {e}")
+                stats.add_error(path, str(e))
+            finally:
+                _close(source)
+    finally:
+        # stopped early: do not leave background work behind
+        for _, source, extractor, _, _ in window:
+            extractor.cancel_prefetch(source)
+            _close(source)
+        accepted.close()
+
+
+def _close(source: Source):
+    if isinstance(source, MemberFile):
+        source.close()
+
+
+def _accepted_files(
+    candidates: Iterable[Path],
+    tracker: DBTracker,
+    force: bool,
+    hashes: dict[str, str],
+    stats: IngestStats,
+) -> Iterator[tuple[str, Source, Extractor, str, int]]:
+    """
+    Yield (path, source, extractor, hash, size) of files (and archive
+    members) that need to be ingested.
     """
     seen_hashes = set()
 
-    for file_path in dir.rglob("*"):
-        extractor = get_extractor(file_path)
-        logger.debug(f" -> extractor: {extractor}")
-        if not extractor:
-            continue
+    for file_path in candidates:
+        file_path = Path(file_path)
+        if INGEST_ARCHIVES and is_archive(file_path):
+            sources = _archive_members(file_path, stats)
+        else:
+            sources = _regular_file(file_path, hashes, stats)
 
-        file_hash = hash_file(file_path)
+        for path, source, extractor, file_hash, file_size in sources:
+            # Skip if already ingested
+            with stats.time("track"):
+                exists = not force and tracker.file_exists(file_hash)
+            if exists:
+                logger.info(f"Skipping already ingested: {path}")
+                _close(source)
+                continue
 
-        # Skip if already ingested
-        if not force and tracker.file_exists(file_hash):
-            logger.info(f"Skipping already ingested: {file_path}")
-            continue
+            # Skip duplicates within current batch
+            if file_hash in seen_hashes:
+                logger.info(f"Skipping duplicate file in directory: {path}")
+                _close(source)
+                continue
 
-        # Skip duplicates within current batch
-        if file_hash in seen_hashes:
-            logger.info(f"Skipping duplicate file in directory: {file_path}")
-            continue
+            seen_hashes.add(file_hash)
+            yield path, source, extractor, file_hash, file_size
 
-        seen_hashes.add(file_hash)
 
-        try:
-            file_added = False
-            resolved_path = str(file_path.resolve())
+def _regular_file(
+    file_path: Path, hashes: dict[str, str], stats: IngestStats
+) -> Iterator[tuple[str, Source, Extractor, str, int]]:
+    extractor = get_extractor(file_path)
+    logger.debug(f" -> extractor: {extractor}")
+    if not extractor:
+        return
 
-            for content_part in extractor.extract(file_path):
-                logger.debug(f"[LOADER] Received part: len={len(content_part)}")
+    file_size = file_path.stat().st_size
+    file_hash = hashes.get(str(file_path))
+    if file_hash is None:
+        with stats.time("hash", items=1, bytes=file_size):
+            file_hash = hash_file(file_path)
+    yield str(file_path.resolve()), file_path, extractor, file_hash, file_size
 
-                if not file_added:
-                    tracker.add_file(resolved_path, file_hash)
 
-                data = {
-                    "path": resolved_path,
-                    "content": content_part,
-                    "hash": file_hash,
-                }
-            yield data
-        except Exception as e:
-            print(f"Skipping {file_path}: {e}")
+def _archive_members(
+    archive: Path, stats: IngestStats
+) -> Iterator[tuple[str, Source, Extractor, str, int]]:
+    """
+    Helper fn to read the members of an archive that have an extractor into
+    MemberFiles, hashing them on the way; the archive is read once.
+    """
+    archive_path = archive.resolve()
+    max_size = int(ARCHIVE_SPOOL_MB * 1024**2)
+    max_bytes = int(ARCHIVE_MAX_MEMBER_MB * 1024**2)
+    try:
+        for name, size, stream in iter_members(archive):
+            path = member_path(archive_path, name)
+            extractor = get_extractor(Path(name))
+            if not extractor:
+                continue
+            try:
+                if max_bytes and size > max_bytes:
+                    raise MemberTooLarge(f"{size / 1024**2:.0f} MB unpacked")
+                with stats.time("hash", items=1, bytes=size):
+                    spool, member_hash = spool_member(path, stream, max_size, max_bytes)
+            except Exception as e:
+                logger.warning(f"Skipping {path}: {e}")
+                stats.add_error(path, str(e))
+                continue
+            yield path, spool, extractor, member_hash, size
+    except Exception as e:
+        logger.warning(f"Skipping archive {archive}: {e}")
+        stats.add_error(str(archive), str(e))
@@ -1,29 +1,60 @@
+import re
+import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
-from typing import Iterator
+from typing import BinaryIO, Iterator
 
-from docx import Document
+from mnemolet.core.ingestion.loaders.office_xml import blocks_to_parts, iter_blocks
 
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# built-in heading styles: "Title", "Heading1" .. "Heading9"
+HEADING_STYLE = re.compile(r"(?i)^(title|heading\s*(\d))$")
 
-def extract_docx(file: Path, chunk_size: int) -> Iterator[str]:
+
+def _paragraph_text(elem: ET.Element) -> str:
+    """
+    Text of a w:p: its w:t runs (not deleted text or field codes), tabs and
+    breaks.
+    """
+    parts = []
+    for node in elem.iter():
+        if node.tag == f"{W}t":
+            parts.append(node.text or "")
+        elif node.tag == f"{W}tab":
+            parts.append("\t")
+        elif node.tag in (f"{W}br", f"{W}cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _heading_level(elem: ET.Element) -> int | None:
+    style = elem.find(f"{W}pPr/{W}pStyle")
+    if style is None:
+        return None
+    match = HEADING_STYLE.match(style.get(f"{W}val", ""))
+    if match is None:
+        return None
+    return int(match.group(2) or 1)
+
+
+def extract_docx(file: Path | BinaryIO, chunk_size: int) -> Iterator[str]:
     """
-    Yield text chunks from a DOCX.
+    Yield text chunks from a DOCX, streaming its word/document.xml.
 
     Args:
-        file: DOCX file path.
+        file: DOCX file path or binary stream.
         chunk_size: size of text chunks to yield.
 
     Yields:
-        str: next chunk of text.
+        str: next chunk of paragraphs and table rows, or a HeadingText.
     """
-    docx = Document(file)
-
-    buffer = ""
-
-    for par in docx.paragraphs:
-        buffer += par.text + "\n"
-        while len(buffer) >= chunk_size:
-            yield buffer[:chunk_size]
-            buffer = buffer[chunk_size:]
-
-    if buffer:
-        yield buffer
+    with zipfile.ZipFile(file) as docx, docx.open("word/document.xml") as xml:
+        blocks = iter_blocks(
+            xml,
+            paragraph_tags={f"{W}p"},
+            row_tag=f"{W}tr",
+            cell_tag=f"{W}tc",
+            paragraph_text=_paragraph_text,
+            heading_level=_heading_level,
+        )
+        yield from blocks_to_parts(blocks, chunk_size)
@@ -1,25 +1,56 @@
+import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
-from typing import Iterator
+from typing import BinaryIO, Iterator
 
-from odfdo import Document
+from mnemolet.core.ingestion.loaders.office_xml import blocks_to_parts, iter_blocks
 
+TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+TABLE = "{urn:oasis:names:tc:opendocument:xmlns:table:1.0}"
 
-def extract_odt(file: Path, chunk_size: int) -> Iterator[str]:
+
+def _paragraph_text(elem: ET.Element) -> str:
+    """
+    Text of a text:p / text:h, with text:s, text:tab and text:line-break.
     """
-    Yield text chunks from a ODT.
+    parts = [elem.text or ""]
+    for child in elem:
+        if child.tag == f"{TEXT}s":
+            parts.append(" " * int(child.get(f"{TEXT}c", 1)))
+        elif child.tag == f"{TEXT}tab":
+            parts.append("\t")
+        elif child.tag == f"{TEXT}line-break":
+            parts.append("\n")
+        else:
+            parts.append(_paragraph_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _heading_level(elem: ET.Element) -> int | None:
+    if elem.tag != f"{TEXT}h":
+        return None
+    return int(elem.get(f"{TEXT}outline-level", 1))
+
+
+def extract_odt(file: Path | BinaryIO, chunk_size: int) -> Iterator[str]:
+    """
+    Yield text chunks from a ODT, streaming its content.xml.
 
     Args:
-        file: ODT file path.
+        file: ODT file path or binary stream.
         chunk_size: size of text chunks to yield.
 
     Yields:
-        str: next chunk of text.
-
-    Reference:
-        - ODFDO Recipies: https://jdum.github.io/odfdo/recipes.html
+        str: next chunk of paragraphs and table rows, or a HeadingText.
     """
-    odt = Document(file)
-    text = odt.get_formatted_text()
-
-    for i in range(0, len(text), chunk_size):
-        yield text[i : i + chunk_size]
+    with zipfile.ZipFile(file) as odt, odt.open("content.xml") as xml:
+        blocks = iter_blocks(
+            xml,
+            paragraph_tags={f"{TEXT}p", f"{TEXT}h"},
+            row_tag=f"{TABLE}table-row",
+            cell_tag=f"{TABLE}table-cell",
+            paragraph_text=_paragraph_text,
+            heading_level=_heading_level,
+        )
+        yield from blocks_to_parts(blocks, chunk_size)
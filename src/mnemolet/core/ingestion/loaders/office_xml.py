@@ -0,0 +1,94 @@
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable
+from typing import BinaryIO, Iterator
+
+from mnemolet.core.ingestion.extractors.base import HeadingText
+
+CELL_SEPARATOR = " | "
+
+# (text, heading level or None)
+Block = tuple[str, int | None]
+
+
+def iter_blocks(
+    xml: BinaryIO,
+    paragraph_tags: set[str],
+    row_tag: str,
+    cell_tag: str,
+    paragraph_text: Callable[[ET.Element], str],
+    heading_level: Callable[[ET.Element], int | None],
+) -> Iterator[Block]:
+    """
+    Yield the paragraphs, headings and table rows of an office XML body in
+    document order, parsed incrementally.
+    - paragraphs nested in paragraphs (frames, notes) belong to the outer one.
+    - table rows are yielded as one block, cells separated by " | ".
+    - every element is dropped once handled, so memory stays bounded by the
+      largest paragraph, whatever the document size.
+    """
+    stack: list[ET.Element] = []
+    rows: list[list[str]] = []  # cells of the open rows
+    cells: list[list[str]] = []  # paragraphs of the open cells
+    depth = 0  # open paragraphs
+
+    for event, elem in ET.iterparse(xml, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            stack.append(elem)
+            if tag in paragraph_tags:
+                depth += 1
+            elif not depth and tag == row_tag:
+                rows.append([])
+            elif not depth and tag == cell_tag:
+                cells.append([])
+            continue
+
+        stack.pop()
+        if tag in paragraph_tags:
+            depth -= 1
+            if depth:
+                continue
+            text = paragraph_text(elem).strip()
+            if text and cells:
+                cells[-1].append(text)
+            elif text:
+                yield text, heading_level(elem)
+        elif not depth and tag == cell_tag and cells:
+            cell = " ".join(cells.pop())
+            if rows:
+                rows[-1].append(cell)
+        elif not depth and tag == row_tag and rows:
+            row = rows.pop()
+            if any(row):
+                line = CELL_SEPARATOR.join(row)
+                if cells:
+                    # nested table: the row is part of the outer cell
+                    cells[-1].append(line)
+                else:
+                    yield line, None
+
+        if not depth and stack:
+            stack[-1].remove(elem)
+
+
+def blocks_to_parts(blocks: Iterable[Block], chunk_size: int) -> Iterator[str]:
+    """
+    Join blocks into parts of about chunk_size chars, one block per line;
+    headings are yielded on their own as HeadingText.
+    """
+    buffer: list[str] = []
+    size = 0
+    for text, level in blocks:
+        if level is not None:
+            if buffer:
+                yield "".join(buffer)
+                buffer, size = [], 0
+            yield HeadingText(text + "\n", level)
+            continue
+        buffer.append(text + "\n")
+        size += len(text) + 1
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
@@ -1,33 +1,166 @@
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
-from pypdf import PdfReader
+from mnemolet.config import PDF_PAGES_PER_TASK, PDF_PARALLEL_MIN_PAGES, PDF_WORKERS
+from mnemolet.core.ingestion.extractors.base import PageText
 
+logger = logging.getLogger(__name__)
 
-def extract_pdf(file: Path, chunk_size: int) -> str:
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def pdf_workers() -> int:
+    return PDF_WORKERS or os.cpu_count() or 1
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
     """
-    Yield text chunks from a PDF.
+    Return the process pool extracting PDF pages, started on first use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            logger.info(f"[pdf] Starting {pdf_workers()} page extraction processes")
+            # spawn: forking a process that runs torch/tokenizer threads is unsafe
+            _pool = ProcessPoolExecutor(
+                max_workers=pdf_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _drop_pdf_pool(pool: ProcessPoolExecutor):
+    """
+    Forget a broken pool, the next get_pdf_pool() starts a new one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _page_texts(reader, start: int, end: int) -> Iterator[str]:
+    """
+    Yield the text of pages [start, end); a page that fails is logged and
+    left empty.
+    """
+    for n in range(start, end):
+        try:
+            yield reader.pages[n].extract_text() or ""
+        except Exception as e:
+            logger.warning(f"[pdf] Page {n + 1} failed: {e}")
+            yield ""
+
+
+def _extract_pages(source: str | bytes, start: int, end: int) -> list[str]:
+    """
+    Return the text of pages [start, end) of a PDF (path or content);
+    runs in a pool process.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(source if isinstance(source, str) else io.BytesIO(source))
+    return list(_page_texts(reader, start, end))
+
+
+def extract_pdf(
+    file: Path | BinaryIO,
+    chunk_size: int,
+    pages_per_task: int = PDF_PAGES_PER_TASK,
+    parallel_min_pages: int = PDF_PARALLEL_MIN_PAGES,
+) -> Iterator[PageText]:
+    """
+    Yield text chunks from a PDF, page by page and in page order.
+    - PDFs with at least `parallel_min_pages` pages are split into ranges of
+      `pages_per_task` pages extracted in the PDF process pool; a stream's
+      content is sent to every task, so it is split into one range per worker.
 
     Args:
-        file: PDF file path.
-        chunk_size: size of text chunks to yield.
+        file: PDF file path or binary stream.
+        chunk_size: max size of the text chunks to yield.
 
     Yields:
-        str: next chunk of text from PDF.
+        PageText: next chunk of text, with its page number.
     """
-    reader = PdfReader(file)
-    text = ""
+    from pypdf import PdfReader
+
+    source = str(file) if isinstance(file, Path) else file.read()
+    reader = PdfReader(source if isinstance(source, str) else io.BytesIO(source))
+    page_count = len(reader.pages)
 
-    for page in reader.pages:
-        page_text = page.extract_text()
+    if page_count < parallel_min_pages or pdf_workers() == 1:
+        pages = enumerate(_page_texts(reader, 0, page_count))
+    else:
+        if isinstance(source, bytes):
+            pages_per_task = -(-page_count // pdf_workers())
+        pages = _parallel_pages(source, page_count, pages_per_task)
 
-        if not page_text:
-            continue
+    for n, text in pages:
+        for i in range(0, len(text), chunk_size):
+            yield PageText(text[i : i + chunk_size] + "\n", n + 1)
 
-        text += page_text + "\n"
 
-        while len(text) >= chunk_size:
-            yield text[:chunk_size]
-            text = text[chunk_size]
+def _parallel_pages(
+    source: str | bytes, page_count: int, pages_per_task: int
+) -> Iterator[tuple[int, str]]:
+    """
+    Helper fn to extract page ranges in the pool and yield (index, text) in
+    page order. If a worker dies (OOM, a crash in pypdf), the pool is
+    replaced for the next PDFs and the rest of this one is extracted
+    in-process.
+    """
+    pool = get_pdf_pool()
+    done = 0
+    try:
+        for n, text in _pool_pages(pool, source, page_count, pages_per_task):
+            yield n, text
+            done = n + 1
+    except BrokenProcessPool as e:
+        logger.warning(
+            f"[pdf] Extraction pool broke ({e}), extracting pages "
+            f"{done + 1}-{page_count} in-process"
+        )
+        _drop_pdf_pool(pool)
+        from pypdf import PdfReader
+
+        reader = PdfReader(source if isinstance(source, str) else io.BytesIO(source))
+        yield from enumerate(_page_texts(reader, done, page_count), done)
+
+
+def _pool_pages(
+    pool: ProcessPoolExecutor, source: str | bytes, page_count: int, pages_per_task: int
+) -> Iterator[tuple[int, str]]:
+    """
+    Helper fn to yield (index, text) of the page ranges extracted in the
+    pool, in page order; two ranges per worker are in flight at a time.
+    """
+    ranges = iter(
+        (start, min(start + pages_per_task, page_count))
+        for start in range(0, page_count, pages_per_task)
+    )
+    in_flight = deque()
 
-    if text:
-        yield text
+    try:
+        while True:
+            while len(in_flight) < 2 * pdf_workers():
+                r = next(ranges, None)
+                if r is None:
+                    break
+                in_flight.append((r[0], pool.submit(_extract_pages, source, *r)))
+            if not in_flight:
+                return
+            start, future = in_flight.popleft()
+            yield from enumerate(future.result(), start)
+    finally:
+        for _, future in in_flight:
+            future.cancel()
@@ -1,7 +1,12 @@
 import logging
+import time
+from collections import deque
+from collections.abc import Iterable
+from itertools import chain, groupby
 from pathlib import Path
 
 from mnemolet.core.ingestion.loader import stream_files
+from mnemolet.core.ingestion.stats import IngestStats
 from mnemolet.core.storage.db_tracker import DBTracker
 
 logger = logging.getLogger(__name__)
@@ -42,14 +47,159 @@ def chunk_text(text: str, max_length: int = 3000) -> list[str]:
     return chunks
 
 
-def process_directory(dir: Path, tracker: DBTracker, force: bool, max_length: int):
+class TextChunker:
+    """
+    Split a stream of text parts into chunks of `max_length` chars.
+    - chunks continue across part boundaries; a boundary part (a heading)
+      starts a new chunk unless the current one is under `min_fill` full.
+    - holds at most one part plus `max_length` chars, whatever the file size.
+    """
+
+    min_fill = 0.25
+
+    def __init__(self, max_length: int = 3000):
+        self.max_length = max_length
+        self._rest = ""
+
+    def feed(self, part: str, boundary: bool = False) -> list[str]:
+        """
+        Add the next part, return the chunks completed by it.
+        """
+        if boundary and len(self._rest) >= self.max_length * self.min_fill:
+            rest, self._rest = self._rest, ""
+            return [rest] + self.feed(part)
+        text = self._rest + part if self._rest else part
+        end = len(text) - len(text) % self.max_length
+        chunks = [text[i : i + self.max_length] for i in range(0, end, self.max_length)]
+        self._rest = text[end:]
+        return chunks
+
+    def flush(self) -> list[str]:
+        """
+        Return the remaining text of the file as the last chunk.
+        """
+        rest, self._rest = self._rest, ""
+        return [rest] if rest else []
+
+
+class RecordChunker(TextChunker):
+    """
+    Pack whole records (CSV row groups, JSON records) into chunks of up to
+    `max_length` chars, one per line; only longer records are split.
+    - row groups (RowGroup) longer than a chunk are split between rows, each
+      piece starting with their header again.
+    """
+
+    def feed(self, part: str, boundary: bool = False) -> list[str]:
+        header = getattr(part, "header", None)
+        if header is not None and len(part) > self.max_length:
+            return [
+                chunk
+                for group in _regroup(part, header, self.max_length)
+                for chunk in self.feed(group)
+            ]
+        chunks = []
+        if self._rest and len(self._rest) + 1 + len(part) > self.max_length:
+            chunks.append(self._rest)
+            self._rest = ""
+        if len(part) > self.max_length:
+            return chunks + super().feed(part)
+        self._rest = f"{self._rest}\n{part}" if self._rest else part
+        return chunks
+
+
+def _regroup(rows: str, header: str, max_length: int) -> Iterable[str]:
+    """
+    Helper fn to split a row group into groups of up to max_length chars,
+    each starting with the header line (a single longer row stays whole).
+    """
+    group, size = [header], len(header)
+    for row in rows.split("\n")[1:]:
+        if len(group) > 1 and size + 1 + len(row) > max_length:
+            yield "\n".join(group)
+            group, size = [header], len(header)
+        group.append(row)
+        size += 1 + len(row)
+    if len(group) > 1:
+        yield "\n".join(group)
+
+
+class PageSpans:
+    """
+    Map chunks back to the pages their text came from, by char offsets:
+    parts are added as they are fed to a TextChunker, chunks taken in the
+    order the chunker returns them.
+    """
+
+    def __init__(self):
+        # (offset of the first char, page) for each page seen and not done
+        self._starts: deque[tuple[int, int]] = deque()
+        self._fed = 0
+        self._taken = 0
+
+    def add(self, page: int | None, length: int):
+        if page is not None and (not self._starts or self._starts[-1][1] != page):
+            self._starts.append((self._fed, page))
+        self._fed += length
+
+    def take(self, length: int) -> tuple[int, int] | None:
+        """
+        Return (first page, last page) of the next `length` chars, None for
+        unpaged text.
+        """
+        start, end = self._taken, self._taken + length
+        self._taken = end
+        while len(self._starts) > 1 and self._starts[1][0] <= start:
+            self._starts.popleft()
+        if not self._starts:
+            return None
+        first = self._starts[0][1]
+        last = next((p for o, p in reversed(self._starts) if o < end), first)
+        return first, last
+
+
+def process_directory(
+    dir: Path,
+    tracker: DBTracker,
+    force: bool,
+    max_length: int,
+    files: Iterable[Path] | None = None,
+    hashes: dict[str, str] | None = None,
+    stats: IngestStats | None = None,
+):
     """
     Combine file streaming and chunking.
+    - parts of a file are chunked as they arrive, so memory stays bounded
+      for files of any size.
+    - chunks of paged documents (PDF) get the pages they span as
+      `page_start` and `page_end`; chunks of office documents start at
+      headings.
     """
-    for data in stream_files(dir, tracker, force):
-        for chunk in chunk_text(data["content"], max_length=max_length):
-            yield {
-                "path": data["path"],
-                "chunk": chunk,
-                "hash": data["hash"],
-            }
+    stats = stats or IngestStats()
+    parts = stream_files(dir, tracker, force, files=files, hashes=hashes, stats=stats)
+
+    # the loader yields all parts of a file one after another
+    for (path, file_hash), file_parts in groupby(
+        parts, key=lambda d: (d["path"], d["hash"])
+    ):
+        first = next(file_parts)
+        chunker = (RecordChunker if first["records"] else TextChunker)(max_length)
+        pages = PageSpans()
+        for data in chain([first], file_parts, [None]):
+            start = time.perf_counter()
+            if data:
+                pages.add(data["page"], len(data["content"]))
+                boundary = data["heading"] is not None
+                chunks = chunker.feed(data["content"], boundary)
+            else:
+                chunks = chunker.flush()
+            stats.add("chunk", time.perf_counter() - start, items=len(chunks))
+            for chunk in chunks:
+                item = {
+                    "path": path,
+                    "chunk": chunk,
+                    "hash": file_hash,
+                }
+                if span := pages.take(len(chunk)):
+                    item["page_start"], item["page_end"] = span
+                yield item
@@ -0,0 +1,230 @@
+import logging
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from mnemolet.config import (
+    SCAN_EXCLUDE,
+    SCAN_GITIGNORE,
+    SCAN_INCLUDE,
+    SCAN_MAX_AGE_DAYS,
+    SCAN_MAX_FILE_MB,
+    SCAN_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+GITIGNORE = ".gitignore"
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """
+    One .gitignore-style pattern, matched against paths relative to `base`.
+    """
+
+    regex: re.Pattern
+    base: str  # relative dir of the .gitignore ("" = scan root)
+    negate: bool
+    dir_only: bool
+
+    def matches(self, rel: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel.startswith(self.base + "/"):
+                return False
+            rel = rel[len(self.base) + 1 :]
+        return self.regex.match(rel) is not None
+
+
+def _translate(glob: str) -> str:
+    """
+    Helper fn to turn a gitignore glob into a regex: `*` and `?` stay within
+    one path segment, `**` spans segments.
+    """
+    out = []
+    i = 0
+    while i < len(glob):
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("/**", i) and i + 3 == len(glob):
+            out.append("/.*")
+            i += 3
+        elif glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif glob[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif glob[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif glob[i] == "[" and (end := glob.find("]", i + 1)) > 0:
+            body = glob[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(glob[i]))
+            i += 1
+    return "".join(out)
+
+
+def parse_patterns(lines: Iterable[str], base: str = "") -> list[Pattern]:
+    """
+    Parse .gitignore lines: comments, `!` negation, trailing `/` for
+    directories only, a `/` at the start or in the middle anchors the
+    pattern to `base`, otherwise it matches at any depth.
+    """
+    patterns = []
+    for line in lines:
+        line = line.rstrip("\n").rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        regex = _translate(line.lstrip("/"))
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+        patterns.append(
+            Pattern(re.compile(f"{regex}$", re.DOTALL), base, negate, dir_only)
+        )
+    return patterns
+
+
+def is_ignored(patterns: Iterable[Pattern], rel: str, is_dir: bool) -> bool:
+    """
+    Last matching pattern wins, like git.
+    """
+    ignored = False
+    for p in patterns:
+        if p.matches(rel, is_dir):
+            ignored = not p.negate
+    return ignored
+
+
+class Scanner:
+    """
+    Walk a directory tree once and stream the files to ingest.
+    - directories are listed with os.scandir in a pool of `workers` threads
+      (a win on network shares, where listing is mostly waiting).
+    - exclude patterns and .gitignore files prune whole subtrees; include
+      patterns, size and age filters apply to files.
+    - `found` is the running number of files yielded so far.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        exclude: list[str] = SCAN_EXCLUDE,
+        include: list[str] = SCAN_INCLUDE,
+        gitignore: bool = SCAN_GITIGNORE,
+        max_file_mb: float = SCAN_MAX_FILE_MB,
+        max_age_days: float = SCAN_MAX_AGE_DAYS,
+        workers: int = SCAN_WORKERS,
+    ):
+        self.root = Path(root)
+        self.exclude = parse_patterns(exclude)
+        self.include = parse_patterns(include)
+        self.gitignore = gitignore
+        self.max_bytes = int(max_file_mb * 1024**2)
+        self.min_mtime = time.time() - max_age_days * 86400 if max_age_days else 0
+        self.workers = max(1, workers)
+        self.found = 0
+        self.skipped = 0
+        self.dirs = 0
+
+    def __iter__(self) -> Iterator[Path]:
+        if self.root.is_file():
+            self.found += 1
+            yield self.root
+            return
+
+        pending: deque[tuple[str, str, list[Pattern]]] = deque(
+            [(str(self.root), "", self.exclude)]
+        )
+        running: set[Future] = set()
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="scan") as pool:
+            try:
+                while pending or running:
+                    while pending and len(running) < 2 * self.workers:
+                        running.add(pool.submit(self._list, *pending.popleft()))
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        files, subdirs, skipped = future.result()
+                        self.dirs += 1
+                        self.skipped += skipped
+                        pending.extend(subdirs)
+                        for path in files:
+                            self.found += 1
+                            yield Path(path)
+            finally:
+                for future in running:
+                    future.cancel()
+        logger.info(
+            f"[scan] {self.root}: {self.found} files, {self.dirs} dirs, "
+            f"{self.skipped} skipped"
+        )
+
+    def _list(self, path: str, rel: str, patterns: list[Pattern]):
+        """
+        Helper fn (runs in the pool) to list one directory; returns its
+        files, its subdirectories to walk and the number of skipped entries.
+        """
+        files, subdirs, skipped = [], [], 0
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            logger.warning(f"[scan] Can not list {path}: {e}")
+            return files, subdirs, 0
+
+        if self.gitignore and any(e.name == GITIGNORE for e in entries):
+            try:
+                with open(os.path.join(path, GITIGNORE), encoding="utf-8") as f:
+                    patterns = patterns + parse_patterns(f, rel)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"[scan] Can not read {path}/{GITIGNORE}: {e}")
+
+        for entry in entries:
+            entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+            try:
+                # symlinked directories are not followed (no loops)
+                if entry.is_dir(follow_symlinks=False):
+                    if is_ignored(patterns, entry_rel, is_dir=True):
+                        skipped += 1
+                    else:
+                        subdirs.append((entry.path, entry_rel, patterns))
+                elif entry.is_file() and self._accept(entry, entry_rel, patterns):
+                    files.append(entry.path)
+                else:
+                    skipped += 1
+            except OSError as e:
+                logger.debug(f"[scan] Skipping {entry.path}: {e}")
+                skipped += 1
+        return files, subdirs, skipped
+
+    def _accept(self, entry: os.DirEntry, rel: str, patterns: list[Pattern]) -> bool:
+        if is_ignored(patterns, rel, is_dir=False):
+            return False
+        if self.include and not any(p.matches(rel, False) for p in self.include):
+            return False
+        if self.max_bytes or self.min_mtime:
+            st = entry.stat()
+            if self.max_bytes and st.st_size > self.max_bytes:
+                return False
+            if st.st_mtime < self.min_mtime:
+                return False
+        return True
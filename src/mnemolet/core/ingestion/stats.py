@@ -0,0 +1,112 @@
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+# failed files kept in the result, the rest are only counted in the log
+MAX_ERRORS = 100
+
+
+@dataclass
+class StageStats:
+    seconds: float = 0.0
+    items: int = 0
+    bytes: int = 0
+
+
+class IngestStats:
+    """
+    Accumulate time, items and bytes per ingestion stage and per extractor.
+    - stages: hash, track, extract, chunk, dedup, embed, store.
+    - extractors: time, files and input bytes per extractor class.
+    - errors: files that failed to extract.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, StageStats] = {}
+        self.extractors: dict[str, StageStats] = {}
+        self.errors: list[dict] = []
+
+    def add(self, stage: str, seconds: float, items: int = 0, bytes: int = 0):
+        s = self.stages.setdefault(stage, StageStats())
+        s.seconds += seconds
+        s.items += items
+        s.bytes += bytes
+
+    def add_extractor(self, name: str, seconds: float, items: int = 0, bytes: int = 0):
+        s = self.extractors.setdefault(name, StageStats())
+        s.seconds += seconds
+        s.items += items
+        s.bytes += bytes
+
+    def add_error(self, path: str, error: str):
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"path": path, "error": error})
+
+    @contextmanager
+    def time(self, stage: str, items: int = 0, bytes: int = 0):
+        """
+        Add the duration of the block to the given stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start, items, bytes)
+
+    def timed(
+        self,
+        iterable: Iterable,
+        stage: str,
+        extractor: str | None = None,
+        bytes: int = 0,
+    ) -> Iterator:
+        """
+        Yield from iterable, adding the time spent producing items to stage.
+        Time spent by the consumer between items is not counted.
+        - with `extractor`, the run also counts as one file of `bytes` for it.
+        """
+        it = iter(iterable)
+        elapsed = 0.0
+        count = 0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                count += 1
+                yield item
+        finally:
+            self.add(stage, elapsed, items=count, bytes=bytes)
+            if extractor is not None:
+                self.add_extractor(extractor, elapsed, items=1, bytes=bytes)
+
+    def to_dict(self) -> dict:
+        return {
+            "stages": {k: _rounded(v) for k, v in self.stages.items()},
+            "extractors": {k: _rounded(v) for k, v in self.extractors.items()},
+            "errors": list(self.errors),
+        }
+
+    def log_summary(self):
+        for name, s in self.stages.items():
+            logger.info(
+                f"[stats] {name:8} {s.seconds:8.3f}s items={s.items} bytes={s.bytes}"
+            )
+        for name, s in self.extractors.items():
+            logger.info(
+                f"[stats] {name:20} {s.seconds:8.3f}s files={s.items} bytes={s.bytes}"
+            )
+
+
+def _rounded(s: StageStats) -> dict:
+    d = asdict(s)
+    d["seconds"] = round(d["seconds"], 4)
+    return d
@@ -5,6 +5,7 @@ from mnemolet.core.query.generation.local_generator import (
     LocalGenerator,
 )
 from mnemolet.core.query.retrieval.retriever import Retriever
+from mnemolet.core.utils.tracing import span
 from mnemolet.core.utils.utils import _only_unique
 
 logger = logging.getLogger(__name__)
@@ -19,43 +20,44 @@ def generate_answer(
     """
     Wrapper around LocalGenerator.
     """
-    # ------- Retrieval -------
-    filtered_results = retriever.retrieve(query)
-
-    # ------- Answer mode -------
-    if not chat:
-        if not filtered_results:
-            yield "No relevant information found.", []
+    with span("generate_answer", chat=chat):
+        # ------- Retrieval -------
+        filtered_results = retriever.retrieve(query)
+
+        # ------- Answer mode -------
+        if not chat:
+            if not filtered_results:
+                yield "No relevant information found.", []
+                return
+
+            # generator = LocalGenerator(ollama_url, model)
+            context_chunks = [r["text"] for r in filtered_results]
+            logger.info("Generating answer..")
+
+            # stream LLM output
+            for c in _generate_llm_chunks(generator, query, context_chunks):
+                yield c, None
+
+            # finally send sources
+            yield _yield_sources_if_any(filtered_results)
             return
 
-        # generator = LocalGenerator(ollama_url, model)
-        context_chunks = [r["text"] for r in filtered_results]
-        logger.info("Generating answer..")
+        # ------- Chat mode -------
+        if filtered_results:
+            logger.info("Relevant context found for chat.")
+            context_chunks = [r["text"] for r in filtered_results]
+        else:
+            logger.info("No relevant context found; continue chat without context.")
+            context_chunks = []
+
+        logger.info("Generating chat response...")
 
         # stream LLM output
         for c in _generate_llm_chunks(generator, query, context_chunks):
             yield c, None
 
-        # finally send sources
+        # return sources only if we had any
         yield _yield_sources_if_any(filtered_results)
-        return
-
-    # ------- Chat mode -------
-    if filtered_results:
-        logger.info("Relevant context found for chat.")
-        context_chunks = [r["text"] for r in filtered_results]
-    else:
-        logger.info("No relevant context found; continue chat without context.")
-        context_chunks = []
-
-    logger.info("Generating chat response...")
-
-    # stream LLM output
-    for c in _generate_llm_chunks(generator, query, context_chunks):
-        yield c, None
-
-    # return sources only if we had any
-    yield _yield_sources_if_any(filtered_results)
 
 
 def _generate_llm_chunks(
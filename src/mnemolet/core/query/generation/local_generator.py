@@ -1,10 +1,19 @@
 import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import Generator
 
 import requests
 
+from mnemolet.core.utils.limits import get_limiter
+from mnemolet.core.utils.metrics import (
+    OLLAMA_ERRORS,
+    OLLAMA_GENERATION_SECONDS,
+    OLLAMA_TTFT_SECONDS,
+)
+from mnemolet.core.utils.tracing import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,8 +40,10 @@ class LocalGenerator:
         # if not context_chunks:
         #    return "No relevant context found."
 
-        context = "\n\n".join(context_chunks)
-        prompt = f"Context:\n{context}\n\nQuestion:\n{query}\n\nAnswer concisely:"
+        with span("prompt.build", chunks=len(context_chunks)) as attrs:
+            context = "\n\n".join(context_chunks)
+            prompt = f"Context:\n{context}\n\nQuestion:\n{query}\n\nAnswer concisely:"
+            attrs["prompt_chars"] = len(prompt)
 
         payload = {
             "model": self.cfg.model,
@@ -41,34 +52,54 @@ class LocalGenerator:
             "options": {"keep_alive": "10m"},
         }
 
-        try:
-            response = requests.post(
-                f"{self.cfg.url}/api/generate", json=payload, stream=True
-            )
-            response.raise_for_status()  # raise for non 200 status
-
-            for line in response.iter_lines(decode_unicode=True, chunk_size=1):
-                if not line:
-                    continue
-
-                try:
-                    chunk = json.loads(line)
-
-                    if "response" in chunk:
-                        yield chunk["response"]
-
-                    if chunk.get("done"):
-                        break
-
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        f"JSON decode failed: {e}. Raw response: {response.text[:1000]}"
-                    )
-                    raise RuntimeError(f"Invalid JSON response from Ollama: {e}") from e
-                    continue
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError(f"Failed to generate answer: {e}") from e
+        with (
+            span("ollama.generate", model=self.cfg.model) as attrs,
+            get_limiter("ollama").acquire(),
+        ):
+            start = time.perf_counter()
+            tokens = 0
+            first_token = True
+            try:
+                response = requests.post(
+                    f"{self.cfg.url}/api/generate", json=payload, stream=True
+                )
+                response.raise_for_status()  # raise for non 200 status
+
+                for line in response.iter_lines(decode_unicode=True, chunk_size=1):
+                    if not line:
+                        continue
+
+                    try:
+                        chunk = json.loads(line)
+
+                        if "response" in chunk:
+                            if first_token:
+                                ttft = time.perf_counter() - start
+                                OLLAMA_TTFT_SECONDS.observe(ttft)
+                                attrs["ttft_ms"] = round(ttft * 1000, 3)
+                                first_token = False
+                            tokens += 1
+                            attrs["tokens"] = tokens
+                            yield chunk["response"]
+
+                        if chunk.get("done"):
+                            break
+
+                    except json.JSONDecodeError as e:
+                        logger.error(
+                            f"JSON decode failed: {e}. "
+                            f"Raw response: {response.text[:1000]}"
+                        )
+                        raise RuntimeError(
+                            f"Invalid JSON response from Ollama: {e}"
+                        ) from e
+                        continue
+
+                OLLAMA_GENERATION_SECONDS.observe(time.perf_counter() - start)
+            except requests.RequestException as e:
+                OLLAMA_ERRORS.inc()
+                logger.error(f"Request failed: {e}")
+                raise RuntimeError(f"Failed to generate answer: {e}") from e
 
 
 def get_llm_generator(url: str, model: str) -> LocalGenerator:
@@ -1,24 +1,53 @@
 from typing import Any
 
-from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
+from qdrant_client.models import SearchParams
+
+from mnemolet.core.embeddings.query_batcher import get_query_batcher
+from mnemolet.core.utils.limits import get_limiter
+from mnemolet.core.utils.metrics import QDRANT_SEARCH_SECONDS, QUERY_ENCODE_SECONDS
+from mnemolet.core.utils.qdrant import OPTIONAL_FIELDS, get_qdrant_client
+from mnemolet.core.utils.tracing import span
 
 
 class Qdrant:
     def __init__(self, qdrant_url: str, collection_name, model: str):
-        self.model = SentenceTransformer(model)
-        self.client = QdrantClient(qdrant_url)
+        # shared model, concurrent queries are encoded in one batch
+        self.encoder = get_query_batcher(model)
+        self.client = get_qdrant_client(qdrant_url)
         self.collection_name = collection_name
 
-    def search(self, query: str, top_k: int = 5) -> list[dict[str, Any]]:
-        query_vector = self.model.encode(query).tolist()
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        exact: bool = False,
+        hnsw_ef: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return top_k closest chunks for the query.
+        - `exact` bypasses the HNSW index (brute force, used as ground truth).
+        - `hnsw_ef` overrides the search beam size of the index.
+        """
+        search_params = None
+        if exact or hnsw_ef is not None:
+            search_params = SearchParams(exact=exact, hnsw_ef=hnsw_ef)
+
+        with span("query.encode"), get_limiter("embedding").acquire():
+            with QUERY_ENCODE_SECONDS.time():
+                query_vector = self.encoder.encode(query).tolist()
 
-        results = self.client.query_points(
-            collection_name=self.collection_name,
-            query=query_vector,
-            limit=top_k,
-            with_payload=True,
-        )
+        with (
+            span("qdrant.search", limit=top_k, exact=exact),
+            get_limiter("qdrant").acquire(),
+            QDRANT_SEARCH_SECONDS.time(),
+        ):
+            results = self.client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                limit=top_k,
+                search_params=search_params,
+                with_payload=True,
+            )
 
         return [
             {
@@ -27,6 +56,7 @@ class Qdrant:
                 "score": i.score,
                 "path": i.payload.get("path", ""),
                 "hash": i.payload.get("hash", ""),
+                **{k: i.payload[k] for k in OPTIONAL_FIELDS if k in i.payload},
             }
             for i in results.points
         ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from mnemolet.core.query.retrieval.search_documents import search_documents
+from mnemolet.core.utils.tracing import span
 from mnemolet.core.utils.utils import filter_by_min_score
 
 
@@ -13,6 +14,8 @@ class RetrieverConfig:
     embed_model: str
     top_k: int
     min_score: float
+    exact: bool = False
+    hnsw_ef: int | None = None
 
 
 class Retriever:
@@ -23,14 +26,20 @@ class Retriever:
         """
         Retrieve and filter context chunks from Qdrant.
         """
-        results = search_documents(
-            self.cfg.qdrant_url,
-            self.cfg.collection_name,
-            self.cfg.embed_model,
-            query,
-            self.cfg.top_k,
-        )
-        return filter_by_min_score(results, self.cfg.min_score)
+        with span("retriever.retrieve", top_k=self.cfg.top_k) as attrs:
+            results = search_documents(
+                self.cfg.qdrant_url,
+                self.cfg.collection_name,
+                self.cfg.embed_model,
+                query,
+                self.cfg.top_k,
+                exact=self.cfg.exact,
+                hnsw_ef=self.cfg.hnsw_ef,
+            )
+            with span("retriever.filter", min_score=self.cfg.min_score):
+                filtered = filter_by_min_score(results, self.cfg.min_score)
+            attrs.update(results=len(results), kept=len(filtered))
+        return filtered
 
 
 def get_retriever(
@@ -1,12 +1,21 @@
 from mnemolet.core.query.retrieval.qdrant import Qdrant
+from mnemolet.core.utils.tracing import span
 
 
 def search_documents(
-    qdrant_url: str, collection_name: str, embed_model: str, query: str, top_k: int
+    qdrant_url: str,
+    collection_name: str,
+    embed_model: str,
+    query: str,
+    top_k: int,
+    exact: bool = False,
+    hnsw_ef: int | None = None,
 ):
     """
     Wrapper around QdrantRetriever.
     """
-    xz = Qdrant(qdrant_url, collection_name, embed_model)
-    results = xz.search(query, top_k)
+    # loads the query model and connects on first use
+    with span("retriever.setup", model=embed_model):
+        xz = Qdrant(qdrant_url, collection_name, embed_model)
+    results = xz.search(query, top_k, exact=exact, hnsw_ef=hnsw_ef)
     return results
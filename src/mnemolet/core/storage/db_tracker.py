@@ -1,3 +1,4 @@
+import json
 import logging
 import sqlite3
 from datetime import UTC, datetime
@@ -18,6 +19,67 @@ CREATE TABLE IF NOT EXISTS files (
 );
 """
 
+CREATE_TABLE_RUNS = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT,
+    finished_at TEXT,
+    status TEXT DEFAULT 'running',
+    version TEXT,
+    directory TEXT,
+    collection TEXT,
+    files INTEGER DEFAULT 0,
+    chunks INTEGER DEFAULT 0,
+    bytes INTEGER DEFAULT 0,
+    seconds REAL DEFAULT 0,
+    errors INTEGER DEFAULT 0,
+    error TEXT,
+    details TEXT, -- stages, extractors, batching and errors as JSON
+    config TEXT
+);
+"""
+
+# MinHash signatures of the chunks stored per collection, see dedup.py
+CREATE_TABLE_CHUNK_SIGNATURES = """
+CREATE TABLE IF NOT EXISTS chunk_signatures (
+    collection TEXT,
+    path TEXT,
+    hash TEXT,
+    position INTEGER,
+    signature BLOB,
+    PRIMARY KEY (collection, path, hash, position)
+);
+"""
+
+# LSH band keys of the stored chunk signatures, looked up per new chunk
+CREATE_TABLE_CHUNK_BANDS = """
+CREATE TABLE IF NOT EXISTS chunk_bands (
+    collection TEXT,
+    band INTEGER,
+    key BLOB,
+    path TEXT,
+    hash TEXT,
+    position INTEGER,
+    PRIMARY KEY (collection, band, key, path, hash, position)
+) WITHOUT ROWID;
+"""
+
+# chunks found to nearly duplicate a stored chunk, suppressed or linked
+CREATE_TABLE_NEAR_DUPLICATES = """
+CREATE TABLE IF NOT EXISTS near_duplicates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    collection TEXT,
+    path TEXT,
+    hash TEXT,
+    position INTEGER,
+    original_path TEXT,
+    original_hash TEXT,
+    original_position INTEGER,
+    similarity REAL,
+    action TEXT
+);
+"""
+
 
 class DBTracker:
     def __init__(self, db_path: Path = DB_PATH):
@@ -42,6 +104,10 @@ class DBTracker:
         with self._get_connection() as conn:
             logger.info("[DBTracker] Create Table Files")
             conn.execute(CREATE_TABLE_FILES)
+            conn.execute(CREATE_TABLE_RUNS)
+            conn.execute(CREATE_TABLE_CHUNK_SIGNATURES)
+            conn.execute(CREATE_TABLE_CHUNK_BANDS)
+            conn.execute(CREATE_TABLE_NEAR_DUPLICATES)
 
     def add_file(self, path: str, file_hash: str):
         """
@@ -83,3 +149,192 @@ class DBTracker:
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
             return [dict(row) for row in rows]
+
+    def start_run(
+        self, directory: str, collection: str, config: dict, version: str
+    ) -> int:
+        """
+        Record the start of an ingestion run, returns its id.
+        """
+        with self._get_connection() as conn:
+            cur = conn.execute(
+                """
+                INSERT INTO runs (started_at, version, directory, collection, config)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    datetime.now(UTC).isoformat(),
+                    version,
+                    directory,
+                    collection,
+                    json.dumps(config),
+                ),
+            )
+            return cur.lastrowid
+
+    def finish_run(
+        self, run_id: int, result: dict | None = None, error: str | None = None
+    ):
+        """
+        Store the outcome of a run: its result dict, or the error that stopped it.
+        """
+        result = result or {}
+        extract = result.get("stages", {}).get("extract", {})
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE runs SET finished_at = ?, status = ?, files = ?, chunks = ?,
+                    bytes = ?, seconds = ?, errors = ?, error = ?, details = ?
+                WHERE id = ?
+            """,
+                (
+                    datetime.now(UTC).isoformat(),
+                    "failed" if error else "done",
+                    result.get("files", 0),
+                    result.get("chunks", 0),
+                    extract.get("bytes", 0),
+                    result.get("time", 0),
+                    len(result.get("errors", [])),
+                    error,
+                    json.dumps(
+                        {
+                            k: result[k]
+                            for k in (
+                                "stages",
+                                "extractors",
+                                "batching",
+                                "dedup",
+                                "errors",
+                            )
+                            if k in result
+                        }
+                    ),
+                    run_id,
+                ),
+            )
+
+    def list_runs(self, limit: int = 20, collection: str | None = None) -> list[dict]:
+        """
+        List the latest runs (newest first) with their throughput.
+        """
+        query = "SELECT * FROM runs"
+        params = ()
+        if collection is not None:
+            query += " WHERE collection = ?"
+            params = (collection,)
+        query += " ORDER BY id DESC LIMIT ?"
+        with self._get_connection() as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        return [_run_to_dict(row) for row in rows]
+
+    def add_chunk_signatures(
+        self,
+        collection: str,
+        rows: list[tuple[str, str, int, bytes, list[tuple[int, bytes]]]],
+    ):
+        """
+        Store (path, hash, position, signature, band keys) of chunks of a
+        collection; band keys are (band, key) pairs.
+        """
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO chunk_signatures
+                    (collection, path, hash, position, signature)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                [(collection, *row[:4]) for row in rows],
+            )
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO chunk_bands
+                    (collection, band, key, path, hash, position)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (collection, band, key, path, file_hash, position)
+                    for path, file_hash, position, _, keys in rows
+                    for band, key in keys
+                ],
+            )
+
+    def find_chunk_signatures(
+        self, collection: str, keys: list[tuple[int, bytes]]
+    ) -> list[tuple[str, str, int, bytes]]:
+        """
+        Return (path, hash, position, signature) of the chunks of a collection
+        sharing at least one (band, key) pair.
+        """
+        found = {}
+        with self._get_connection() as conn:
+            for band, key in keys:
+                for row in conn.execute(
+                    """
+                    SELECT s.path, s.hash, s.position, s.signature
+                    FROM chunk_bands b
+                    JOIN chunk_signatures s
+                        ON s.collection = b.collection AND s.path = b.path
+                        AND s.hash = b.hash AND s.position = b.position
+                    WHERE b.collection = ? AND b.band = ? AND b.key = ?
+                """,
+                    (collection, band, key),
+                ):
+                    found[tuple(row[:3])] = tuple(row)
+        return list(found.values())
+
+    def add_near_duplicates(self, collection: str, rows: list[tuple]):
+        """
+        Record near-duplicate chunks: (path, hash, position, original_path,
+        original_hash, original_position, similarity, action).
+        """
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO near_duplicates (collection, path, hash, position,
+                    original_path, original_hash, original_position, similarity,
+                    action)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                [(collection, *row) for row in rows],
+            )
+
+    def list_near_duplicates(
+        self, collection: str | None = None, limit: int = 20
+    ) -> list[dict]:
+        """
+        List the latest near-duplicate chunks (newest first).
+        """
+        query = "SELECT * FROM near_duplicates"
+        params = ()
+        if collection is not None:
+            query += " WHERE collection = ?"
+            params = (collection,)
+        query += " ORDER BY id DESC LIMIT ?"
+        with self._get_connection() as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def clear_chunk_signatures(self, collection: str):
+        """
+        Forget the chunk signatures and duplicates of a collection (when it
+        is recreated or removed).
+        """
+        with self._get_connection() as conn:
+            conn.execute(
+                "DELETE FROM chunk_signatures WHERE collection = ?", (collection,)
+            )
+            conn.execute("DELETE FROM chunk_bands WHERE collection = ?", (collection,))
+            conn.execute(
+                "DELETE FROM near_duplicates WHERE collection = ?", (collection,)
+            )
+
+
+def _run_to_dict(row: sqlite3.Row) -> dict:
+    run = dict(row)
+    run["config"] = json.loads(run["config"] or "{}")
+    run["details"] = json.loads(run["details"] or "{}")
+    seconds = run["seconds"] or 0
+    run["files_per_sec"] = round(run["files"] / seconds, 2) if seconds else 0.0
+    run["chunks_per_sec"] = round(run["chunks"] / seconds, 2) if seconds else 0.0
+    run["mb_per_sec"] = round(run["bytes"] / 1024**2 / seconds, 3) if seconds else 0.0
+    return run
@@ -0,0 +1,140 @@
+import logging
+import threading
+from contextlib import contextmanager
+
+from mnemolet.config import (
+    LIMIT_EMBEDDING,
+    LIMIT_OLLAMA,
+    LIMIT_QDRANT,
+    LIMIT_QUEUE,
+    LIMIT_TIMEOUT,
+)
+from mnemolet.core.utils.metrics import RESOURCE_REJECTED
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceBusy(RuntimeError):
+    """
+    Raised when a limited resource can not take more work.
+    """
+
+    def __init__(self, resource: str, message: str):
+        super().__init__(message)
+        self.resource = resource
+
+
+class QueueFull(ResourceBusy):
+    """
+    Too many callers are already waiting for the resource.
+    """
+
+
+class ResourceTimeout(ResourceBusy):
+    """
+    Waited too long for a free slot.
+    """
+
+
+class ResourceLimiter:
+    """
+    Limit how many callers use a resource at the same time.
+    - up to `max_concurrent` callers run, up to `max_queue` callers wait
+      (at most `timeout` seconds), everybody else is rejected.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, timeout: float):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self._sem = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def check_capacity(self):
+        """
+        Raise QueueFull if a new caller would be rejected right now.
+        """
+        with self._lock:
+            if self.in_flight >= self.max_concurrent and self.queued >= self.max_queue:
+                self.rejected += 1
+                RESOURCE_REJECTED.inc(resource=self.name)
+                raise QueueFull(self.name, f"{self.name} queue is full")
+
+    @contextmanager
+    def acquire(self):
+        """
+        Hold a slot of the resource while inside the block.
+        """
+        if not self._sem.acquire(blocking=False):
+            with self._lock:
+                if self.queued >= self.max_queue:
+                    self.rejected += 1
+                    RESOURCE_REJECTED.inc(resource=self.name)
+                    raise QueueFull(self.name, f"{self.name} queue is full")
+                self.queued += 1
+
+            acquired = self._sem.acquire(timeout=self.timeout)
+
+            with self._lock:
+                self.queued -= 1
+                if not acquired:
+                    self.timed_out += 1
+            if not acquired:
+                raise ResourceTimeout(
+                    self.name,
+                    f"Timed out waiting for {self.name} after {self.timeout}s",
+                )
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._sem.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "limit": self.max_concurrent,
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "max_queue": self.max_queue,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+
+
+_LIMITERS: dict[str, ResourceLimiter] = {}
+_LIMITS = {
+    "embedding": LIMIT_EMBEDDING,
+    "qdrant": LIMIT_QDRANT,
+    "ollama": LIMIT_OLLAMA,
+}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str) -> ResourceLimiter:
+    """
+    Return process-wide limiter for the given resource.
+    """
+    with _limiters_lock:
+        if name not in _LIMITERS:
+            _LIMITERS[name] = ResourceLimiter(
+                name, _LIMITS.get(name, 1), LIMIT_QUEUE, LIMIT_TIMEOUT
+            )
+            logger.debug(f"Created limiter {name}: {_LIMITERS[name].stats()}")
+        return _LIMITERS[name]
+
+
+def limiter_stats() -> dict[str, dict]:
+    """
+    Return stats of all known limiters.
+    """
+    return {name: get_limiter(name).stats() for name in _LIMITS}
@@ -0,0 +1,288 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+# latency buckets in seconds, from sub-millisecond cache hits to slow generation
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], **extra) -> str:
+    pairs = list(zip(names, values)) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """
+    Base of all metrics: a value per label combination, guarded by a lock.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key, value) -> list[str]:
+        labels = _format_labels(self.labelnames, key)
+        return [f"{self.name}{labels} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing value.
+    """
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down.
+    """
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values in cumulative buckets.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # per bucket counts (+Inf last), sum, count
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Observe the duration of the block in seconds.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def _render_value(self, key, value) -> list[str]:
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, n in zip(self.buckets + (math.inf,), counts):
+            cumulative += n
+            labels = _format_labels(self.labelnames, key, le=_format_value(bound))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics, rendered in Prometheus text format.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames=()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames=()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames=(), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """
+    Return process-wide metrics registry.
+    """
+    return _REGISTRY
+
+
+# metrics shared across modules, defined once here
+HTTP_IN_FLIGHT = _REGISTRY.gauge(
+    "mnemolet_http_requests_in_flight", "HTTP requests being processed."
+)
+HTTP_REQUESTS = _REGISTRY.counter(
+    "mnemolet_http_requests_total",
+    "HTTP requests by handler, method and status.",
+    ("handler", "method", "status"),
+)
+HTTP_DURATION = _REGISTRY.histogram(
+    "mnemolet_http_request_duration_seconds",
+    "HTTP request duration until the response is complete.",
+    ("handler",),
+)
+QUERY_ENCODE_SECONDS = _REGISTRY.histogram(
+    "mnemolet_query_encode_seconds", "Time to embed a search query."
+)
+QUERY_BATCH_QUERIES = _REGISTRY.histogram(
+    "mnemolet_query_batch_size",
+    "Queries encoded together by the query batcher.",
+    buckets=SIZE_BUCKETS,
+)
+QDRANT_SEARCH_SECONDS = _REGISTRY.histogram(
+    "mnemolet_qdrant_search_seconds", "Qdrant vector search latency."
+)
+OLLAMA_TTFT_SECONDS = _REGISTRY.histogram(
+    "mnemolet_ollama_time_to_first_token_seconds",
+    "Time from the Ollama request until the first generated token.",
+)
+OLLAMA_GENERATION_SECONDS = _REGISTRY.histogram(
+    "mnemolet_ollama_generation_seconds", "Total Ollama generation time."
+)
+OLLAMA_ERRORS = _REGISTRY.counter(
+    "mnemolet_ollama_errors_total", "Failed Ollama generations."
+)
+INGEST_STAGE_SECONDS = _REGISTRY.histogram(
+    "mnemolet_ingest_stage_seconds",
+    "Ingestion time per stage and stored batch (extract, embed, store).",
+    ("stage",),
+)
+INGEST_BATCH_SIZE = _REGISTRY.gauge(
+    "mnemolet_ingest_batch_size", "Current chunks per embed + store batch."
+)
+INGEST_FILES = _REGISTRY.counter("mnemolet_ingest_files_total", "Ingested files.")
+INGEST_CHUNKS = _REGISTRY.counter("mnemolet_ingest_chunks_total", "Stored chunks.")
+CACHE_REQUESTS = _REGISTRY.counter(
+    "mnemolet_cache_requests_total",
+    "Lookups of in-process caches (loaded models, Qdrant clients).",
+    ("cache", "result"),
+)
+RESOURCE_IN_FLIGHT = _REGISTRY.gauge(
+    "mnemolet_resource_in_flight", "Callers using a limited resource.", ("resource",)
+)
+RESOURCE_QUEUED = _REGISTRY.gauge(
+    "mnemolet_resource_queued", "Callers waiting for a limited resource.", ("resource",)
+)
+RESOURCE_REJECTED = _REGISTRY.counter(
+    "mnemolet_resource_rejected_total",
+    "Callers rejected by a full queue.",
+    ("resource",),
+)
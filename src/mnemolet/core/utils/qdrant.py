@@ -1,23 +1,84 @@
 import logging
+import os
+import threading
 
-import requests
 from qdrant_client import QdrantClient
-from requests.exceptions import RequestException
+
+from mnemolet.config import QDRANT_GRPC_PORT, QDRANT_PREFER_GRPC
+from mnemolet.core.utils.metrics import CACHE_REQUESTS
 
 logger = logging.getLogger(__name__)
 
+# optional payload fields of chunks from paged documents (PDF)
+PAGE_FIELDS = ("page_start", "page_end")
+# optional payload fields of chunks stored as near-duplicates ([dedup] link)
+DUPLICATE_FIELDS = ("duplicate_of", "duplicate_similarity")
+OPTIONAL_FIELDS = PAGE_FIELDS + DUPLICATE_FIELDS
+
+_CLIENTS: dict[tuple[str, bool], QdrantClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_qdrant_client(
+    qdrant_url: str, prefer_grpc: bool = QDRANT_PREFER_GRPC
+) -> QdrantClient:
+    """
+    Return a client shared by the whole process for (url, transport).
+    QdrantClient is thread-safe and keeps its connections open, so there
+    is no reason to build one per request.
+
+    Besides http(s) urls, ":memory:" and local directories (an absolute path
+    or "file:<path>") start Qdrant in-process (local mode), e.g. for
+    benchmarks. Anything else raises ValueError.
+    """
+    key = (qdrant_url, prefer_grpc)
+    with _clients_lock:
+        client = _CLIENTS.get(key)
+        CACHE_REQUESTS.inc(
+            cache="qdrant_client", result="miss" if client is None else "hit"
+        )
+        if client is None:
+            logger.debug(f"Creating Qdrant client {qdrant_url} (grpc={prefer_grpc})")
+            client = _create_client(qdrant_url, prefer_grpc)
+            _CLIENTS[key] = client
+        return client
+
+
+def _create_client(qdrant_url: str, prefer_grpc: bool) -> QdrantClient:
+    if qdrant_url == ":memory:":
+        return QdrantClient(location=":memory:")
+    if qdrant_url.startswith("file:"):
+        return QdrantClient(path=qdrant_url.removeprefix("file:"))
+    if os.path.isabs(qdrant_url):
+        return QdrantClient(path=qdrant_url)
+    if not qdrant_url.startswith(("http://", "https://")):
+        # e.g. "localhost:6333" would silently become a local database dir
+        raise ValueError(
+            f"Invalid Qdrant url {qdrant_url!r}: expected http(s)://host:port, "
+            '":memory:", an absolute path or "file:<path>"'
+        )
+    return QdrantClient(
+        url=qdrant_url,
+        prefer_grpc=prefer_grpc,
+        grpc_port=QDRANT_GRPC_PORT,
+        # version is reported by check_qdrant_status, skip the extra call
+        check_compatibility=False,
+    )
+
 
 class QdrantManager:
-    def __init__(self, qdrant_url: str):
+    def __init__(self, qdrant_url: str, prefer_grpc: bool = QDRANT_PREFER_GRPC):
         """
-        Init Qdrant client once.
+        Init Qdrant manager on top of the shared client.
         """
         self.qdrant_url = qdrant_url
-        self.client = QdrantClient(url=qdrant_url)
+        self.client = get_qdrant_client(qdrant_url, prefer_grpc)
 
-    def check_qdrant_status(self, endpoint: str = "healthz") -> bool:
+    def check_qdrant_status(self) -> bool:
         """
-        Check if Qdrant is alive, ready, or healthy via its HTTP status endpoint.
+        Check if Qdrant is alive by asking it for its version.
+        Goes through the shared client, so the connection is reused by the
+        next call instead of opening a separate one for the probe.
 
         Return bool
 
@@ -25,16 +86,12 @@ class QdrantManager:
             https://qdrant.tech/documentation/guides/monitoring/
         """
         try:
-            response = requests.get(self.qdrant_url, timeout=2)
-            if response.status_code == 200:
-                logger.info(f"Qdrant {endpoint} check passed at {self.qdrant_url}")
-                return True
-            else:
-                logger.warning(
-                    f"Unexpected response from {self.qdrant_url}: {response.text}"
-                )
-                return False
-        except RequestException as e:
+            info = self.client.info()
+            logger.info(
+                f"Qdrant check passed at {self.qdrant_url} (version={info.version})"
+            )
+            return True
+        except Exception as e:
             logger.error(f"Could not connect to Qdrant at {self.qdrant_url}: {e}")
             return False
 
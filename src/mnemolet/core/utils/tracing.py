@@ -0,0 +1,239 @@
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from mnemolet.config import (
+    TRACE_BACKUPS,
+    TRACE_ENABLED,
+    TRACE_FILE,
+    TRACE_MAX_MB,
+    TRACE_MIN_MS,
+    TRACE_QUEUE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: float  # unix time, seconds
+    duration_ms: float = 0.0
+    status: str = "ok"
+    attributes: dict = field(default_factory=dict)
+
+
+class Trace:
+    """
+    Spans of one request, collected from any thread that shares its context.
+    """
+
+    def __init__(self, trace_id: str | None = None, name: str = "request"):
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.name = name
+        self.start = time.time()
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = [asdict(s) for s in self.spans]
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round((time.time() - self.start) * 1000, 3),
+            "spans": spans,
+        }
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("span", default=None)
+
+
+def current_trace_id() -> str | None:
+    trace = _current_trace.get()
+    return trace.trace_id if trace else None
+
+
+@contextmanager
+def start_trace(trace_id: str | None = None, name: str = "request"):
+    """
+    Collect spans recorded inside the block and export them at the end.
+    """
+    trace = Trace(trace_id, name)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        export_trace(trace)
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Record a span if a trace is active, otherwise do nothing.
+    - yields a dict of attributes that can be extended inside the block.
+    """
+    trace = _current_trace.get()
+    if trace is None or not TRACE_ENABLED:
+        yield attributes
+        return
+
+    parent = _current_span.get()
+    s = Span(
+        name=name,
+        trace_id=trace.trace_id,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        start=time.time(),
+        attributes=attributes,
+    )
+    token = _current_span.set(s)
+    start = time.perf_counter()
+    try:
+        yield s.attributes
+    except BaseException as e:
+        # GeneratorExit means the consumer stopped early, not a failure
+        s.status = "cancelled" if isinstance(e, GeneratorExit) else "error"
+        s.attributes["error"] = repr(e)
+        raise
+    finally:
+        s.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        trace.add(s)
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # generator closed from another context, nothing to restore there
+            pass
+
+
+class TraceWriter:
+    """
+    Append finished traces to a JSONL file from a background thread, so the
+    request never waits for the disk.
+    - the file is rotated once it reaches `max_mb` (traces.jsonl.1, .2, ..),
+      keeping `backups` old files; 0 never rotates.
+    - at most `max_queue` traces wait for the writer, newer ones are dropped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_mb: float = TRACE_MAX_MB,
+        backups: int = TRACE_BACKUPS,
+        max_queue: int = TRACE_QUEUE_SIZE,
+    ):
+        self.path = path
+        self.max_bytes = int(max_mb * 1024**2)
+        self.backups = max(0, backups)
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=max_queue)
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def submit(self, data: dict):
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            self.dropped += 1
+            logger.debug(f"Trace queue is full, dropped {data['trace_id']}")
+
+    def flush(self):
+        """
+        Wait until every submitted trace is written.
+        """
+        self._queue.join()
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="trace-writer", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            data = self._queue.get()
+            try:
+                self._write((json.dumps(data) + "\n").encode("utf-8"))
+            except Exception as e:
+                # a bad trace must not stop the writer
+                logger.warning(f"Failed to export trace {data['trace_id']}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, line: bytes):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if self.max_bytes and size and size + len(line) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "ab") as f:
+            f.write(line)
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{i}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+
+_WRITERS: dict[Path, TraceWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_trace_writer(path: Path) -> TraceWriter:
+    """
+    Return the process-wide writer of a trace file.
+    """
+    with _writers_lock:
+        if path not in _WRITERS:
+            _WRITERS[path] = TraceWriter(path)
+        return _WRITERS[path]
+
+
+def flush_traces():
+    """
+    Wait until every exported trace is written (tests, process exit).
+    """
+    with _writers_lock:
+        writers = list(_WRITERS.values())
+    for writer in writers:
+        writer.flush()
+
+
+atexit.register(flush_traces)
+
+
+def export_trace(trace: Trace, path: Path | None = None):
+    """
+    Hand the finished trace to the writer of the trace file.
+    """
+    if not TRACE_ENABLED:
+        return
+    data = trace.to_dict()
+    if not data["spans"] or data["duration_ms"] < TRACE_MIN_MS:
+        return
+    get_trace_writer(path or TRACE_FILE).submit(data)
@@ -35,6 +35,17 @@ def _only_unique(xz: list) -> list:
     return unique
 
 
+def format_source(result: dict[str, Any]) -> str:
+    """
+    Return a result's path with its pages, e.g. "a.pdf (p. 3-4)".
+    """
+    start, end = result.get("page_start"), result.get("page_end")
+    if start is None:
+        return result["path"]
+    pages = f"{start}" if start == end or end is None else f"{start}-{end}"
+    return f"{result['path']} (p. {pages})"
+
+
 def hash_file(path: Path) -> str:
     """
     Return SHA256 hash of file content
@@ -45,3 +56,15 @@ def hash_file(path: Path) -> str:
         for chunk in iter(lambda: f.read(8192), b""):
             hasher.update(chunk)
     return hasher.hexdigest()
+
+
+def package_version() -> str:
+    """
+    Return installed mnemolet version (0.1.0 when running from a checkout).
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("mnemolet")
+    except PackageNotFoundError:
+        return "0.1.0"
@@ -2,16 +2,13 @@ from fastapi import APIRouter, File, Form, Request, UploadFile
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from mnemolet.api.executors import run_blocking
 from mnemolet.api.routes import (
     do_ingestion,
     do_search,
     get_collections,
     get_stats,
 )
-from mnemolet.config import (
-    OLLAMA_URL,
-    QDRANT_URL,
-)
 
 ui_router = APIRouter()
 
@@ -22,10 +19,11 @@ API_BASE = "http://localhost:8000"  # TODO: hardcoded url
 
 @ui_router.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    from mnemolet.core.health.checks import get_status
+    from mnemolet.core.health.checks import get_health_monitor
 
     try:
-        result = get_status(QDRANT_URL, OLLAMA_URL)
+        # cached by the background monitor, only the very first call probes
+        result = await run_blocking("admin", get_health_monitor().get)
         error = None
     except Exception as e:
         result = None
@@ -43,21 +41,21 @@ async def ingest_form(request: Request):
 
 @ui_router.post("/ingest", response_class=HTMLResponse)
 async def ingest_submit(request: Request, files: list[UploadFile] = File(...)):
-    saved_files, result = await do_ingestion(files, force=False)
+    saved_files, job = await do_ingestion(files, force=False)
 
     return templates.TemplateResponse(
         "ingest.html",
         {
             "request": request,
             "saved": saved_files,
-            "result": result,
+            "job": job.to_dict(),
         },
     )
 
 
 @ui_router.get("/list-collections", response_class=HTMLResponse)
 async def list_collections_ui(request: Request):
-    data = get_collections()
+    data = await run_blocking("admin", get_collections)
     return templates.TemplateResponse(
         "list_collections.html",
         {
@@ -75,7 +73,7 @@ async def stats_ui(request: Request, collection_name: str = "documents"):
     error = None
 
     try:
-        data = get_stats(collection_name)
+        data = await run_blocking("admin", get_stats, collection_name)
         stats = data.get("data", {})
         status = data.get("status", {})
         error = None
@@ -103,7 +101,7 @@ async def search_ui(request: Request):
 
 @ui_router.post("/search", response_class=HTMLResponse)
 async def search_ui_post(request: Request, query: str = Form(...)):
-    data = do_search(query)
+    data = await run_blocking("query", do_search, query)
     return templates.TemplateResponse(
         "search.html",
         {"request": request, "results": data.get("results", []), "query": query},
@@ -0,0 +1,159 @@
+import hashlib
+import io
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mnemolet.core.ingestion import loader
+from mnemolet.core.ingestion.archives import (
+    MemberTooLarge,
+    is_archive,
+    iter_members,
+    spool_member,
+)
+from mnemolet.core.ingestion.preprocessor import process_directory
+from mnemolet.core.ingestion.stats import IngestStats
+from mnemolet.core.storage.db_tracker import DBTracker
+
+MEMBERS = {
+    "docs/readme.txt": b"Archived readme",
+    "data/table.csv": b"id,name\n1,alpha\n2,beta\n",
+    "image.bin": b"\x00\x01",  # no extractor
+    "copy.md": b"Archived readme",  # duplicate content
+}
+
+
+def _make_archives(tmp_path: Path) -> tuple[Path, Path]:
+    zip_path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in MEMBERS.items():
+            zf.writestr(name, data)
+
+    tar_path = tmp_path / "bundle.tar.gz"
+    with tarfile.open(tar_path, "w:gz") as tf:
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(f"t/{name}")
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return zip_path, tar_path
+
+
+def test_is_archive():
+    assert is_archive(Path("a.zip"))
+    assert is_archive(Path("a.TAR.GZ"))
+    assert is_archive(Path("a.tgz"))
+    assert not is_archive(Path("a.gz"))
+    assert not is_archive(Path("a.txt"))
+
+
+def test_iter_members():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for archive in _make_archives(Path(tmpdir)):
+            members = {name: stream.read() for name, _, stream in iter_members(archive)}
+            prefix = "t/" if archive.name.endswith(".tar.gz") else ""
+
+            assert members == {f"{prefix}{k}": v for k, v in MEMBERS.items()}
+
+
+def test_ingest_archive_members():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        zip_path, tar_path = _make_archives(tmp_path)
+        tracker = DBTracker(tmp_path / "tracker.db")
+
+        chunks = list(
+            process_directory(
+                tmp_path, tracker, force=False, max_length=3000, files=[zip_path]
+            )
+        )
+
+        by_path = {c["path"]: c for c in chunks}
+        readme = f"{zip_path.resolve()}!docs/readme.txt"
+        assert set(by_path) == {readme, f"{zip_path.resolve()}!data/table.csv"}
+        assert by_path[readme]["chunk"] == "Archived readme"
+        assert by_path[readme]["hash"] == hashlib.sha256(b"Archived readme").hexdigest()
+        assert "1 | alpha" in by_path[f"{zip_path.resolve()}!data/table.csv"]["chunk"]
+
+        # same members in the tar: already ingested
+        again = process_directory(
+            tmp_path, tracker, force=False, max_length=3000, files=[tar_path]
+        )
+        assert list(again) == []
+
+        # members bigger than the spool size are buffered on disk
+        with patch("mnemolet.core.ingestion.loader.ARCHIVE_SPOOL_MB", 1e-5):
+            forced = list(
+                process_directory(
+                    tmp_path, tracker, force=True, max_length=3000, files=[tar_path]
+                )
+            )
+        assert {c["path"].split("!")[1] for c in forced} == {
+            "t/docs/readme.txt",
+            "t/data/table.csv",
+        }
+
+
+def test_corrupt_archive_is_skipped():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        broken = tmp_path / "broken.zip"
+        broken.write_bytes(b"not a zip")
+        tracker = DBTracker(tmp_path / "tracker.db")
+
+        chunks = process_directory(
+            tmp_path, tracker, force=False, max_length=3000, files=[broken]
+        )
+
+        assert list(chunks) == []
+
+
+def test_members_are_not_spooled_ahead():
+    spools = []
+
+    def tracked_spool(*args):
+        spool, member_hash = spool_member(*args)
+        spools.append(spool)
+        return spool, member_hash
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        zip_path = tmp_path / "many.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for i in range(20):
+                zf.writestr(f"{i}.txt", f"member {i}")
+        tracker = DBTracker(tmp_path / "tracker.db")
+
+        open_spools = []
+        with patch.object(loader, "spool_member", tracked_spool):
+            for _ in loader.stream_files(tmp_path, tracker, files=[zip_path]):
+                open_spools.append(sum(not s.closed for s in spools))
+
+    # text extractors do not prefetch: one member in memory at a time
+    assert len(open_spools) == 20
+    assert max(open_spools) == 1
+
+
+def test_oversized_member_is_skipped():
+    with pytest.raises(MemberTooLarge):
+        spool_member("a.zip!big.txt", io.BytesIO(b"x" * 3000), 1024, max_bytes=2048)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        zip_path = tmp_path / "bomb.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("zeros.txt", b"0" * 2 * 1024**2)
+            zf.writestr("small.txt", b"small member")
+        tracker = DBTracker(tmp_path / "tracker.db")
+        stats = IngestStats()
+
+        with patch.object(loader, "ARCHIVE_MAX_MEMBER_MB", 1):
+            parts = list(
+                loader.stream_files(tmp_path, tracker, files=[zip_path], stats=stats)
+            )
+
+    assert [p["content"] for p in parts] == ["small member"]
+    assert stats.errors[0]["path"].endswith("!zeros.txt")
@@ -0,0 +1,110 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mnemolet.core.ingestion.extractors.audio_extractor import AudioExtractor
+from mnemolet.core.ingestion.extractors.base import Extractor
+from mnemolet.core.ingestion.loader import stream_files
+from mnemolet.core.storage.db_tracker import DBTracker
+
+
+def _audio_extractor(cache_dir: Path, **kwargs) -> AudioExtractor:
+    with (
+        patch("faster_whisper.WhisperModel") as model,
+        patch("faster_whisper.BatchedInferencePipeline") as pipeline,
+    ):
+        extractor = AudioExtractor(cache_dir=cache_dir, device="cpu", **kwargs)
+    model.assert_called_once()
+    pipeline.return_value.transcribe.side_effect = lambda *a, **kw: (
+        [SimpleNamespace(text=" hello "), SimpleNamespace(text="world")],
+        SimpleNamespace(language="en", duration=1.5),
+    )
+    return extractor
+
+
+def test_config_is_passed_to_whisper():
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch("faster_whisper.WhisperModel") as model:
+            AudioExtractor(
+                model_size="tiny", device="cpu", workers=2, cpu_threads=8, cache_dir=tmp
+            )
+
+    args, kwargs = model.call_args
+    assert args == ("tiny",)
+    assert kwargs["compute_type"] == "int8"
+    assert kwargs["num_workers"] == 2
+    assert kwargs["cpu_threads"] == 4
+
+
+def test_transcript_is_cached_by_hash():
+    with tempfile.TemporaryDirectory() as tmp:
+        audio = Path(tmp) / "a.wav"
+        audio.write_bytes(b"RIFF fake audio")
+        cache_dir = Path(tmp) / "cache"
+
+        first = _audio_extractor(cache_dir)
+        assert list(first.extract(audio)) == ["hello world "]
+
+        second = _audio_extractor(cache_dir)
+        assert list(second.extract(audio)) == ["hello world "]
+
+        first.pipeline.transcribe.assert_called_once()
+        second.pipeline.transcribe.assert_not_called()
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+def test_prefetched_file_is_transcribed_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        audio = Path(tmp) / "a.mp3"
+        audio.write_bytes(b"ID3 fake audio")
+        extractor = _audio_extractor(None)
+
+        extractor.prefetch(audio, "somehash")
+        assert list(extractor.extract(audio)) == ["hello world "]
+
+        extractor.pipeline.transcribe.assert_called_once()
+
+
+class _RecordingExtractor(Extractor):
+    extensions = set()
+
+    def __init__(self):
+        super().__init__()
+        self.prefetched = []
+        self.cancelled = []
+
+    def prefetch(self, file, file_hash=None):
+        self.prefetched.append(file.name)
+
+    def cancel_prefetch(self, file):
+        self.cancelled.append(file.name)
+
+    def extract(self, file):
+        yield file.read_text()
+
+
+def test_loader_prefetches_ahead_and_cancels_on_stop():
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(5):
+            f = Path(tmp) / f"{i}.rec"
+            f.write_text(f"file {i}")
+            files.append(f)
+        tracker = DBTracker(Path(tmp) / "tracker.sqlite")
+        extractor = _RecordingExtractor()
+
+        with (
+            patch(
+                "mnemolet.core.ingestion.loader.get_extractor", return_value=extractor
+            ),
+            patch("mnemolet.core.ingestion.loader.PREFETCH_WINDOW", 3),
+        ):
+            stream = stream_files(Path(tmp), tracker, files=files)
+            first = next(stream)
+            assert first["content"] == "file 0"
+            assert extractor.prefetched == ["0.rec", "1.rec", "2.rec"]
+
+            stream.close()
+
+        assert extractor.cancelled == ["1.rec", "2.rec"]
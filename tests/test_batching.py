@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+from mnemolet.core.ingestion.batching import AdaptiveBatchController
+
+MB = 1024**2
+
+
+def _controller(rss_mb: float = 100, **kwargs) -> AdaptiveBatchController:
+    kwargs = {
+        "initial": 100,
+        "min_size": 10,
+        "max_size": 400,
+        "memory_limit_mb": 1000,
+        "target_seconds": 5,
+        **kwargs,
+    }
+    c = AdaptiveBatchController(**kwargs)
+    c._process = MagicMock()
+    _set_rss(c, rss_mb)
+    return c
+
+
+def _set_rss(c: AdaptiveBatchController, rss_mb: float):
+    c._process.memory_info.return_value.rss = int(rss_mb * MB)
+
+
+def test_grows_on_fast_full_batches_up_to_max():
+    c = _controller()
+
+    for _ in range(10):
+        c.record(c.size, 0.1)
+
+    assert c.size == 400
+    assert c.adjustments > 0
+
+
+def test_partial_batch_does_not_grow():
+    c = _controller()
+
+    c.record(50, 0.1)
+
+    assert c.size == 100
+
+
+def test_halves_over_memory_limit_and_does_not_grow_back():
+    c = _controller()
+    _set_rss(c, 1200)
+
+    c.record(100, 0.1)
+    assert c.size == 50
+
+    _set_rss(c, 100)
+    c.record(50, 0.1)
+    assert c.size == 50
+    assert c.to_dict()["peak_rss_mb"] == 1200
+
+
+def test_shrinks_slow_batches_to_min():
+    c = _controller()
+
+    for _ in range(20):
+        c.record(c.size, 10)
+
+    assert c.size == 10
+
+
+def test_throughput_regression_undoes_growth():
+    c = _controller()
+
+    c.record(100, 1.0)  # 100 chunks/s, grows
+    assert c.size == 150
+    c.record(150, 3.0)  # 50 chunks/s, back to 100 for good
+    assert c.size == 100
+
+    c.record(100, 0.5)
+    assert c.size == 100
+
+
+def test_no_growth_near_memory_limit():
+    c = _controller(rss_mb=900)
+
+    c.record(100, 0.1)
+
+    assert c.size == 100
+
+
+def test_fixed_batch_size():
+    c = _controller(adaptive=False)
+    _set_rss(c, 1200)
+
+    c.record(100, 10)
+
+    assert c.size == 100
+    assert c.batches == 1
+
+
+def test_should_flush_on_size_or_memory():
+    c = _controller()
+
+    assert not c.should_flush(16)
+    assert c.should_flush(100)
+
+    _set_rss(c, 1200)
+    assert c.should_flush(16)
+    assert not c.should_flush(17)
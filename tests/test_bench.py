@@ -0,0 +1,112 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from mnemolet.bench.corpus import generate_corpus
+from mnemolet.bench.retrieval import (
+    load_queries,
+    recall_at_k,
+    reciprocal_rank,
+    run_retrieval_benchmark,
+)
+from mnemolet.bench.utils import StubEmbedder, percentiles
+
+
+def _contents(directory: Path) -> dict[str, bytes]:
+    return {
+        str(p.relative_to(directory)): p.read_bytes()
+        for p in sorted(directory.rglob("*"))
+        if p.suffix in (".txt", ".md", ".json", ".csv", ".pdf")
+    }
+
+
+def test_corpus_is_reproducible():
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        m1 = generate_corpus(Path(a), files=10, seed=7, max_kb=8)
+        m2 = generate_corpus(Path(b), files=10, seed=7, max_kb=8)
+
+        assert m1 == m2
+        assert _contents(Path(a)) == _contents(Path(b))
+        assert sum(m1["formats"].values()) == 10
+
+
+def test_stub_embedder_is_deterministic():
+    embed = StubEmbedder(dim=16)
+
+    v1 = embed(["a", "b"])
+    v2 = embed(["b"])
+
+    assert v1.shape == (2, 16)
+    assert np.allclose(v1[1], v2[0])
+    assert np.allclose(np.linalg.norm(v1, axis=1), 1.0)
+
+
+def test_percentiles():
+    p = percentiles(list(range(1, 101)))
+
+    assert round(p["p50"]) == 50
+    assert p["p99"] > p["p95"] > p["p50"]
+    assert percentiles([]) == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+
+def test_recall_and_reciprocal_rank():
+    paths = ["/data/a.txt", "/data/b.txt", "/data/c.txt"]
+
+    assert recall_at_k(paths, ["b.txt", "x.txt"]) == 0.5
+    assert reciprocal_rank(paths, ["c.txt"]) == 1 / 3
+    assert reciprocal_rank(paths, ["x.txt"]) == 0.0
+
+
+def test_retrieval_benchmark_compares_with_exact():
+    def fake_search(url, collection, model, query, top_k, exact=False, hnsw_ef=None):
+        # approximate search misses the best chunk, exact search finds it
+        hits = [{"id": 2, "path": "/d/b.txt", "score": 0.8}]
+        if exact:
+            hits.insert(0, {"id": 1, "path": "/d/a.txt", "score": 0.9})
+        return hits
+
+    queries = [{"query": "q", "relevant": ["a.txt"]}]
+    with patch("mnemolet.core.query.retrieval.retriever.search_documents", fake_search):
+        report = run_retrieval_benchmark(queries, "url", "col", "model", 2, 0.0)
+
+    results = report["results"]
+    assert results["recall@2"] == 0.0
+    assert results["exact_recall@2"] == 1.0
+    assert results["exact_overlap"] == 0.5
+    assert set(results["latency_ms"]) == {"p50", "p95", "p99", "mean"}
+
+
+def test_load_queries_rejects_empty_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, text in (("q.json", "[]"), ("q.jsonl", "\n")):
+            path = Path(tmpdir) / name
+            path.write_text(text, encoding="utf-8")
+            with pytest.raises(ValueError, match="No queries"):
+                load_queries(path)
+
+
+def test_ingest_benchmark_counts_ingested_bytes_without_dedup():
+    from mnemolet.bench.ingest import run_ingest_benchmark
+
+    text = " ".join(f"word{i}" for i in range(60))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        corpus = Path(tmpdir)
+        (corpus / "a.txt").write_text(text, encoding="utf-8")
+        (corpus / "b.txt").write_text(text + " end", encoding="utf-8")
+        # excluded by the scanner, not part of the throughput
+        (corpus / "node_modules").mkdir()
+        (corpus / "node_modules" / "big.txt").write_text("x" * 10_000)
+
+        report = run_ingest_benchmark(
+            corpus, collection_name="bench_bytes_test", dim=8, adaptive=False
+        )
+
+    results = report["results"]
+    assert report["config"]["dedup"] == "off"
+    assert results["files"] == 2
+    # the near-duplicate is ingested too
+    assert results["chunks"] == 2
+    assert results["bytes"] == 2 * len(text) + len(" end")
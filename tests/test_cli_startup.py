@@ -0,0 +1,86 @@
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mnemolet.cli.main import LAZY_COMMANDS
+
+# generous budgets, they catch eager imports (seconds), not small regressions
+HELP_BUDGET = 2.0
+LIST_BUDGET = 3.0
+
+
+def _run_cli(*args, env=None) -> tuple[subprocess.CompletedProcess, float]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "mnemolet.cli.main", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return result, time.perf_counter() - start
+
+
+def _offline_env(tmp: str) -> dict:
+    return {
+        **os.environ,
+        "QDRANT_HOST": "127.0.0.1",
+        "QDRANT_PORT": "9",
+        "HEALTH_TIMEOUT": "0.2",
+        "HEALTH_CACHE_FILE": str(Path(tmp) / "health.json"),
+    }
+
+
+def test_help_is_fast_and_lists_all_commands():
+    result, elapsed = _run_cli("--help")
+
+    assert result.returncode == 0
+    for name in LAZY_COMMANDS:
+        assert name in result.stdout
+    assert elapsed < HELP_BUDGET
+
+
+def test_list_collections_is_fast_when_qdrant_is_down():
+    with tempfile.TemporaryDirectory() as tmp:
+        result, elapsed = _run_cli("list-collections", env=_offline_env(tmp))
+
+    assert result.returncode != 0
+    assert elapsed < LIST_BUDGET
+
+
+def test_help_does_not_import_heavy_modules():
+    code = (
+        "import sys\n"
+        "from mnemolet.cli.main import cli\n"
+        "try:\n"
+        "    cli(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('qdrant_client', 'torch', 'sentence_transformers', 'fastapi')\n"
+        "print('loaded=' + ','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.splitlines()[-1] == "loaded="
+
+
+def test_config_import_creates_no_directories():
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [sys.executable, "-c", "import mnemolet.config"], cwd=tmp
+        )
+        assert result.returncode == 0
+        assert list(Path(tmp).iterdir()) == []
+
+
+def test_lazy_commands_match_their_modules():
+    for name, (module, attr, short_help) in LAZY_COMMANDS.items():
+        command = getattr(importlib.import_module(module), attr)
+        assert command.name == name
+        assert command.get_short_help_str(limit=200) == short_help
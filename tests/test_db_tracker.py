@@ -1,4 +1,8 @@
 import os
+import tempfile
+from pathlib import Path
+
+import pytest
 
 from mnemolet.config import DB_PATH
 from mnemolet.core.storage.db_tracker import DBTracker
@@ -27,3 +31,73 @@ def test_add_and_list_files():
     tracker.mark_indexed(file_hash)
     indexed_files = tracker.list_files(indexed=True)
     assert len(indexed_files) == 1
+
+
+def test_runs_are_recorded_with_throughput():
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = DBTracker(Path(tmp) / "tracker.sqlite")
+
+        ok = tracker.start_run("docs", "documents", {"batch_size": 10}, "0.1.0")
+        tracker.finish_run(
+            ok,
+            {
+                "files": 4,
+                "chunks": 40,
+                "time": 2.0,
+                "stages": {"extract": {"seconds": 1.0, "items": 4, "bytes": 2**20}},
+                "errors": [{"path": "bad.pdf", "error": "broken"}],
+            },
+        )
+        failed = tracker.start_run("docs", "other", {}, "0.1.0")
+        tracker.finish_run(failed, error="Qdrant is down")
+
+        runs = tracker.list_runs()
+        assert [r["id"] for r in runs] == [failed, ok]
+
+        assert runs[0]["status"] == "failed"
+        assert runs[0]["error"] == "Qdrant is down"
+
+        done = runs[1]
+        assert done["status"] == "done"
+        assert done["config"] == {"batch_size": 10}
+        assert done["chunks_per_sec"] == 20.0
+        assert done["mb_per_sec"] == 0.5
+        assert done["errors"] == 1
+        assert done["details"]["stages"]["extract"]["items"] == 4
+
+        assert [r["id"] for r in tracker.list_runs(collection="other")] == [failed]
+
+
+def test_interrupted_ingest_is_recorded():
+    from mnemolet.bench.utils import StubEmbedder
+    from mnemolet.core.ingestion.ingest import ingest
+
+    embed = StubEmbedder(8)
+
+    def interrupted_embed(texts):
+        if texts != ["dummy"]:
+            raise KeyboardInterrupt
+        return embed(texts)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs = Path(tmp) / "docs"
+        docs.mkdir()
+        (docs / "a.txt").write_text("some text", encoding="utf-8")
+        tracker = DBTracker(Path(tmp) / "tracker.sqlite")
+
+        with pytest.raises(KeyboardInterrupt):
+            ingest(
+                docs,
+                batch_size=10,
+                qdrant_url=":memory:",
+                collection_name="interrupted",
+                size_chars=3000,
+                force=False,
+                tracker=tracker,
+                embed_fn=interrupted_embed,
+            )
+
+        run = tracker.list_runs()[0]
+        assert run["status"] == "failed"
+        assert run["error"] == "interrupted: KeyboardInterrupt()"
+        assert run["finished_at"] is not None
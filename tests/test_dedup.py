@@ -0,0 +1,153 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from mnemolet.bench.utils import StubEmbedder
+from mnemolet.core.ingestion.dedup import MinHasher, NearDuplicateFilter, similarity
+from mnemolet.core.storage.db_tracker import DBTracker
+
+FOOTER = (
+    "This email and any attachments are confidential and intended solely for "
+    "the addressee. If you have received it in error please notify the sender "
+    "immediately and delete it from your system. Any unauthorised use, copying "
+    "or disclosure is strictly prohibited and may be unlawful."
+)
+OTHER = (
+    "Quarterly revenue grew in every region while operating costs stayed flat, "
+    "mostly thanks to the new logistics contracts signed in the spring and a "
+    "lower churn among enterprise customers than the year before."
+)
+
+
+def _tracker(tmp: str) -> DBTracker:
+    return DBTracker(Path(tmp) / "tracker.sqlite")
+
+
+def test_minhash_estimates_similarity():
+    hasher = MinHasher(num_perm=128, shingle_words=3)
+    a = hasher.signature(FOOTER)
+    # spacing, case and punctuation do not matter
+    assert np.array_equal(a, hasher.signature(FOOTER.upper().replace(" ", "  ")))
+    # one word changed in ~50: most shingles are shared
+    near = hasher.signature(FOOTER.replace("immediately", "at once"))
+    assert similarity(a, near) > 0.7
+    assert similarity(a, hasher.signature(OTHER)) < 0.1
+
+
+def test_filter_suppresses_and_links():
+    with tempfile.TemporaryDirectory() as tmp:
+        dedup = NearDuplicateFilter(
+            _tracker(tmp), "docs", mode="suppress", threshold=0.8
+        )
+
+        assert dedup.check("a.txt", "ha", FOOTER) is None
+        assert dedup.check("a.txt", "ha", OTHER) is None
+        duplicate = dedup.check("b.txt", "hb", FOOTER + " Thank you.")
+        assert duplicate.original.path == "a.txt"
+        assert duplicate.original.position == 0
+        assert duplicate.similarity >= 0.8
+        # too short to tell
+        assert dedup.check("c.txt", "hc", "Introduction") is None
+        assert dedup.check("d.txt", "hd", "Introduction") is None
+        assert dedup.to_dict()["suppressed"] == 1
+
+        linked = NearDuplicateFilter(_tracker(tmp), "other", mode="link")
+        assert linked.check("a.txt", "ha", FOOTER) is None
+        assert linked.check("b.txt", "hb", FOOTER).original.path == "a.txt"
+        # linked chunks are stored, so they are indexed too
+        assert linked.check("c.txt", "hc", FOOTER) is not None
+        assert linked.linked == 2
+
+        off = NearDuplicateFilter(_tracker(tmp), "docs", mode="off")
+        assert off.check("a.txt", "ha", FOOTER) is None
+        assert off.check("b.txt", "hb", FOOTER) is None
+
+
+def test_filter_state_is_kept_in_tracker():
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = _tracker(tmp)
+        dedup = NearDuplicateFilter(tracker, "docs")
+        dedup.check("a.txt", "v1", OTHER)
+        dedup.check("a.txt", "v1", FOOTER)
+        dedup.check("b.txt", "hb", FOOTER)
+        dedup.flush()
+
+        rows = tracker.list_near_duplicates("docs")
+        assert len(rows) == 1
+        assert rows[0]["path"] == "b.txt"
+        assert rows[0]["original_path"] == "a.txt"
+        assert rows[0]["original_position"] == 1
+        # duplicates are only dropped with an explicit mode="suppress"
+        assert rows[0]["action"] == "link"
+
+        # next run: signatures come from the tracker
+        dedup = NearDuplicateFilter(tracker, "docs")
+        assert dedup.check("c.txt", "hc", FOOTER) is not None
+        # a new version of a file is not a duplicate of the old one
+        assert dedup.check("a.txt", "v2", OTHER) is None
+        # other collections have their own chunks
+        assert (
+            NearDuplicateFilter(tracker, "other").check("c.txt", "hc", FOOTER) is None
+        )
+
+        tracker.clear_chunk_signatures("docs")
+        assert tracker.list_near_duplicates("docs") == []
+        assert NearDuplicateFilter(tracker, "docs").check("c.txt", "hc", FOOTER) is None
+
+
+def test_filter_looks_up_only_band_candidates():
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = _tracker(tmp)
+        dedup = NearDuplicateFilter(tracker, "docs")
+        dedup.check("a.txt", "ha", FOOTER)
+        for i in range(50):
+            note = " ".join(f"term{i}x{j}" for j in range(20))
+            dedup.check(f"n{i}.txt", f"h{i}", note)
+        dedup.flush()
+
+        found = []
+        find = tracker.find_chunk_signatures
+
+        def recording_find(collection, keys):
+            rows = find(collection, keys)
+            found.append(len(rows))
+            return rows
+
+        tracker.find_chunk_signatures = recording_find
+        duplicate = NearDuplicateFilter(tracker, "docs").check("b.txt", "hb", FOOTER)
+
+    assert duplicate.original.path == "a.txt"
+    # one indexed lookup, returning the footer only, not the 51 stored chunks
+    assert found == [1]
+
+
+def test_ingest_skips_near_duplicate_chunks():
+    from mnemolet.core.ingestion.ingest import ingest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs = Path(tmp) / "docs"
+        docs.mkdir()
+        for i in range(5):
+            (docs / f"mail{i}.txt").write_text(FOOTER, encoding="utf-8")
+            (docs / f"note{i}.txt").write_text(f"{FOOTER}\n\nRef {i}", encoding="utf-8")
+        (docs / "report.txt").write_text(OTHER, encoding="utf-8")
+        tracker = _tracker(tmp)
+
+        result = ingest(
+            docs,
+            batch_size=4,
+            qdrant_url=":memory:",
+            collection_name="dedup_test",
+            size_chars=3000,
+            force=True,
+            tracker=tracker,
+            embed_fn=StubEmbedder(8),
+            dedup_mode="suppress",
+        )
+
+        # identical mails are one file hash, every note repeats the footer
+        assert result["chunks"] == 2
+        assert result["dedup"]["suppressed"] == 5
+        assert result["stages"]["dedup"]["items"] == 7
+        assert len(tracker.list_near_duplicates("dedup_test")) == 5
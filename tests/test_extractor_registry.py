@@ -0,0 +1,101 @@
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from mnemolet.core.ingestion.extractors import registry
+from mnemolet.core.ingestion.extractors.audio_extractor import AudioExtractor
+from mnemolet.core.ingestion.extractors.pdf_extractor import PDFExtractor
+from mnemolet.core.ingestion.extractors.text_extractor import TextExtractor
+
+
+def test_registry_maps_extensions_to_classes():
+    reg = registry.get_registry()
+
+    assert reg[".txt"] is TextExtractor
+    assert reg[".wav"] is AudioExtractor
+    assert registry.get_extractor(Path("a.unknown")) is None
+
+
+def test_extractor_created_once_on_first_use():
+    first = registry.get_extractor(Path("a.txt"))
+    second = registry.get_extractor(Path("b.MD"))
+
+    assert isinstance(first, TextExtractor)
+    assert first is second
+
+
+def test_text_only_lookup_imports_no_heavy_modules():
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from mnemolet.core.ingestion.extractors.registry import get_extractor\n"
+        "get_extractor(Path('a.txt'))\n"
+        "heavy = ('torch', 'faster_whisper', 'docx', 'odfdo', 'pypdf')\n"
+        "print('loaded=' + ','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.splitlines()[-1] == "loaded="
+
+
+def test_missing_dependency_disables_extractor(caplog):
+    registry._INSTANCES.pop(PDFExtractor, None)
+    try:
+        with patch.object(registry.importlib.util, "find_spec", return_value=None):
+            assert registry.get_extractor(Path("a.pdf")) is None
+        assert "missing module(s): pypdf" in caplog.text
+        # decided once, not retried for every file
+        assert registry.get_extractor(Path("b.pdf")) is None
+    finally:
+        registry._INSTANCES.pop(PDFExtractor, None)
+
+
+def test_failing_extractor_is_disabled(caplog):
+    registry._INSTANCES.pop(AudioExtractor, None)
+    try:
+        with patch.object(
+            AudioExtractor, "__init__", side_effect=RuntimeError("no model")
+        ):
+            assert registry.get_extractor(Path("a.mp3")) is None
+        assert "failed to start: no model" in caplog.text
+    finally:
+        registry._INSTANCES.pop(AudioExtractor, None)
+
+
+def test_slow_extractor_does_not_block_others():
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_init(self, *args, **kwargs):
+        loading.set()
+        release.wait(timeout=5)
+        raise RuntimeError("no model")
+
+    registry._INSTANCES.pop(AudioExtractor, None)
+    registry._INSTANCES.pop(TextExtractor, None)
+    try:
+        with patch.object(AudioExtractor, "__init__", slow_init):
+            audio = threading.Thread(
+                target=registry.get_extractor, args=(Path("a.mp3"),)
+            )
+            audio.start()
+            assert loading.wait(timeout=5)
+
+            # created while the audio extractor is still loading
+            found = []
+            text = threading.Thread(
+                target=lambda: found.append(registry.get_extractor(Path("a.txt")))
+            )
+            text.start()
+            text.join(timeout=2)
+            assert isinstance(found[0], TextExtractor)
+            release.set()
+            audio.join(timeout=5)
+    finally:
+        release.set()
+        registry._INSTANCES.pop(AudioExtractor, None)
@@ -0,0 +1,56 @@
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from mnemolet.core.health import checks
+
+
+def _slow_qdrant(url):
+    time.sleep(2)
+    return True
+
+
+def test_slow_probe_times_out():
+    with (
+        patch.object(checks, "_check_qdrant", _slow_qdrant),
+        patch.object(checks, "get_ollama_status", return_value={"running": True}),
+    ):
+        start = time.monotonic()
+        status = checks.get_status("http://q", "http://o", timeout=0.2)
+
+    assert time.monotonic() - start < 1
+    assert status["qdrant"] is False
+    assert status["ollama"] == {"running": True}
+
+
+def test_monitor_serves_cached_status():
+    calls = []
+
+    def fake_status(qdrant_url, ollama_url, timeout):
+        calls.append(1)
+        return {"qdrant": True, "checked_at": time.time()}
+
+    with patch.object(checks, "get_status", fake_status):
+        monitor = checks.HealthMonitor("http://q", "http://o", interval=60)
+        first = monitor.get()
+        second = monitor.get()
+
+    assert first["qdrant"] and second["qdrant"]
+    assert len(calls) == 1
+    assert "age_seconds" in second
+
+
+def test_check_qdrant_trusts_recent_success():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Path(tmpdir) / "health.json"
+        with (
+            patch.object(checks, "HEALTH_CACHE_FILE", cache),
+            patch.object(checks, "_check_qdrant", return_value=True) as probe,
+        ):
+            assert checks.check_qdrant("http://q")
+            assert checks.check_qdrant("http://q")
+            # a different url is not covered by the cached success
+            assert checks.check_qdrant("http://other")
+
+        assert probe.call_count == 2
@@ -0,0 +1,265 @@
+import json
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mnemolet.api import routes
+from mnemolet.core.ingestion import jobs
+from mnemolet.core.ingestion.jobs import IngestJob, IngestJobManager
+
+INGEST = "mnemolet.core.ingestion.ingest.ingest"
+
+
+def _fake_ingest(directory, *args, progress=None, files=None, **kwargs):
+    progress({"stage": "extracting", "files_total": 1, "files": 1, "chunks": 2})
+    return {"files": 1, "chunks": 2, "time": 0.1}
+
+
+def _submit(manager: IngestJobManager) -> IngestJob:
+    return manager.submit(Path("docs"), 10, "http://q", "documents", 3000)
+
+
+def test_job_runs_to_result():
+    manager = IngestJobManager(max_jobs=1)
+    with patch(INGEST, _fake_ingest):
+        job = _submit(manager)
+        manager.future(job.id).result(timeout=5)
+
+    status = manager.get(job.id).to_dict()
+    assert status["status"] == "done"
+    assert status["files"] == 1 and status["chunks"] == 2
+    assert status["result"] == {"files": 1, "chunks": 2, "time": 0.1}
+    assert status["error"] is None
+    assert [j.id for j in manager.list_jobs()] == [job.id]
+
+
+def test_failed_job_keeps_error():
+    def broken_ingest(*args, **kwargs):
+        raise RuntimeError("Qdrant is down")
+
+    manager = IngestJobManager(max_jobs=1)
+    with patch(INGEST, broken_ingest):
+        job = _submit(manager)
+        manager.future(job.id).result(timeout=5)
+
+    assert job.status == "failed"
+    assert job.error == "Qdrant is down"
+    assert job.result is None and job.finished_at is not None
+
+
+def test_prune_keeps_last_finished_jobs():
+    manager = IngestJobManager(max_jobs=1)
+    running = IngestJob(id="running", status="running")
+    manager.jobs[running.id] = running
+    for i in range(jobs.MAX_FINISHED_JOBS + 5):
+        manager.jobs[f"done-{i}"] = IngestJob(id=f"done-{i}", status="done")
+
+    manager._prune()
+
+    assert "running" in manager.jobs
+    finished = [j for j in manager.jobs if j.startswith("done-")]
+    assert len(finished) == jobs.MAX_FINISHED_JOBS
+    # the oldest go first
+    assert "done-4" not in manager.jobs and "done-5" in manager.jobs
+
+
+@contextmanager
+def _client(tmpdir: str, ingest_fn=_fake_ingest):
+    """
+    Helper fn to get an API client with a fresh job manager, a fake ingest
+    and uploads in tmpdir.
+    """
+    app = FastAPI()
+    app.include_router(routes.api_router, prefix="/api")
+    with (
+        patch.object(jobs, "_JOB_MANAGER", IngestJobManager(max_jobs=1)),
+        patch.object(routes, "UPLOAD_DIR", Path(tmpdir)),
+        patch(INGEST, ingest_fn),
+    ):
+        yield TestClient(app)
+
+
+def test_api_ingest_returns_job():
+    started = threading.Event()
+
+    def waiting_ingest(*args, **kwargs):
+        started.wait(timeout=5)
+        return _fake_ingest(*args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with _client(tmpdir, waiting_ingest) as client:
+            res = client.post(
+                "/api/ingest", files=[("files", ("a.txt", b"hello", "text/plain"))]
+            )
+            body = res.json()
+            job = client.get(f"/api/ingest/jobs/{body['job_id']}").json()
+            started.set()
+            jobs.get_job_manager().future(body["job_id"]).result(timeout=5)
+
+        assert res.status_code == 202
+        assert body["status"] == "accepted"
+        assert body["uploaded"] == [str(Path(tmpdir) / "a.txt")]
+        assert job["status"] in ("queued", "running")
+        assert (Path(tmpdir) / "a.txt").read_bytes() == b"hello"
+
+
+def test_api_ingest_wait_returns_ingestion():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with _client(tmpdir) as client:
+            res = client.post(
+                "/api/ingest?wait=true",
+                files=[("files", ("a.txt", b"hello", "text/plain"))],
+            )
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["status"] == "ok"
+    assert body["ingestion"] == {"files": 1, "chunks": 2, "time": 0.1}
+
+
+def test_api_job_events_end_with_final_snapshot():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with _client(tmpdir) as client:
+            job_id = client.post(
+                "/api/ingest", files=[("files", ("a.txt", b"hello", "text/plain"))]
+            ).json()["job_id"]
+            res = client.get(f"/api/ingest/jobs/{job_id}/events")
+            missing = client.get("/api/ingest/jobs/nope")
+
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    snapshots = [json.loads(line) for line in res.text.splitlines()]
+    assert snapshots[-1]["status"] == "done"
+    assert snapshots[-1]["result"]["chunks"] == 2
+    assert all(s["job_id"] == job_id for s in snapshots)
+    assert missing.status_code == 404
+
+
+def test_upload_is_written_off_the_event_loop():
+    threads = []
+
+    def recording_write(out, hasher, chunk):
+        threads.append(threading.current_thread().name)
+        write_block(out, hasher, chunk)
+
+    write_block = routes._write_block
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with (
+            _client(tmpdir) as client,
+            patch.object(routes, "UPLOAD_CHUNK_SIZE", 4),
+            patch.object(routes, "_write_block", recording_write),
+        ):
+            res = client.post(
+                "/api/ingest?wait=true",
+                files=[("files", ("a.txt", b"hello world", "text/plain"))],
+            )
+        data = (Path(tmpdir) / "a.txt").read_bytes()
+
+    assert res.status_code == 200
+    assert data == b"hello world"
+    assert len(threads) == 3
+    assert all(name.startswith("api-admin") for name in threads)
+
+
+def test_api_force_upload_keeps_earlier_uploads():
+    from mnemolet.bench.utils import StubEmbedder
+    from mnemolet.core.ingestion.ingest import ingest
+    from mnemolet.core.storage.db_tracker import DBTracker
+    from mnemolet.core.utils.qdrant import get_qdrant_client
+
+    collection = "force_upload_test"
+    embed = StubEmbedder(8)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = DBTracker(Path(tmpdir) / "tracker.sqlite")
+
+        def memory_ingest(directory, batch_size, url, name, size_chars, *args, **kw):
+            return ingest(
+                directory,
+                batch_size,
+                ":memory:",
+                collection,
+                size_chars,
+                *args,
+                tracker=tracker,
+                embed_fn=embed,
+                **kw,
+            )
+
+        uploads = Path(tmpdir) / "uploads"
+        with _client(str(uploads), memory_ingest) as client:
+            first = client.post(
+                "/api/ingest?wait=true",
+                files=[("files", ("a.txt", b"Alpha document", "text/plain"))],
+            )
+            forced = client.post(
+                "/api/ingest?wait=true&force=true",
+                files=[("files", ("b.txt", b"Beta document", "text/plain"))],
+            )
+
+    assert first.status_code == 200 and forced.status_code == 200
+    assert forced.json()["ingestion"]["files"] == 2
+    hits = get_qdrant_client(":memory:").query_points(
+        collection, query=embed(["Alpha document"])[0], limit=1
+    )
+    assert hits.points[0].payload["path"] == str(uploads / "a.txt")
+
+
+def test_api_rejects_invalid_upload_names():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with _client(tmpdir) as client:
+            res = client.post(
+                "/api/ingest",
+                files=[
+                    ("files", ("a.txt", b"hello", "text/plain")),
+                    ("files", ("..", b"oops", "text/plain")),
+                ],
+            )
+        written = list(Path(tmpdir).iterdir())
+
+    assert res.status_code == 400
+    assert "Invalid file name" in res.json()["detail"]
+    assert written == []
+
+
+def test_api_upload_name_collision_keeps_both_files():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with _client(tmpdir) as client:
+            uploaded = [
+                client.post(
+                    "/api/ingest?wait=true",
+                    files=[("files", ("a.txt", content, "text/plain"))],
+                ).json()["uploaded"][0]
+                for content in (b"first", b"second", b"first")
+            ]
+            contents = {p.name: p.read_bytes() for p in Path(tmpdir).iterdir()}
+
+    first, second, again = (Path(p).name for p in uploaded)
+    # the same content reuses its name, other content gets a hash suffix
+    assert first == again == "a.txt"
+    assert second.startswith("a-") and second.endswith(".txt")
+    assert contents == {"a.txt": b"first", second: b"second"}
+
+
+def test_failed_upload_leaves_no_file():
+    def broken_write(out, hasher, chunk):
+        raise OSError("disk full")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with (
+            _client(tmpdir) as client,
+            patch.object(routes, "_write_block", broken_write),
+        ):
+            with pytest.raises(OSError, match="disk full"):
+                client.post(
+                    "/api/ingest",
+                    files=[("files", ("a.txt", b"hello", "text/plain"))],
+                )
+        written = list(Path(tmpdir).iterdir())
+
+    assert written == []
@@ -0,0 +1,35 @@
+import time
+
+from mnemolet.core.ingestion.stats import IngestStats
+
+
+def test_time_accumulates_per_stage():
+    stats = IngestStats()
+
+    with stats.time("embed", items=2):
+        pass
+    with stats.time("embed", items=3):
+        pass
+    stats.add("hash", 0.5, items=1, bytes=100)
+
+    result = stats.to_dict()["stages"]
+    assert result["embed"]["items"] == 5
+    assert result["hash"] == {"seconds": 0.5, "items": 1, "bytes": 100}
+
+
+def test_timed_counts_producer_time_only():
+    stats = IngestStats()
+
+    def slow_parts():
+        for part in ("a", "b"):
+            time.sleep(0.01)
+            yield part
+
+    for _ in stats.timed(slow_parts(), "extract", extractor="Fake", bytes=42):
+        time.sleep(0.05)  # consumer time is not extraction time
+
+    result = stats.to_dict()
+    assert result["stages"]["extract"]["items"] == 2
+    assert 0.02 <= result["stages"]["extract"]["seconds"] < 0.1
+    assert result["extractors"]["Fake"]["items"] == 1
+    assert result["extractors"]["Fake"]["bytes"] == 42
@@ -1,4 +1,5 @@
 import tempfile
+import tracemalloc
 from pathlib import Path
 
 from mnemolet.core.ingestion.preprocessor import process_directory
@@ -31,3 +32,58 @@ def test_load_txt_files():
         chunks = [f["chunk"] for f in files]
         assert any("Hello world" in c for c in chunks)
         assert any("Another file" in c for c in chunks)
+
+
+def test_load_selected_files_only():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+
+        selected = tmp_path / "selected.txt"
+        selected.write_text("Selected upload", encoding="utf-8")
+        (tmp_path / "other.txt").write_text("Older upload", encoding="utf-8")
+
+        tracker = DBTracker(tmp_path / "tracker.sqlite")
+        files = list(
+            process_directory(
+                tmp_path,
+                tracker,
+                force=True,
+                max_length=3000,
+                files=[selected],
+                hashes={str(selected): "precomputed_hash"},
+            )
+        )
+
+        assert len(files) == 1
+        assert files[0]["chunk"] == "Selected upload"
+        assert files[0]["hash"] == "precomputed_hash"
+
+
+def test_large_file_streams_every_part_with_bounded_memory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        line = "0123456789 abcdefghij ABCDEFGHIJ\n"
+        big = tmp_path / "big.log"
+        with open(big, "w", encoding="utf-8") as f:
+            for _ in range(600_000):  # ~20 MB, many extractor parts
+                f.write(line)
+        size = big.stat().st_size
+
+        tracker = DBTracker(tmp_path / "tracker.sqlite")
+        tracemalloc.start()
+        try:
+            total = 0
+            chunks = 0
+            for data in process_directory(
+                tmp_path, tracker, force=True, max_length=3000
+            ):
+                total += len(data["chunk"])
+                chunks += 1
+                assert len(data["chunk"]) == 3000 or total == size
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert total == size
+        assert chunks == -(-size // 3000)
+        assert peak < 16 * 1024**2
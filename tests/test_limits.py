@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from mnemolet.core.utils.limits import QueueFull, ResourceLimiter, ResourceTimeout
+from mnemolet.core.utils.metrics import RESOURCE_REJECTED
+
+
+def test_limiter_tracks_in_flight():
+    limiter = ResourceLimiter("test", max_concurrent=2, max_queue=0, timeout=0.1)
+
+    with limiter.acquire():
+        with limiter.acquire():
+            assert limiter.stats()["in_flight"] == 2
+
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_limiter_rejects_when_queue_full():
+    limiter = ResourceLimiter("rejects", max_concurrent=1, max_queue=0, timeout=0.1)
+
+    with limiter.acquire():
+        with pytest.raises(QueueFull):
+            with limiter.acquire():
+                pass
+        with pytest.raises(QueueFull):
+            limiter.check_capacity()
+
+    assert limiter.stats()["rejected"] == 2
+    assert RESOURCE_REJECTED.value(resource="rejects") == 2
+
+
+def test_limiter_times_out_waiting():
+    limiter = ResourceLimiter("test", max_concurrent=1, max_queue=1, timeout=0.05)
+    errors = []
+
+    def waiter():
+        try:
+            with limiter.acquire():
+                pass
+        except ResourceTimeout as e:
+            errors.append(e)
+
+    with limiter.acquire():
+        t = threading.Thread(target=waiter)
+        t.start()
+        t.join()
+
+    assert len(errors) == 1
+    assert limiter.stats()["timed_out"] == 1
+    assert limiter.stats()["queued"] == 0
@@ -0,0 +1,84 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mnemolet.bench.load import run_load_test
+from mnemolet.bench.ollama_stub import StubOllamaConfig, running_stub
+from mnemolet.core.query.generation.local_generator import get_llm_generator
+
+
+def test_stub_streams_tokens_to_local_generator():
+    cfg = StubOllamaConfig(first_token_ms=50, tokens_per_sec=1000, tokens=5)
+    with running_stub(cfg) as url:
+        generator = get_llm_generator(url, "stub")
+
+        start = time.perf_counter()
+        answer = "".join(generator.generate_answer("question", ["context"]))
+        elapsed = time.perf_counter() - start
+
+    assert len(answer.split()) == 5
+    assert elapsed >= 0.05
+
+
+def test_stub_errors_surface_as_generation_failures():
+    with running_stub(StubOllamaConfig(error_rate=1.0)) as url:
+        with pytest.raises(RuntimeError):
+            list(get_llm_generator(url, "stub").generate_answer("q", []))
+
+
+class _FakeAPI(BaseHTTPRequestHandler):
+    """
+    /api/search answers JSON, /api/answer streams one chunk or an error event.
+    """
+
+    protocol_version = "HTTP/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/api/search"):
+            body = {"results": []}
+        elif "fail" in self.path:
+            body = {"type": "error", "data": "boom"}
+        else:
+            body = {"type": "chunk", "data": "hi"}
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write((json.dumps(body) + "\n").encode("utf-8"))
+
+
+def _run_load(**kwargs) -> dict:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        return asyncio.run(run_load_test(url, duration=None, **kwargs))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_load_test_reports_each_endpoint():
+    report = _run_load(concurrency=3, requests=10)
+
+    results = report["results"]
+    assert results["requests"] == 10
+    assert results["errors"] == 0
+    search, answer = results["endpoints"]["search"], results["endpoints"]["answer"]
+    assert search["requests"] == answer["requests"] == 5
+    assert search["statuses"] == {"200": 5}
+    assert answer["first_chunk_ms"]["p50"] > 0
+    assert "first_chunk_ms" not in search
+
+
+def test_load_test_counts_error_events():
+    report = _run_load(endpoints=("answer",), queries=["fail"], requests=4)
+
+    answer = report["results"]["endpoints"]["answer"]
+    assert answer["errors"] == 4
+    assert answer["error_rate"] == 1.0
@@ -0,0 +1,50 @@
+import pytest
+
+from mnemolet.core.utils.metrics import MetricsRegistry
+
+
+def test_counter_and_gauge_render():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("status",))
+    in_flight = registry.gauge("in_flight", "In flight.")
+
+    requests.inc(status="200")
+    requests.inc(2, status="200")
+    in_flight.inc()
+    in_flight.dec()
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{status="200"} 3' in text
+    assert "in_flight 0" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.5, 0.5, 5.0):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_count 4" in lines
+    assert "latency_seconds_sum 6.05" in lines
+
+
+def test_registry_reuses_metrics_by_name():
+    registry = MetricsRegistry()
+
+    assert registry.counter("x_total", "X.") is registry.counter("x_total", "X.")
+    with pytest.raises(ValueError):
+        registry.gauge("x_total", "X.")
+
+
+def test_labels_are_required():
+    registry = MetricsRegistry()
+    counter = registry.counter("y_total", "Y.", ("stage",))
+
+    with pytest.raises(ValueError):
+        counter.inc()
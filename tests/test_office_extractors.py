@@ -0,0 +1,105 @@
+import tempfile
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+from mnemolet.core.ingestion.extractors.base import HeadingText
+from mnemolet.core.ingestion.loaders.docx_loader import extract_docx
+from mnemolet.core.ingestion.loaders.odt_loader import extract_odt
+from mnemolet.core.ingestion.preprocessor import TextChunker
+
+ODT_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<office:document-content"
+    ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+    ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+    ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">'
+    "<office:body><office:text>"
+)
+ODT_TAIL = "</office:text></office:body></office:document-content>"
+
+
+def _write_odt(path: Path, body_parts):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+        with zf.open("content.xml", "w") as f:
+            f.write(ODT_HEAD.encode())
+            for part in body_parts:
+                f.write(part.encode())
+            f.write(ODT_TAIL.encode())
+
+
+def test_odt_blocks_and_headings():
+    body = [
+        '<text:h text:outline-level="2">Install</text:h>',
+        "<text:p>Run<text:s text:c='2'/>it<text:tab/>now "
+        "<text:span>with <text:a>care</text:a></text:span>.</text:p>",
+        "<table:table><table:table-row>"
+        "<table:table-cell><text:p>a</text:p><text:p>b</text:p></table:table-cell>"
+        "<table:table-cell><text:p>c</text:p></table:table-cell>"
+        "</table:table-row></table:table>",
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "doc.odt"
+        _write_odt(path, body)
+
+        parts = list(extract_odt(path, chunk_size=1000))
+
+    assert isinstance(parts[0], HeadingText) and parts[0].level == 2
+    assert parts[0] == "Install\n"
+    assert parts[1] == "Run  it\tnow with care.\na b | c\n"
+
+
+def test_docx_blocks_and_headings():
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("Overview", level=1)
+    doc.add_paragraph("First paragraph.")
+    table = doc.add_table(rows=1, cols=2)
+    table.rows[0].cells[0].text = "key"
+    table.rows[0].cells[1].text = "value"
+    doc.add_heading("Details", level=3)
+    doc.add_paragraph("Second paragraph.")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "doc.docx"
+        doc.save(path)
+
+        with open(path, "rb") as f:
+            parts = list(extract_docx(f, chunk_size=1000))
+
+    assert parts == [
+        "Overview\n",
+        "First paragraph.\nkey | value\n",
+        "Details\n",
+        "Second paragraph.\n",
+    ]
+    assert [getattr(p, "level", None) for p in parts] == [1, None, 3, None]
+
+
+def test_chunks_start_at_headings():
+    chunker = TextChunker(max_length=100)
+
+    chunks = chunker.feed("x" * 40) + chunker.feed("Title\n", boundary=True)
+    chunks += chunker.feed("short") + chunker.feed("Sub\n", boundary=True)
+    chunks += chunker.flush()
+
+    # the heading ends a chunk that is full enough, not a tiny one
+    assert chunks == ["x" * 40, "Title\nshortSub\n"]
+
+
+def test_large_odt_memory_is_bounded():
+    paragraph = "<text:p>" + "lorem ipsum dolor sit amet " * 20 + "</text:p>"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "big.odt"
+        # ~30 MB of XML
+        _write_odt(path, (paragraph for _ in range(50_000)))
+
+        tracemalloc.start()
+        total = sum(len(p) for p in extract_odt(path, chunk_size=64 * 1024))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assert total > 25_000_000
+    assert peak < 8 * 1024 * 1024
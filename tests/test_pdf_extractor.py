@@ -0,0 +1,117 @@
+import io
+import random
+import tempfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+from mnemolet.bench.corpus import _write_pdf
+from mnemolet.core.ingestion.loaders import pdf_loader
+from mnemolet.core.ingestion.loaders.pdf_loader import extract_pdf
+from mnemolet.core.ingestion.preprocessor import process_directory
+from mnemolet.core.storage.db_tracker import DBTracker
+
+# one line and a blank one per paragraph, 30 paragraphs per page
+PARAGRAPHS = [f"Paragraph {i} text" for i in range(150)]
+
+
+def _pdf(tmp_path: Path) -> Path:
+    path = tmp_path / "doc.pdf"
+    _write_pdf(path, PARAGRAPHS, random.Random(0))
+    return path
+
+
+def test_extract_pdf_pages_in_order():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _pdf(Path(tmpdir))
+
+        parts = list(extract_pdf(path, chunk_size=200, parallel_min_pages=1000))
+
+    assert [p.page for p in parts] == sorted(p.page for p in parts)
+    assert {p.page for p in parts} == {1, 2, 3, 4, 5}
+    page_2 = "".join(p for p in parts if p.page == 2)
+    assert "Paragraph 30 text" in page_2 and "Paragraph 29 text" not in page_2
+
+
+@patch("mnemolet.core.ingestion.loaders.pdf_loader.PDF_WORKERS", 2)
+def test_parallel_extraction_matches_serial():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _pdf(Path(tmpdir))
+
+        serial = list(extract_pdf(path, chunk_size=200, parallel_min_pages=1000))
+        parallel = list(
+            extract_pdf(path, chunk_size=200, pages_per_task=2, parallel_min_pages=1)
+        )
+        stream = list(
+            extract_pdf(
+                io.BytesIO(path.read_bytes()), chunk_size=200, parallel_min_pages=1
+            )
+        )
+
+    assert parallel == serial and stream == serial
+    assert [p.page for p in parallel] == [p.page for p in serial]
+
+
+class _CrashingPool:
+    """
+    Runs the first task in-process, then behaves like a pool whose worker died.
+    """
+
+    def __init__(self):
+        self.tasks = 0
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        future = Future()
+        if self.tasks == 0:
+            future.set_result(fn(*args))
+        else:
+            future.set_exception(BrokenProcessPool("worker died"))
+        self.tasks += 1
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+@patch("mnemolet.core.ingestion.loaders.pdf_loader.PDF_WORKERS", 2)
+def test_broken_pool_falls_back_and_is_replaced():
+    pool = _CrashingPool()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _pdf(Path(tmpdir))
+        serial = list(extract_pdf(path, chunk_size=200, parallel_min_pages=1000))
+
+        with patch.object(pdf_loader, "_pool", pool):
+            parts = list(
+                extract_pdf(
+                    path, chunk_size=200, pages_per_task=2, parallel_min_pages=1
+                )
+            )
+            assert pdf_loader._pool is None
+
+    assert parts == serial
+    assert [p.page for p in parts] == [p.page for p in serial]
+    assert pool.shut_down
+
+
+def test_chunks_carry_pages():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        path = _pdf(tmp_path)
+        tracker = DBTracker(tmp_path / "tracker.db")
+
+        chunks = list(
+            process_directory(
+                tmp_path, tracker, force=False, max_length=400, files=[path]
+            )
+        )
+
+    assert chunks[0]["page_start"] == 1
+    assert chunks[-1]["page_end"] == 5
+    for c in chunks:
+        # page of the first complete paragraph of the chunk
+        first = int(c["chunk"].split("Paragraph ")[1].split()[0])
+        assert c["page_start"] <= first // 30 + 1 <= c["page_end"]
+    # some chunk spans a page break
+    assert any(c["page_start"] < c["page_end"] for c in chunks)
@@ -1,4 +1,10 @@
-from mnemolet.core.ingestion.preprocessor import chunk_text
+from mnemolet.core.ingestion.extractors.base import RowGroup
+from mnemolet.core.ingestion.preprocessor import (
+    PageSpans,
+    RecordChunker,
+    TextChunker,
+    chunk_text,
+)
 
 
 def test_chunk_text():
@@ -10,3 +16,50 @@ def test_chunk_text():
     assert total_length == len(text)
 
     assert all(isinstance(c, str) for c in chunks)
+
+
+def test_chunker_continues_across_parts():
+    chunker = TextChunker(max_length=3)
+
+    chunks = chunker.feed("ab") + chunker.feed("cdefg") + chunker.feed("h")
+    chunks += chunker.flush()
+
+    assert chunks == ["abc", "def", "gh"]
+    assert chunker.flush() == []
+
+
+def test_record_chunker_keeps_records_whole():
+    chunker = RecordChunker(max_length=10)
+
+    chunks = chunker.feed("abc") + chunker.feed("def") + chunker.feed("ghijk")
+    # longer than a chunk: split
+    chunks += chunker.feed("x" * 12) + chunker.flush()
+
+    assert chunks == ["abc\ndef", "ghijk", "x" * 10, "xx"]
+
+
+def test_record_chunker_splits_row_groups_under_header():
+    rows = "\n".join(f"{i} | row {i}" for i in range(10))
+    group = RowGroup(f"id | name\n{rows}", "id | name")
+    chunker = RecordChunker(max_length=40)
+
+    chunks = chunker.feed(group) + chunker.flush()
+
+    assert len(chunks) > 1
+    assert all(c.startswith("id | name\n") and len(c) <= 40 for c in chunks)
+    assert sum(c.count(" | row ") for c in chunks) == 10
+
+
+def test_page_spans():
+    pages = PageSpans()
+    pages.add(1, 5)
+    pages.add(1, 5)
+    pages.add(2, 10)
+
+    assert pages.take(8) == (1, 1)
+    assert pages.take(8) == (1, 2)
+    assert pages.take(4) == (2, 2)
+
+    unpaged = PageSpans()
+    unpaged.add(None, 10)
+    assert unpaged.take(10) is None
@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mnemolet.core.utils import qdrant
+from mnemolet.core.utils.qdrant import QdrantManager, get_qdrant_client
+
+test_url = "http://localhost:6333"
+
+
+@pytest.fixture(autouse=True)
+def empty_client_cache(monkeypatch):
+    """
+    Start from an empty client cache and never leave mock clients in it.
+    """
+    monkeypatch.setattr(qdrant, "_CLIENTS", {})
+
+
+@patch("mnemolet.core.utils.qdrant.QdrantClient")
+def test_client_is_shared(mock_client_class):
+    client = get_qdrant_client(test_url, prefer_grpc=False)
+
+    assert get_qdrant_client(test_url, prefer_grpc=False) is client
+    assert QdrantManager(test_url, prefer_grpc=False).client is client
+    mock_client_class.assert_called_once()
+
+
+@patch("mnemolet.core.utils.qdrant.QdrantClient")
+def test_client_per_transport(mock_client_class):
+    mock_client_class.side_effect = lambda **kwargs: MagicMock()
+
+    rest = get_qdrant_client("http://localhost:7333", prefer_grpc=False)
+    grpc = get_qdrant_client("http://localhost:7333", prefer_grpc=True)
+
+    assert rest is not grpc
+    kwargs = mock_client_class.call_args.kwargs
+    assert kwargs["prefer_grpc"] is True
+
+
+@patch("mnemolet.core.utils.qdrant.QdrantClient")
+def test_local_mode_needs_explicit_path(mock_client_class):
+    get_qdrant_client("file:./qdrant", prefer_grpc=False)
+    assert mock_client_class.call_args.kwargs == {"path": "./qdrant"}
+
+    get_qdrant_client("/var/lib/qdrant", prefer_grpc=False)
+    assert mock_client_class.call_args.kwargs == {"path": "/var/lib/qdrant"}
+
+    # a url without scheme is a typo, not a directory
+    with pytest.raises(ValueError, match="Invalid Qdrant url"):
+        get_qdrant_client("localhost:6333", prefer_grpc=False)
+    assert mock_client_class.call_count == 2
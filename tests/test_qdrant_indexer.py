@@ -6,7 +6,7 @@ test_url = "http://localhost:6333"
 test_collection = "test_collection"
 
 
-@patch("mnemolet.core.indexing.qdrant_indexer.QdrantClient")
+@patch("mnemolet.core.indexing.qdrant_indexer.get_qdrant_client")
 def test_init_collection(mock_client_class):
     mock_client = MagicMock()
     mock_client_class.return_value = mock_client
@@ -21,7 +21,7 @@ def test_init_collection(mock_client_class):
     assert kwargs["vectors_config"].size == 384
 
 
-@patch("mnemolet.core.indexing.qdrant_indexer.QdrantClient")
+@patch("mnemolet.core.indexing.qdrant_indexer.get_qdrant_client")
 def test_store_embeddings(mock_client_class):
     mock_client = MagicMock()
     mock_client_class.return_value = mock_client
@@ -31,7 +31,7 @@ def test_store_embeddings(mock_client_class):
     embeddings = [[0.1, 0.2], [0.3, 0.4]]
     metadata = [
         {"path": "p1", "hash": "h1"},
-        {"path": "p2", "hash": "h2"},
+        {"path": "p2", "hash": "h2", "page_start": 3, "page_end": 4},
     ]
 
     indexer.store_embeddings(texts, embeddings, metadata)
@@ -44,3 +44,5 @@ def test_store_embeddings(mock_client_class):
     assert len(points) == 2
     assert points[0].payload["text"] == "one"
     assert points[1].payload["text"] == "two"
+    assert "page_start" not in points[0].payload
+    assert points[1].payload["page_end"] == 4
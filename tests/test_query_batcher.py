@@ -0,0 +1,61 @@
+import threading
+
+import numpy as np
+
+from mnemolet.core.embeddings.query_batcher import QueryBatcher
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array([[float(len(t))] for t in texts], dtype=np.float32)
+
+
+def test_single_query():
+    model = FakeModel()
+    batcher = QueryBatcher(model, max_batch=8, max_wait_ms=1)
+
+    vector = batcher.encode("abc")
+
+    assert vector.tolist() == [3.0]
+    assert model.calls == [["abc"]]
+
+
+def test_concurrent_queries_are_batched():
+    model = FakeModel()
+    batcher = QueryBatcher(model, max_batch=16, max_wait_ms=50)
+    queries = ["x" * i for i in range(1, 9)]
+    results = {}
+    start = threading.Barrier(len(queries))
+
+    def worker(q):
+        start.wait()
+        results[q] = batcher.encode(q)
+
+    threads = [threading.Thread(target=worker, args=(q,)) for q in queries]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # each caller gets its own vector back
+    assert all(results[q].tolist() == [float(len(q))] for q in queries)
+    assert len(model.calls) < len(queries)
+    assert sum(len(c) for c in model.calls) == len(queries)
+
+
+def test_batch_size_is_capped():
+    model = FakeModel()
+    batcher = QueryBatcher(model, max_batch=2, max_wait_ms=50)
+    threads = [
+        threading.Thread(target=batcher.encode, args=(str(i),)) for i in range(6)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(len(c) <= 2 for c in model.calls)
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from mnemolet.core.ingestion.preprocessor import process_directory
+from mnemolet.core.ingestion.scanner import Scanner, is_ignored, parse_patterns
+from mnemolet.core.storage.db_tracker import DBTracker
+
+
+def _tree(root: Path, files: dict[str, str]):
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def _scan(root: Path, **kwargs) -> list[str]:
+    return sorted(str(p.relative_to(root)) for p in Scanner(root, **kwargs))
+
+
+def test_gitignore_patterns():
+    patterns = parse_patterns(
+        ["# comment", "*.log", "!keep.log", "/build", "docs/*.tmp", "cache/", ""]
+    )
+
+    assert is_ignored(patterns, "a/b/debug.log", is_dir=False)
+    assert not is_ignored(patterns, "a/keep.log", is_dir=False)
+    assert is_ignored(patterns, "build", is_dir=True)
+    # anchored to the root
+    assert not is_ignored(patterns, "src/build", is_dir=True)
+    assert is_ignored(patterns, "docs/x.tmp", is_dir=False)
+    assert not is_ignored(patterns, "docs/sub/x.tmp", is_dir=False)
+    # directories only
+    assert is_ignored(patterns, "x/cache", is_dir=True)
+    assert not is_ignored(patterns, "x/cache", is_dir=False)
+
+
+def test_double_star_and_base():
+    patterns = parse_patterns(["**/tmp/**", "/out"], base="sub")
+
+    assert is_ignored(patterns, "sub/a/tmp/b.txt", is_dir=False)
+    assert is_ignored(patterns, "sub/out", is_dir=True)
+    # patterns of sub/.gitignore do not apply outside sub
+    assert not is_ignored(patterns, "out", is_dir=True)
+
+
+def test_scanner_rules():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _tree(
+            root,
+            {
+                "a.txt": "a",
+                "notes/b.md": "b",
+                "notes/.gitignore": "draft-*\n",
+                "notes/draft-1.md": "x",
+                ".git/config": "x",
+                "web/node_modules/lib/index.js": "x",
+                "web/app.js": "x",
+                "big.txt": "x" * 3 * 1024 * 1024,
+            },
+        )
+        old = root / "notes" / "b.md"
+        long_ago = time.time() - 30 * 86400
+        os.utime(old, (long_ago, long_ago))
+
+        assert _scan(root, workers=4) == [
+            "a.txt",
+            "big.txt",
+            "notes/.gitignore",
+            "notes/b.md",
+            "web/app.js",
+        ]
+        assert _scan(root, gitignore=False, exclude=[]) == sorted(
+            [
+                ".git/config",
+                "a.txt",
+                "big.txt",
+                "notes/.gitignore",
+                "notes/b.md",
+                "notes/draft-1.md",
+                "web/app.js",
+                "web/node_modules/lib/index.js",
+            ]
+        )
+        assert _scan(root, include=["*.md", "web/**"]) == ["notes/b.md", "web/app.js"]
+        assert _scan(root, max_file_mb=1, max_age_days=7) == [
+            "a.txt",
+            "notes/.gitignore",
+            "web/app.js",
+        ]
+
+
+def test_scanner_counts_and_single_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _tree(root, {f"d{i}/f{j}.txt": "x" for i in range(5) for j in range(4)})
+
+        scanner = Scanner(root, workers=3)
+        seen = 0
+        for _ in scanner:
+            seen += 1
+            # running total while streaming
+            assert scanner.found == seen
+        assert scanner.found == 20 and scanner.dirs == 6
+
+        assert list(Scanner(root / "d0" / "f0.txt")) == [root / "d0" / "f0.txt"]
+
+
+def test_ingest_skips_excluded_dirs():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _tree(root, {"doc.txt": "kept", "node_modules/pkg/readme.md": "dropped"})
+        tracker = DBTracker(root / ".tracker" / "tracker.db")
+
+        chunks = list(process_directory(root, tracker, force=True, max_length=3000))
+
+    assert [c["chunk"] for c in chunks] == ["kept"]
@@ -0,0 +1,117 @@
+import csv
+import json
+import tempfile
+from pathlib import Path
+
+from mnemolet.core.ingestion.extractors.csv_extractor import CsvExtractor
+from mnemolet.core.ingestion.extractors.html_extractor import HtmlExtractor
+from mnemolet.core.ingestion.extractors.json_extractor import JsonExtractor, flatten
+from mnemolet.core.ingestion.extractors.registry import get_registry
+
+
+def _write(tmpdir: str, name: str, text: str) -> Path:
+    path = Path(tmpdir) / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_registry_routes_structured_files():
+    registry = get_registry()
+
+    assert registry[".csv"] is CsvExtractor
+    assert registry[".jsonl"] is JsonExtractor
+    assert registry[".htm"] is HtmlExtractor
+
+
+def test_csv_row_groups_repeat_header():
+    rows = "\n".join(f'{i};name {i};"note; with {i}"' for i in range(100))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir, "data.csv", "id;name;note\n" + rows + "\n")
+
+        groups = list(CsvExtractor(group_chars=200).extract(path))
+
+    assert len(groups) > 1
+    assert all(g.startswith("id | name | note\n") for g in groups)
+    assert all(len(g) <= 200 for g in groups)
+    assert "9 | name 9 | note; with 9" in groups[1]
+    # every row exactly once
+    assert sum(g.count("\n") for g in groups) == 100
+
+
+def test_tsv_and_latin1():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "data.tsv"
+        path.write_bytes("city\tnote\nMünchen\tcafé\n".encode("cp1252"))
+
+        groups = list(CsvExtractor().extract(path))
+
+    assert groups == ["city | note\nMünchen | café"]
+
+
+def test_csv_large_cells_leave_global_limit_alone():
+    limit = csv.field_size_limit()
+    cell = "x" * 200_000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir, "big.csv", f"id,body\n1,{cell}\n")
+
+        groups = list(CsvExtractor(group_chars=300_000).extract(path))
+
+    assert groups == [f"id | body\n1 | {cell}"]
+    # importing or running the extractor never raises the process-wide limit
+    assert limit < len(cell)
+    assert csv.field_size_limit() == limit
+
+
+def test_flatten():
+    lines = list(flatten({"a": {"b": [1, "x"]}, "c": None, "d": True}))
+
+    assert lines == ["a.b[0]: 1", "a.b[1]: x", "d: true"]
+
+
+def test_json_records():
+    doc = {
+        "meta": {"version": 2},
+        "items": [{"id": i, "tags": ["t"]} for i in range(50)],
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        array = _write(tmpdir, "array.json", json.dumps([{"n": 1}, {"n": 2.5}]))
+        obj = _write(tmpdir, "obj.json", json.dumps(doc, indent=2))
+        ndjson = _write(tmpdir, "rows.ndjson", '{"a": 1}\n\nnot json\n{"a": 2}\n')
+
+        assert list(JsonExtractor().extract(array)) == ["n: 1", "n: 2.5"]
+        assert list(JsonExtractor().extract(ndjson)) == ["a: 1", "a: 2"]
+
+        # tiny read blocks: values and numbers span several reads
+        records = list(JsonExtractor(chunk_size=7).extract(obj))
+
+    assert records[0] == "meta.version: 2"
+    assert records[1:3] == [
+        "items.id: 0\nitems.tags[0]: t",
+        "items.id: 1\nitems.tags[0]: t",
+    ]
+    assert len(records) == 51
+
+
+def test_html_visible_text():
+    html = (
+        "<html><head><title>Guide</title><style>p {color: red}</style>"
+        "<script>var x = '<p>no</p>';</script></head><body>"
+        "<h1>Install</h1><p>Run &amp; enjoy<p>Second   paragraph"
+        "<ul><li>one<li>two</ul></body></html>"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir, "page.html", html * 3)
+
+        text = "".join(HtmlExtractor(chunk_size=16).extract(path))
+
+    assert text.count("Guide\nInstall\nRun & enjoy\nSecond paragraph\none\ntwo") == 3
+    assert "color" not in text and "var x" not in text and "<" not in text
+
+    # </head> is optional: <body> closes the head
+    html = "<html><head><title>T</title><body><p>Hello world</p></body></html>"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir, "page.html", html)
+
+        text = "".join(HtmlExtractor().extract(path))
+
+    assert text == "T\nHello world"
@@ -0,0 +1,94 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mnemolet.core.ingestion.extractors.text_extractor import (
+    SAMPLE_GAP,
+    TextExtractor,
+    detect_encoding,
+    is_binary,
+)
+
+
+def _extract(path: Path, **kwargs) -> str:
+    return "".join(TextExtractor(**kwargs).extract(path))
+
+
+def test_detect_encoding():
+    assert detect_encoding("héllo".encode("utf-8")) == "utf-8"
+    # a character cut at the end of the sample is still UTF-8
+    assert detect_encoding("hé".encode("utf-8")[:-1]) == "utf-8"
+    assert detect_encoding("héllo".encode("latin-1"), "cp1252") == "cp1252"
+
+
+def test_is_binary():
+    assert not is_binary(b"plain text\n\twith tabs\r\n")
+    assert is_binary(b"PK\x03\x04\x00\x00")
+    assert is_binary(bytes(range(1, 32)) * 10)
+
+
+def test_extract_encodings():
+    text = "naïve café " * 1000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cases = {
+            "latin.txt": text.encode("cp1252"),
+            "utf8.txt": text.encode("utf-8"),
+            "bom.txt": text.encode("utf-8-sig"),
+            "utf16.txt": text.encode("utf-16"),
+        }
+        for name, data in cases.items():
+            path = Path(tmpdir) / name
+            path.write_bytes(data)
+            # small blocks split multibyte characters between reads
+            assert _extract(path, chunk_size=7) == text, name
+
+
+def test_extract_skips_binary_and_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        binary = Path(tmpdir) / "blob.log"
+        binary.write_bytes(b"\x00\x01\x02" * 1000)
+        empty = Path(tmpdir) / "empty.txt"
+        empty.touch()
+
+        assert _extract(binary) == ""
+        assert _extract(empty) == ""
+
+
+def test_extract_with_mmap():
+    text = "é line\n" * 100_000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "big.txt"
+        path.write_text(text, encoding="utf-8")
+
+        assert _extract(path, chunk_size=4096, mmap_min_mb=0.1) == text
+
+
+def test_oversize_policies():
+    # 2 byte characters, so the tail starts inside one unless aligned
+    text = "a" + "é" * 600_000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "huge.txt"
+        path.write_text(text, encoding="utf-8")
+        limits = {"max_file_mb": 1, "sample_mb": 0.5}
+
+        assert _extract(path, oversize="skip", **limits) == ""
+
+        head = _extract(path, oversize="head", **limits)
+        assert text.startswith(head)
+        assert len(head.encode("utf-8")) <= 512 * 1024
+
+        sampled = _extract(path, oversize="head_tail", chunk_size=1000, **limits)
+        first, last = sampled.split(SAMPLE_GAP)
+        assert text.startswith(first) and text.endswith(last)
+        assert "�" not in sampled
+
+        # no limit: streamed in full whatever the policy
+        assert _extract(path, max_file_mb=0, oversize="skip") == text
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        TextExtractor(oversize="truncate")
+    with pytest.raises(LookupError):
+        TextExtractor(fallback_encoding="no-such-codec")
@@ -0,0 +1,98 @@
+import json
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from mnemolet.core.utils import tracing
+from mnemolet.core.utils.tracing import current_trace_id, span, start_trace
+
+
+def test_span_without_trace_is_noop():
+    with span("nothing", a=1) as attrs:
+        attrs["b"] = 2
+
+    assert current_trace_id() is None
+
+
+def test_spans_are_nested_and_exported():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trace_file = Path(tmpdir) / "traces.jsonl"
+
+        with (
+            patch.object(tracing, "TRACE_ENABLED", True),
+            patch.object(tracing, "TRACE_MIN_MS", 0),
+            patch.object(tracing, "TRACE_FILE", trace_file),
+        ):
+            with start_trace("req-1", name="test"):
+                assert current_trace_id() == "req-1"
+                with span("outer"):
+                    with span("inner", k=3) as attrs:
+                        attrs["found"] = 1
+            tracing.flush_traces()
+
+        lines = trace_file.read_text().splitlines()
+        assert len(lines) == 1
+        trace = json.loads(lines[0])
+        spans = {s["name"]: s for s in trace["spans"]}
+        assert trace["trace_id"] == "req-1"
+        assert spans["inner"]["parent_id"] == spans["outer"]["span_id"]
+        assert spans["outer"]["parent_id"] is None
+        assert spans["inner"]["attributes"] == {"k": 3, "found": 1}
+
+
+def test_failed_span_is_marked():
+    trace = tracing.Trace("req-2")
+    token = tracing._current_trace.set(trace)
+    try:
+        try:
+            with patch.object(tracing, "TRACE_ENABLED", True), span("boom"):
+                raise ValueError("bad")
+        except ValueError:
+            pass
+    finally:
+        tracing._current_trace.reset(token)
+
+    assert trace.spans[0].status == "error"
+    assert "bad" in trace.spans[0].attributes["error"]
+
+
+def test_trace_file_is_written_in_background_and_rotated():
+    threads = []
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trace_file = Path(tmpdir) / "traces.jsonl"
+        writer = tracing.TraceWriter(trace_file, max_mb=300 / 1024**2, backups=2)
+        write = writer._write
+
+        def recording_write(line):
+            threads.append(threading.current_thread().name)
+            write(line)
+
+        writer._write = recording_write
+        for i in range(10):
+            writer.submit({"trace_id": f"req-{i}", "pad": "x" * 100})
+        writer.flush()
+
+        files = sorted(p.name for p in Path(tmpdir).iterdir())
+        sizes = [p.stat().st_size for p in Path(tmpdir).iterdir()]
+        last = json.loads(trace_file.read_text().splitlines()[-1])
+
+    assert set(threads) == {"trace-writer"}
+    assert files == ["traces.jsonl", "traces.jsonl.1", "traces.jsonl.2"]
+    assert max(sizes) <= 300
+    assert last["trace_id"] == "req-9"
+
+
+def test_tracing_is_off_by_default():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trace_file = Path(tmpdir) / "traces.jsonl"
+
+        with patch.object(tracing, "TRACE_FILE", trace_file):
+            with start_trace("req-3") as trace:
+                with span("outer"):
+                    pass
+            tracing.flush_traces()
+
+        assert trace.spans == []
+        assert not trace_file.exists()